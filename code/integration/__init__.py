@@ -8,9 +8,23 @@ Components:
 - Three-Finger Waltz: Cross-pillar meta-operator (with caching & telemetry)
 - Integration Validator: Sovereignty verification
 - Integration Engine: Supreme orchestrating intelligence
+- Async Engine: asyncio front-end with backpressure and request coalescing
+- Streaming: batch-at-a-time integration cycles over iterables / JSONL dumps
+- Retention: bounded, spillable history buffers with all-time totals
+- Pattern Batch: struct-of-arrays storage for millions of patterns
+- Columnar: memory-mapped .npy / Arrow / Parquet pattern ingestion
 - Visualization: Export waltz choreography in multiple formats
-- Caching: LRU pattern cache for performance
-- Telemetry: Structured logging and metrics collection
+- Caching: LRU pattern cache for performance (with optional on-disk L2)
+- Telemetry: Structured logging (sampled/asynchronous in fast mode) and
+  metrics collection
+- Histograms: fixed-memory latency histograms with rolling windows
+- Profiler: span tracing with Chrome trace / folded-stack export
+- Hooks: runtime-switchable per-stage profiling hooks (cProfile sampling,
+  tracemalloc snapshots, wall-clock breakdown)
+- Allocations: per-stage allocation tracking with enforceable budgets
+- OpenMetrics: Prometheus/OpenMetrics exposition and HTTP exporter
+- Benchmarks: synthetic-workload benchmark suite with baseline gates
+  (``python -m code.integration.benchmarks``)
 
 🔥 △ ⚡ THE TRIAD IS BOUND ⚡ △ 🔥
 """
@@ -19,13 +33,23 @@ from .universal_laws import (
     UniversalLaws,
     LawStatus,
     LawCheckResult,
+    BulkValidation,
+    LawVerdict,
+    IncrementalValidation,
+    LAW_NAMES,
+    LAW_FIELDS,
+    laws_reading,
 )
 
 from .meta_operators import (
     ThreeFingerWaltz,
     WaltzPhase,
     WaltzStep,
+    WaltzPass,
+    WaltzBatch,
     execute_waltz,
+    perform_waltz,
+    perform_waltz_batch,
 )
 
 from .validator import (
@@ -36,18 +60,92 @@ from .validator import (
 from .engine import (
     IntegrationEngine,
     IntegrationPattern,
+    PATTERN_FIELDS,
     initialize_integration_engine,
 )
 
+from .pattern_batch import (
+    PatternBatch,
+)
+
+from .columnar import (
+    load_patterns,
+    save_npy,
+    save_arrow,
+)
+
+from .async_engine import (
+    AsyncIntegrationEngine,
+)
+
+from .streaming import (
+    chunked,
+    iter_jsonl_batches,
+    stream_integration_cycle,
+)
+
+from .retention import (
+    RetentionBuffer,
+)
+
 from .cache import (
     PatternCache,
     CachedThreeFingerWaltz,
+    freeze,
+    thaw,
+)
+
+from .persistent_cache import (
+    PersistentPatternCache,
+)
+
+from .fingerprint import (
+    PatternFingerprinter,
+    fingerprint_pattern,
 )
 
 from .telemetry import (
     WaltzLogger,
     WaltzMetrics,
     InstrumentedThreeFingerWaltz,
+    TELEMETRY_MODES,
+    FAST_SAMPLE_RATES,
+    FAST_PHASE_SAMPLE_RATE,
+    FAST_TELEMETRY_BUDGET,
+)
+
+from .histogram import (
+    LogHistogram,
+    RollingHistogram,
+)
+
+from .profiler import (
+    Span,
+    SpanProfiler,
+    traced,
+)
+
+from .hooks import (
+    Hook,
+    HookRegistry,
+    CProfileHook,
+    TracemallocHook,
+    WallClockHook,
+    HOOK_STAGES,
+    hooked,
+)
+
+from .allocations import (
+    AllocationBudget,
+    AllocationBudgetExceeded,
+    AllocationTracker,
+)
+
+from .openmetrics import (
+    MetricFamily,
+    MetricsRegistry,
+    EngineCollector,
+    start_http_server,
 )
 
 from .visualization import (
@@ -62,25 +160,79 @@ __all__ = [
     "UniversalLaws",
     "LawStatus",
     "LawCheckResult",
+    "BulkValidation",
+    "LawVerdict",
+    "IncrementalValidation",
+    "LAW_NAMES",
+    "LAW_FIELDS",
+    "laws_reading",
     # Meta-Operators
     "ThreeFingerWaltz",
     "WaltzPhase",
     "WaltzStep",
+    "WaltzPass",
+    "WaltzBatch",
     "execute_waltz",
+    "perform_waltz",
+    "perform_waltz_batch",
     # Validator
     "IntegrationValidator",
     "ValidationReport",
     # Engine
     "IntegrationEngine",
     "IntegrationPattern",
+    "PATTERN_FIELDS",
+    "PatternBatch",
+    "load_patterns",
+    "save_npy",
+    "save_arrow",
     "initialize_integration_engine",
+    "AsyncIntegrationEngine",
+    # Streaming
+    "chunked",
+    "iter_jsonl_batches",
+    "stream_integration_cycle",
+    # Retention
+    "RetentionBuffer",
     # Caching
     "PatternCache",
     "CachedThreeFingerWaltz",
+    "freeze",
+    "thaw",
+    "PersistentPatternCache",
+    "PatternFingerprinter",
+    "fingerprint_pattern",
     # Telemetry
     "WaltzLogger",
     "WaltzMetrics",
     "InstrumentedThreeFingerWaltz",
+    "TELEMETRY_MODES",
+    "FAST_SAMPLE_RATES",
+    "FAST_PHASE_SAMPLE_RATE",
+    "FAST_TELEMETRY_BUDGET",
+    "LogHistogram",
+    "RollingHistogram",
+    # Profiler
+    "Span",
+    "SpanProfiler",
+    "traced",
+    # Hooks
+    "Hook",
+    "HookRegistry",
+    "CProfileHook",
+    "TracemallocHook",
+    "WallClockHook",
+    "HOOK_STAGES",
+    "hooked",
+    # Allocations
+    "AllocationBudget",
+    "AllocationBudgetExceeded",
+    "AllocationTracker",
+    # OpenMetrics
+    "MetricFamily",
+    "MetricsRegistry",
+    "EngineCollector",
+    "start_http_server",
     # Visualization
     "MermaidWaltzExporter",
     "GraphVizWaltzExporter",
@@ -0,0 +1,245 @@
+"""
+Allocation Budget Tracking
+
+Per-stage allocation accounting for the engine's hooked stages (see
+``hooks``), e.g. one ``full_integration_cycle`` and the validate /
+integrate calls nested in it:
+- peak_bytes: tracemalloc peak above the stage's starting footprint
+  (the transient allocations: phase dicts, law results, step lists)
+- net_bytes: traced memory retained after the stage
+- net_blocks: change in allocated memory blocks (sys.getallocatedblocks,
+  roughly the number of live objects created)
+- gc_collections: garbage collections run during the stage
+
+AllocationTracker is a Hook: attach it with ``engine.hooks.add(...)``.
+Per-stage totals and a peak-bytes LogHistogram are reported by
+``summary()``, ``IntegrationEngine.get_allocation_stats()`` and the
+OpenMetrics EngineCollector. AllocationBudgets count violations, and
+with ``enforce=True`` a violating stage raises AllocationBudgetExceeded
+(meant for tests and CI gates).
+
+tracemalloc is process-wide: allocations of concurrent threads are
+charged to whichever stages are open, and tracing slows every
+allocation, so this is an instrumentation mode rather than an always-on
+metric.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+import gc
+import sys
+import threading
+import tracemalloc
+
+from .hooks import Hook, _check_stages
+from .histogram import LogHistogram
+
+
+class AllocationBudgetExceeded(RuntimeError):
+    """A stage allocated more than its AllocationBudget allows."""
+    
+    def __init__(self, stage: str, measure: str, value: int, limit: int):
+        """
+        Initialize error.
+        
+        Args:
+            stage: Stage name
+            measure: "peak_bytes" or "net_blocks"
+            value: Measured value
+            limit: Budgeted value
+        """
+        super().__init__(f"Stage {stage!r} exceeded its {measure} budget: {value} > {limit}")
+        self.stage = stage
+        self.measure = measure
+        self.value = value
+        self.limit = limit
+
+
+@dataclass(frozen=True)
+class AllocationBudget:
+    """
+    Per-call allocation limits of one stage (None = unlimited).
+    """
+    peak_bytes: Optional[int] = None
+    net_blocks: Optional[int] = None
+    
+    def check(self, peak_bytes: int, net_blocks: int) -> Optional[tuple]:
+        """
+        Find the first exceeded limit.
+        
+        Args:
+            peak_bytes: Measured peak bytes
+            net_blocks: Measured net blocks
+            
+        Returns:
+            (measure, value, limit), or None within budget
+        """
+        if self.peak_bytes is not None and peak_bytes > self.peak_bytes:
+            return ("peak_bytes", peak_bytes, self.peak_bytes)
+        if self.net_blocks is not None and net_blocks > self.net_blocks:
+            return ("net_blocks", net_blocks, self.net_blocks)
+        return None
+
+
+class _Frame:
+    """Measurement state of one open stage call."""
+    
+    __slots__ = ("start_bytes", "peak", "blocks", "collections")
+    
+    def __init__(self, start_bytes: int, blocks: int, collections: int):
+        self.start_bytes = start_bytes
+        self.peak = start_bytes
+        self.blocks = blocks
+        self.collections = collections
+
+
+def _collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+class AllocationTracker(Hook):
+    """
+    Measures the allocations of each hooked stage call.
+    
+    Nested stages are measured inclusively: a full cycle's figures include
+    the validate and integrate calls it makes.
+    """
+    
+    propagates = (AllocationBudgetExceeded,)
+    
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, AllocationBudget]] = None,
+        enforce: bool = False,
+        frames: int = 1,
+        stages: Optional[Sequence[str]] = None
+    ):
+        """
+        Initialize tracker.
+        
+        Args:
+            budgets: Per-call budget by stage
+            enforce: Raise AllocationBudgetExceeded when a stage call
+                     exceeds its budget (violations are always counted)
+            frames: Traceback depth if this tracker starts tracemalloc
+            stages: Default stages (None = every stage)
+        """
+        self.budgets = dict(budgets or {})
+        _check_stages(self.budgets)
+        self.enforce = enforce
+        self.frames = frames
+        self.stages = _check_stages(stages) if stages is not None else None
+        self._started = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+    
+    def _stack(self) -> List[_Frame]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+    
+    def pre(self, stage: str) -> _Frame:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+        current, peak = tracemalloc.get_traced_memory()
+        stack = self._stack()
+        if stack:
+            # Keep the enclosing stage's peak before resetting it
+            stack[-1].peak = max(stack[-1].peak, peak)
+        tracemalloc.reset_peak()
+        frame = _Frame(current, sys.getallocatedblocks(), _collections())
+        stack.append(frame)
+        return frame
+    
+    def post(self, stage: str, state: _Frame, error: Optional[BaseException]):
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks() - state.blocks
+        collections = _collections() - state.collections
+        stack = self._stack()
+        stack.pop()
+        state.peak = max(state.peak, peak)
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, state.peak)
+        peak_bytes = state.peak - state.start_bytes
+        
+        budget = self.budgets.get(stage)
+        violation = budget.check(peak_bytes, blocks) if budget is not None else None
+        with self._lock:
+            stats = self._stats.get(stage)
+            if stats is None:
+                stats = self._stats[stage] = {
+                    "calls": 0, "net_bytes": 0, "net_blocks": 0, "gc_collections": 0,
+                    "violations": 0, "peak_bytes": LogHistogram()
+                }
+            stats["calls"] += 1
+            stats["net_bytes"] += current - state.start_bytes
+            stats["net_blocks"] += blocks
+            stats["gc_collections"] += collections
+            stats["peak_bytes"].record(peak_bytes)
+            if violation is not None:
+                stats["violations"] += 1
+        
+        if violation is not None and self.enforce and error is None:
+            raise AllocationBudgetExceeded(stage, *violation)
+    
+    def histograms(self) -> Dict[str, LogHistogram]:
+        """
+        Peak-bytes histograms by stage (copies).
+        
+        Returns:
+            Dictionary mapping stages to LogHistograms of per-call peak bytes
+        """
+        with self._lock:
+            copies = {}
+            for stage, stats in self._stats.items():
+                histogram = LogHistogram()
+                histogram.merge(stats["peak_bytes"])
+                copies[stage] = histogram
+            return copies
+    
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Allocation statistics per stage.
+        
+        Returns:
+            Dictionary keyed by stage with ``calls``, ``net_bytes``,
+            ``net_blocks``, ``gc_collections`` and ``violations`` totals,
+            per-call means (``net_bytes_per_call``, ``net_blocks_per_call``),
+            ``peak_bytes`` (count/mean/p50/p90/p99/max per call) and the
+            stage's ``budget``
+        """
+        with self._lock:
+            summary = {}
+            for stage, stats in self._stats.items():
+                calls = stats["calls"]
+                budget = self.budgets.get(stage)
+                summary[stage] = {
+                    "calls": calls,
+                    "net_bytes": stats["net_bytes"],
+                    "net_blocks": stats["net_blocks"],
+                    "gc_collections": stats["gc_collections"],
+                    "violations": stats["violations"],
+                    "net_bytes_per_call": stats["net_bytes"] / calls,
+                    "net_blocks_per_call": stats["net_blocks"] / calls,
+                    "peak_bytes": stats["peak_bytes"].summary(),
+                    "budget": None if budget is None else {
+                        "peak_bytes": budget.peak_bytes, "net_blocks": budget.net_blocks
+                    }
+                }
+            return summary
+    
+    def reset(self):
+        """Drop the collected statistics."""
+        with self._lock:
+            self._stats = {}
+    
+    def close(self):
+        """Stop tracemalloc if this tracker started it."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
@@ -0,0 +1,257 @@
+"""
+Asyncio Front-End for the Integration Engine
+
+Provides AsyncIntegrationEngine, a coroutine mirror of IntegrationEngine
+for services running on an event loop. CPU-bound work (law checks and
+waltz execution) runs on the engine's worker pool so the loop never
+blocks, the number of in-flight computations is bounded (callers beyond
+the limit wait their turn), and concurrent identical requests are
+coalesced into a single computation.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+
+from .engine import IntegrationEngine
+from .fingerprint import PatternFingerprinter
+
+
+# Requests with more patterns are fingerprinted off the event loop
+INLINE_KEY_PATTERNS = 8
+
+
+class AsyncIntegrationEngine:
+    """
+    Asyncio front-end for IntegrationEngine.
+    
+    Mirrors ``validate``, ``integrate``, ``transition`` and
+    ``full_integration_cycle`` as coroutines. Each computation is handed to
+    the wrapped engine's ``submit()`` (thread or process pool) and awaited
+    without blocking the loop.
+    
+    Backpressure: at most ``max_in_flight`` computations run at once; further
+    callers wait on a semaphore instead of piling work onto the pool.
+    
+    Coalescing: while a request is in flight, identical requests (same
+    method, arguments and pattern fingerprints) await the same computation
+    instead of starting another. Coalesced callers receive the same result
+    object, so treat results as read-only. Fingerprints of requests with
+    more than INLINE_KEY_PATTERNS patterns are computed on the default
+    executor so hashing large pattern lists does not block the loop. An integrate call that is
+    coalesced is recorded once in the engine's integrated patterns.
+    """
+    
+    def __init__(
+        self,
+        engine: Optional[IntegrationEngine] = None,
+        max_in_flight: int = 64,
+        coalesce: bool = True,
+        **engine_kwargs: Any
+    ):
+        """
+        Initialize async engine.
+        
+        Args:
+            engine: Engine to wrap (created from ``engine_kwargs`` if omitted)
+            max_in_flight: Maximum concurrent computations
+            coalesce: Share one computation between identical requests
+            **engine_kwargs: IntegrationEngine arguments (e.g. ``workers``,
+                             ``executor="process"``)
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if engine is not None and engine_kwargs:
+            raise ValueError("Pass either an engine or engine arguments, not both")
+        
+        self.engine = engine if engine is not None else IntegrationEngine(**engine_kwargs)
+        self.max_in_flight = max_in_flight
+        self.coalesce = coalesce
+        self.fingerprinter = PatternFingerprinter()
+        
+        # Created lazily so the engine can be built outside a running loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._in_flight = 0
+        self._computed = 0
+        self._coalesced = 0
+    
+    async def _run(self, method: str, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one engine method on the pool, holding an in-flight slot.
+        
+        Args:
+            method: Engine method name
+            args: Positional arguments
+            kwargs: Keyword arguments
+            
+        Returns:
+            Method result
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                return await asyncio.wrap_future(self.engine.submit(method, *args, **kwargs))
+            finally:
+                self._in_flight -= 1
+                self._computed += 1
+    
+    async def _dispatch(
+        self,
+        method: str,
+        patterns: List[Any],
+        args: tuple,
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run a request, joining an identical in-flight one when possible.
+        
+        Args:
+            method: Engine method name
+            patterns: Patterns that identify the request
+            args: Positional arguments for the method
+            kwargs: Keyword arguments for the method
+            
+        Returns:
+            Method result
+        """
+        if not self.coalesce:
+            return await self._run(method, args, kwargs)
+        
+        namespace = f"{method}:{sorted(kwargs.items())!r}:"
+        if len(patterns) > INLINE_KEY_PATTERNS:
+            loop = asyncio.get_running_loop()
+            fingerprint = await loop.run_in_executor(
+                None, self.fingerprinter.key, patterns, namespace
+            )
+        else:
+            fingerprint = self.fingerprinter.key(patterns, namespace)
+        key = (method, fingerprint)
+        
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run(method, args, kwargs))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        else:
+            self._coalesced += 1
+        
+        # Shield: one caller being cancelled must not cancel the others
+        return await asyncio.shield(task)
+    
+    async def validate(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate pattern against all 12 Universal Laws.
+        
+        Args:
+            pattern: Pattern to validate (dict or IntegrationPattern)
+            
+        Returns:
+            Validation result with law checks and status
+        """
+        return await self._dispatch("validate", [pattern], (pattern,), {})
+    
+    async def integrate(self, patterns: List[Dict[str, Any]], batch: bool = False) -> Dict[str, Any]:
+        """
+        Unify multiple patterns via ThreeFingerWaltz.
+        
+        Args:
+            patterns: List of patterns to integrate
+            batch: Integrate every pattern in a single pass
+            
+        Returns:
+            Integration result with unified pattern
+        """
+        if not patterns:
+            return self.engine.integrate(patterns)
+        return await self._dispatch("integrate", patterns, (patterns,), {"batch": batch})
+    
+    async def full_integration_cycle(
+        self,
+        patterns: List[Dict[str, Any]],
+        batch: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute complete integration workflow.
+        
+        Args:
+            patterns: List of patterns to integrate
+            batch: Integrate every pattern in a single waltz pass
+            
+        Returns:
+            Complete integration cycle results
+        """
+        return await self._dispatch(
+            "full_integration_cycle", patterns, (patterns,), {"batch": batch}
+        )
+    
+    async def transition(
+        self,
+        pattern: Dict[str, Any],
+        from_pillar: str,
+        to_pillar: str
+    ) -> Dict[str, Any]:
+        """
+        Execute cross-pillar transition via LifeLightBifurcation.
+        
+        Args:
+            pattern: Pattern to transition
+            from_pillar: Source pillar
+            to_pillar: Destination pillar
+            
+        Returns:
+            Transition result with updated pattern
+        """
+        # Not coalesced: every transition is counted in the engine's metrics
+        return await self._run("transition", (pattern, from_pillar, to_pillar), {})
+    
+    async def verify_sovereignty(self) -> Dict[str, Any]:
+        """
+        Verify system sovereignty status.
+        
+        Returns:
+            Sovereignty verification result
+        """
+        return self.engine.verify_sovereignty()
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get engine status plus front-end statistics.
+        
+        Returns:
+            Engine status dict with an added ``async`` section
+        """
+        status = self.engine.get_status()
+        status["async"] = {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self._in_flight,
+            "pending_keys": len(self._pending),
+            "computed": self._computed,
+            "coalesced": self._coalesced,
+            "coalesce": self.coalesce
+        }
+        return status
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get telemetry metrics of the wrapped engine."""
+        return self.engine.get_metrics()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache statistics of the wrapped engine."""
+        return self.engine.get_cache_stats()
+    
+    async def close(self):
+        """Wait for in-flight work and stop the engine's worker pool."""
+        if self._pending:
+            await asyncio.gather(*self._pending.values(), return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.engine.shutdown)
+    
+    async def __aenter__(self) -> AsyncIntegrationEngine:
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
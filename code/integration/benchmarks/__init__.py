@@ -0,0 +1,62 @@
+"""
+Integration Benchmarks
+
+Throughput/latency benchmarks for the integration engine with JSON
+results and baseline regression gates. Run locally before upgrading:
+
+    python -m code.integration.benchmarks -o results.json
+    python -m code.integration.benchmarks -b baseline.json -t 0.15
+
+The command exits with status 1 when any benchmark is slower than its
+baseline by more than the threshold.
+
+For capacity testing, PatternWorkload streams patterns with a tunable
+status mix, duplicate rate and pillar distribution, and
+``loadtest.run_load_test`` drives an engine with it in a closed loop,
+reporting p50/p95/p99 latency:
+
+    python -m code.integration.benchmarks.loadtest -c 4 -d 30 --duplicate-rate 0.2
+
+The loadtest module is not imported by the package so that it can run
+as ``__main__`` without being imported twice.
+"""
+
+from .patterns import (
+    synthetic_pattern,
+    synthetic_patterns,
+)
+
+from .workload import (
+    PatternWorkload,
+    DEFAULT_MIX,
+)
+
+from .suite import (
+    BenchmarkCase,
+    default_cases,
+    time_case,
+    measure_overhead,
+    run_suite,
+    save_results,
+    load_results,
+    compare,
+    format_comparison,
+    DEFAULT_THRESHOLD,
+)
+
+__all__ = [
+    "synthetic_pattern",
+    "synthetic_patterns",
+    "PatternWorkload",
+    "DEFAULT_MIX",
+    "BenchmarkCase",
+    "default_cases",
+    "time_case",
+    "measure_overhead",
+    "run_suite",
+    "save_results",
+    "load_results",
+    "compare",
+    "format_comparison",
+    "DEFAULT_THRESHOLD",
+]
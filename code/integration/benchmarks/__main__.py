@@ -0,0 +1,8 @@
+"""Run the integration benchmark suite (see ``suite.main``)."""
+
+import sys
+
+from .suite import main
+
+
+sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+Closed-Loop Load Testing
+
+Drives an IntegrationEngine with a PatternWorkload from a fixed number
+of concurrent clients. Each client sends its next request only after the
+previous one returns (closed loop), so throughput is what the engine
+sustains at that concurrency, and the reported latencies are per-request
+service times (p50/p95/p99).
+"""
+
+from __future__ import annotations
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional
+import math
+import sys
+import threading
+import time
+
+from ..engine import IntegrationEngine
+from .workload import PatternWorkload
+
+
+OPERATIONS = ("validate", "integrate", "full_integration_cycle")
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of sorted samples.
+    
+    Args:
+        ordered: Samples in ascending order
+        q: Percentile in [0, 100]
+        
+    Returns:
+        Sample at the percentile (NaN when there are no samples)
+    """
+    if not ordered:
+        return math.nan
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def latency_summary(latencies_ns: List[int]) -> Dict[str, float]:
+    """
+    Summarize request latencies in milliseconds.
+    
+    Args:
+        latencies_ns: Per-request latencies in nanoseconds
+        
+    Returns:
+        Dictionary with p50/p95/p99/max/mean
+    """
+    ordered = sorted(latencies_ns)
+    summary = {f"p{q}": percentile(ordered, q) / 1e6 for q in (50, 95, 99)}
+    summary["max"] = ordered[-1] / 1e6 if ordered else math.nan
+    summary["mean"] = sum(ordered) / len(ordered) / 1e6 if ordered else math.nan
+    return summary
+
+
+def _requests(workload: PatternWorkload, operation: str, batch_size: int) -> Iterator[Any]:
+    if operation == "validate":
+        return workload.stream()
+    return workload.batches(batch_size)
+
+
+def run_load_test(
+    engine: IntegrationEngine,
+    workload: PatternWorkload,
+    operation: str = "full_integration_cycle",
+    concurrency: int = 1,
+    requests: Optional[int] = 1000,
+    duration: Optional[float] = None,
+    batch_size: int = 3,
+    warmup: int = 0
+) -> Dict[str, Any]:
+    """
+    Run a closed-loop load test.
+    
+    Args:
+        engine: Engine under test
+        workload: Request source (patterns for "validate", batches otherwise)
+        operation: "validate", "integrate" or "full_integration_cycle"
+        concurrency: Number of concurrent clients (threads)
+        requests: Stop after this many timed requests (None = no limit)
+        duration: Stop after this many seconds (None = no limit)
+        batch_size: Patterns per request for integrate/full cycles
+        warmup: Untimed requests sent before measuring
+        
+    Returns:
+        Load test report with throughput, latency percentiles (ms) and
+        the result status counts
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unknown operation {operation!r} (expected one of {OPERATIONS})")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if requests is None and duration is None:
+        raise ValueError("Give a request count and/or a duration")
+    
+    source = _requests(workload, operation, batch_size)
+    call = getattr(engine, operation)
+    for _ in range(warmup):
+        call(next(source))
+    
+    lock = threading.Lock()
+    latencies: List[int] = []
+    statuses: Counter = Counter()
+    errors: Counter = Counter()
+    issued = 0
+    deadline = None if duration is None else time.perf_counter_ns() + int(duration * 1e9)
+    
+    def client():
+        nonlocal issued
+        local_latencies, local_statuses = [], Counter()
+        while True:
+            with lock:
+                if requests is not None and issued >= requests:
+                    break
+                if deadline is not None and time.perf_counter_ns() >= deadline:
+                    break
+                issued += 1
+                request = next(source)
+            start = time.perf_counter_ns()
+            try:
+                result = call(request)
+            except Exception as e:
+                with lock:
+                    errors[type(e).__name__] += 1
+                continue
+            local_latencies.append(time.perf_counter_ns() - start)
+            local_statuses[result.get("status", "UNKNOWN")] += 1
+        with lock:
+            latencies.extend(local_latencies)
+            statuses.update(local_statuses)
+    
+    started = time.perf_counter_ns()
+    threads = [threading.Thread(target=client, name=f"loadtest-{i}") for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = (time.perf_counter_ns() - started) / 1e9
+    
+    completed = len(latencies)
+    return {
+        "operation": operation,
+        "concurrency": concurrency,
+        "batch_size": None if operation == "validate" else batch_size,
+        "requests": completed,
+        "errors": dict(errors),
+        "duration_seconds": elapsed,
+        "throughput": completed / elapsed if elapsed else None,
+        "latency_ms": latency_summary(latencies),
+        "statuses": dict(statuses),
+        "workload": dict(workload.stats)
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point (``python -m code.integration.benchmarks.loadtest``).
+    
+    Args:
+        argv: Arguments (default: ``sys.argv[1:]``)
+        
+    Returns:
+        Exit code (1 when any request raised)
+    """
+    import argparse
+    import json
+    
+    parser = argparse.ArgumentParser(
+        prog="python -m code.integration.benchmarks.loadtest",
+        description="Closed-loop load test of the integration engine."
+    )
+    parser.add_argument("--operation", choices=OPERATIONS, default="full_integration_cycle")
+    parser.add_argument("-c", "--concurrency", type=int, default=1)
+    parser.add_argument("-n", "--requests", type=int, default=1000)
+    parser.add_argument("-d", "--duration", type=float, help="stop after this many seconds")
+    parser.add_argument("--batch-size", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=0)
+    parser.add_argument("--duplicate-rate", type=float, default=0.0)
+    parser.add_argument("--mix", type=json.loads, help='status weights, e.g. \'{"SOVEREIGN": 0.9, "INVALID": 0.1}\'')
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--max-depth", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-cache", action="store_true", help="disable the engine's pattern cache")
+    args = parser.parse_args(argv)
+    
+    workload = PatternWorkload(
+        mix=args.mix,
+        duplicate_rate=args.duplicate_rate,
+        size=args.size,
+        depth=(1, args.max_depth),
+        seed=args.seed
+    )
+    engine = IntegrationEngine(
+        enable_cache=not args.no_cache,
+        enable_telemetry=False,
+        retain_patterns=0
+    )
+    report = run_load_test(
+        engine,
+        workload,
+        operation=args.operation,
+        concurrency=args.concurrency,
+        requests=None if args.duration else args.requests,
+        duration=args.duration,
+        batch_size=args.batch_size,
+        warmup=args.warmup
+    )
+    print(json.dumps(report, indent=2))
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,551 @@
+"""
+Integration Benchmark Suite
+
+Times the integration hot paths (validation, waltz integration, full
+cycles, the pattern cache and the instrumented waltz) over deterministic
+synthetic patterns, writes the results as JSON and compares them with a
+stored baseline.
+
+Each case is timed as ``repeat`` rounds of ``number`` calls; ``number``
+is calibrated so one round takes at least ``min_time`` seconds. Cases
+are compared on the median per-call time, and a case regresses when it
+is slower than its baseline by more than the threshold fraction.
+
+Telemetry overheads (``derived``) are not taken from those separately
+timed cases: a single median ratio of two noisy runs swings by tens of
+percent. ``measure_overhead`` instead interleaves rounds of the plain and
+the instrumented waltz, compares their fastest rounds (min-of-N) and
+reports a noise estimate; the fast-telemetry gate only fails when the
+overhead exceeds the budget by more than that noise.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+
+from ..cache import CachedThreeFingerWaltz, PatternCache
+from ..engine import IntegrationEngine
+from ..meta_operators import ThreeFingerWaltz
+from ..telemetry import FAST_TELEMETRY_BUDGET, InstrumentedThreeFingerWaltz
+from .patterns import synthetic_patterns
+
+
+RESULTS_SCHEMA = 1
+DEFAULT_THRESHOLD = 0.10
+
+# Interleaved rounds per telemetry overhead measurement
+OVERHEAD_ROUNDS = 21
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    One benchmark: ``setup()`` builds state and returns the timed callable.
+    """
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], Any]]
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+class _NullStream:
+    """Write sink for telemetry logs, so logging cost is measured but not printed."""
+    
+    def write(self, text: str) -> int:
+        return len(text)
+    
+    def flush(self):
+        pass
+
+
+def _engine(**kwargs: Any) -> IntegrationEngine:
+    """Engine for benchmarking (telemetry off and history unretained by default)."""
+    kwargs.setdefault("enable_telemetry", False)
+    kwargs.setdefault("retain_patterns", 0)
+    return IntegrationEngine(**kwargs)
+
+
+# ============================================================================
+# CASES
+# ============================================================================
+
+def _validate_case(size: int, depth: int, objects: bool) -> Callable[[], Any]:
+    engine = _engine()
+    patterns = synthetic_patterns(32, size, depth, as_dicts=not objects)
+    
+    def run():
+        for pattern in patterns:
+            engine.validate(pattern)
+    return run
+
+
+def _integrate_case(warm: bool, size: int) -> Callable[[], Any]:
+    engine = _engine()
+    patterns = synthetic_patterns(3, size)
+    cache = engine.meta_operator.cache
+    engine.integrate(patterns)
+    
+    if warm:
+        return lambda: engine.integrate(patterns)
+    
+    def run():
+        cache.clear()
+        engine.integrate(patterns)
+    return run
+
+
+def _cycle_case(batch_size: int) -> Callable[[], Any]:
+    engine = _engine(enable_cache=False)
+    patterns = synthetic_patterns(batch_size)
+    return lambda: engine.full_integration_cycle(patterns, batch=True)
+
+
+def _cache_case(hit: bool) -> Callable[[], Any]:
+    cache = PatternCache(max_size=256)
+    patterns = synthetic_patterns(3)
+    result = ThreeFingerWaltz()(patterns)
+    cache.put(patterns, result)
+    if hit:
+        return lambda: cache.get(patterns)
+    
+    def run():
+        cache.clear()
+        if cache.get(patterns) is None:
+            cache.put(patterns, result)
+    return run
+
+
+def _telemetry_case(mode: Optional[str]) -> Callable[[], Any]:
+    # All variants run with the cache disabled so only telemetry differs
+    patterns = synthetic_patterns(3)
+    if mode is None:
+        waltz = CachedThreeFingerWaltz(cache_size=0, reentrant=True)
+    else:
+        waltz = InstrumentedThreeFingerWaltz(
+            cache_size=0, reentrant=True, telemetry_mode=mode, log_stream=_NullStream()
+        )
+    return lambda: waltz(patterns)
+
+
+def default_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """
+    Benchmark cases of the standard suite.
+    
+    Args:
+        quick: Only the smallest pattern and batch sizes
+        
+    Returns:
+        List of BenchmarkCase
+    """
+    sizes = [(3, 1)] if quick else [(3, 1), (30, 1), (3, 6), (30, 6)]
+    batch_sizes = [3, 30] if quick else [3, 30, 300]
+    
+    cases = []
+    for size, depth in sizes:
+        for objects in (False, True):
+            kind = "objects" if objects else "dicts"
+            cases.append(BenchmarkCase(
+                f"validate[{kind},size={size},depth={depth}]", "validate",
+                lambda size=size, depth=depth, objects=objects: _validate_case(size, depth, objects),
+                {"patterns": 32, "size": size, "depth": depth, "kind": kind}
+            ))
+    for size in sorted({size for size, _ in sizes}):
+        for warm in (False, True):
+            state = "warm" if warm else "cold"
+            cases.append(BenchmarkCase(
+                f"integrate[{state},size={size}]", "integrate",
+                lambda warm=warm, size=size: _integrate_case(warm, size),
+                {"cache": state, "size": size}
+            ))
+    for batch_size in batch_sizes:
+        cases.append(BenchmarkCase(
+            f"full_integration_cycle[batch={batch_size}]", "full_integration_cycle",
+            lambda batch_size=batch_size: _cycle_case(batch_size),
+            {"batch_size": batch_size}
+        ))
+    for hit in (False, True):
+        outcome = "hit" if hit else "miss"
+        cases.append(BenchmarkCase(
+            f"pattern_cache[{outcome}]", "pattern_cache",
+            lambda hit=hit: _cache_case(hit),
+            {"outcome": outcome}
+        ))
+    for state, mode in (("off", None), ("on", "standard"), ("fast", "fast")):
+        cases.append(BenchmarkCase(
+            f"waltz[telemetry={state}]", "telemetry",
+            lambda mode=mode: _telemetry_case(mode),
+            {"telemetry": state}
+        ))
+    return cases
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def _calibrate(func: Callable[[], Any], min_time: float) -> int:
+    """Smallest call count (1, 2, 5, 10, ...) whose round lasts ``min_time``."""
+    target = int(min_time * 1e9)
+    number = 1
+    while True:
+        for factor in (1, 2, 5):
+            count = number * factor
+            start = time.perf_counter_ns()
+            for _ in range(count):
+                func()
+            if time.perf_counter_ns() - start >= target:
+                return count
+        number *= 10
+
+
+def time_case(case: BenchmarkCase, repeat: int = 5, min_time: float = 0.05) -> Dict[str, Any]:
+    """
+    Time one benchmark case.
+    
+    Args:
+        case: Case to run
+        repeat: Timed rounds
+        min_time: Minimum seconds per round (sets the calls per round)
+        
+    Returns:
+        Result dict with per-call min/median/mean/stdev (ns) and ops/sec
+    """
+    func = case.setup()
+    number = _calibrate(func, min_time)
+    per_call = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        per_call.append((time.perf_counter_ns() - start) / number)
+    
+    median = statistics.median(per_call)
+    return {
+        "group": case.group,
+        "params": case.params,
+        "number": number,
+        "repeat": repeat,
+        "min_ns": min(per_call),
+        "median_ns": median,
+        "mean_ns": statistics.fmean(per_call),
+        "stdev_ns": statistics.stdev(per_call) if repeat > 1 else 0.0,
+        "ops_per_sec": 1e9 / median if median else None
+    }
+
+
+def measure_overhead(
+    baseline: Callable[[], Any],
+    timed: Callable[[], Any],
+    rounds: int = OVERHEAD_ROUNDS,
+    min_time: float = 0.05
+) -> Dict[str, Any]:
+    """
+    Relative cost of ``timed`` over ``baseline`` from interleaved rounds.
+    
+    Rounds alternate between the two callables (flipping which runs
+    first), so drift and background load affect both alike, and each side
+    is represented by its fastest round. Garbage collection is paused
+    while timing, as in ``timeit``. The noise estimate is the larger
+    relative gap between a side's fastest round and its lower quartile.
+    
+    Args:
+        baseline: Reference callable
+        timed: Callable whose extra cost is measured
+        rounds: Timed rounds per callable
+        min_time: Minimum seconds per round (sets the calls per round)
+        
+    Returns:
+        Dict with ``overhead`` and ``noise`` (fractions of the baseline),
+        ``baseline_ns``/``timed_ns`` (fastest per-call times), ``rounds``
+        and ``number`` (calls per round)
+    """
+    number = _calibrate(baseline, min_time)
+    for _ in range(number):
+        timed()
+    per_call: Dict[str, List[float]] = {"baseline": [], "timed": []}
+    sides = [("baseline", baseline), ("timed", timed)]
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for index in range(rounds):
+            for name, func in (sides if index % 2 == 0 else sides[::-1]):
+                start = time.perf_counter_ns()
+                for _ in range(number):
+                    func()
+                per_call[name].append((time.perf_counter_ns() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    
+    fastest = {name: min(values) for name, values in per_call.items()}
+    noise = max(
+        sorted(values)[len(values) // 4] / fastest[name] - 1.0
+        for name, values in per_call.items()
+    )
+    return {
+        "overhead": fastest["timed"] / fastest["baseline"] - 1.0,
+        "noise": noise,
+        "baseline_ns": fastest["baseline"],
+        "timed_ns": fastest["timed"],
+        "rounds": rounds,
+        "number": number
+    }
+
+
+def environment() -> Dict[str, Any]:
+    """Interpreter and platform details recorded with every run."""
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": numpy_version
+    }
+
+
+def run_suite(
+    cases: Optional[List[BenchmarkCase]] = None,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    select: Optional[str] = None,
+    quick: bool = False,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Run benchmark cases.
+    
+    Args:
+        cases: Cases to run (default: ``default_cases(quick)``)
+        repeat: Timed rounds per case
+        min_time: Minimum seconds per round
+        select: Only run cases whose name contains this substring
+        quick: Use the quick case set (when ``cases`` is not given)
+        progress: Called with (name, result) after each case
+        
+    Returns:
+        Results document (see ``save_results``)
+    """
+    if cases is None:
+        cases = default_cases(quick)
+    if select:
+        cases = [case for case in cases if select in case.name]
+    
+    results = {}
+    for case in cases:
+        results[case.name] = time_case(case, repeat, min_time)
+        if progress is not None:
+            progress(case.name, results[case.name])
+    
+    derived = {}
+    by_name = {case.name: case for case in cases}
+    off = by_name.get("waltz[telemetry=off]")
+    for state, key in (("on", "telemetry_overhead"), ("fast", "fast_telemetry_overhead")):
+        timed = by_name.get(f"waltz[telemetry={state}]")
+        if off and timed:
+            measured = measure_overhead(off.setup(), timed.setup(), OVERHEAD_ROUNDS, min_time)
+            derived[key] = measured["overhead"]
+            derived[f"{key}_noise"] = measured["noise"]
+    
+    return {
+        "schema": RESULTS_SCHEMA,
+        "created": datetime.now().isoformat(),
+        "environment": environment(),
+        "config": {"repeat": repeat, "min_time": min_time, "quick": quick, "select": select},
+        "results": results,
+        "derived": derived
+    }
+
+
+def save_results(document: Dict[str, Any], path: str):
+    """
+    Write a results document as JSON.
+    
+    Args:
+        document: Output of ``run_suite``
+        path: Destination path
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Read a results document.
+    
+    Args:
+        path: JSON file written by ``save_results``
+        
+    Returns:
+        Results document
+    """
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    if document.get("schema") != RESULTS_SCHEMA:
+        raise ValueError(
+            f"{path}: unsupported benchmark schema {document.get('schema')!r} "
+            f"(expected {RESULTS_SCHEMA})"
+        )
+    return document
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD
+) -> Dict[str, Any]:
+    """
+    Compare a run against a baseline run.
+    
+    Args:
+        current: Results document of this run
+        baseline: Stored results document
+        threshold: Allowed slowdown as a fraction (0.10 = 10% slower)
+        
+    Returns:
+        Comparison with status, per-case changes and the regressed cases
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be non-negative")
+    
+    cases, regressions = [], []
+    current_results = current["results"]
+    baseline_results = baseline["results"]
+    for name, result in current_results.items():
+        reference = baseline_results.get(name)
+        if reference is None:
+            continue
+        change = result["median_ns"] / reference["median_ns"] - 1.0
+        entry = {
+            "name": name,
+            "baseline_ns": reference["median_ns"],
+            "current_ns": result["median_ns"],
+            "change": change,
+            "regressed": change > threshold
+        }
+        cases.append(entry)
+        if entry["regressed"]:
+            regressions.append(name)
+    
+    if regressions:
+        status = "REGRESSED"
+        message = f"✗ {len(regressions)} of {len(cases)} benchmarks slower than baseline by > {threshold:.0%}"
+    else:
+        status = "PASSED"
+        message = f"✓ {len(cases)} benchmarks within {threshold:.0%} of baseline"
+    return {
+        "status": status,
+        "message": message,
+        "threshold": threshold,
+        "cases": cases,
+        "regressions": regressions,
+        "new": sorted(set(current_results) - set(baseline_results)),
+        "missing": sorted(set(baseline_results) - set(current_results))
+    }
+
+
+def format_comparison(comparison: Dict[str, Any]) -> str:
+    """
+    Render a comparison as a text table.
+    
+    Args:
+        comparison: Output of ``compare``
+        
+    Returns:
+        Multi-line report
+    """
+    lines = [f"{'benchmark':<48} {'baseline':>12} {'current':>12} {'change':>8}"]
+    for entry in comparison["cases"]:
+        marker = "  <-- REGRESSED" if entry["regressed"] else ""
+        lines.append(
+            f"{entry['name']:<48} {entry['baseline_ns'] / 1e3:>10.1f}µs "
+            f"{entry['current_ns'] / 1e3:>10.1f}µs {entry['change']:>+8.1%}{marker}"
+        )
+    for name in comparison["new"]:
+        lines.append(f"{name:<48} (new, no baseline)")
+    for name in comparison["missing"]:
+        lines.append(f"{name:<48} (in baseline, not run)")
+    lines.append(comparison["message"])
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point (``python -m code.integration.benchmarks``).
+    
+    Args:
+        argv: Arguments (default: ``sys.argv[1:]``)
+        
+    Returns:
+        Exit code: 0 on success, 1 when a benchmark regressed or fast
+        telemetry exceeded its overhead budget by more than the
+        measurement noise
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="python -m code.integration.benchmarks",
+        description="Benchmark the integration engine and compare with a baseline."
+    )
+    parser.add_argument("-o", "--output", help="write results JSON to this path")
+    parser.add_argument("-b", "--baseline", help="baseline results JSON to compare against")
+    parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown fraction before failing (default: %(default)s)")
+    parser.add_argument("-k", "--select", help="only run benchmarks whose name contains this")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="timed rounds per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per round")
+    parser.add_argument("--quick", action="store_true", help="run the reduced case set")
+    args = parser.parse_args(argv)
+    
+    def report(name: str, result: Dict[str, Any]):
+        print(f"{name:<48} {result['median_ns'] / 1e3:>10.1f}µs  ({result['number']} x {result['repeat']})")
+    
+    document = run_suite(
+        repeat=args.repeat,
+        min_time=args.min_time,
+        select=args.select,
+        quick=args.quick,
+        progress=report
+    )
+    derived = document["derived"]
+    if "telemetry_overhead" in derived:
+        print(
+            f"telemetry overhead: {derived['telemetry_overhead']:+.1%} "
+            f"(±{derived['telemetry_overhead_noise']:.1%})"
+        )
+    over_budget = False
+    if "fast_telemetry_overhead" in derived:
+        overhead = derived["fast_telemetry_overhead"]
+        noise = derived["fast_telemetry_overhead_noise"]
+        over_budget = overhead - noise > FAST_TELEMETRY_BUDGET
+        verdict = "OVER BUDGET" if over_budget else "within budget"
+        print(
+            f"fast telemetry overhead: {overhead:+.1%} (±{noise:.1%}, "
+            f"{verdict}, budget {FAST_TELEMETRY_BUDGET:.0%}, "
+            f"interleaved min of {OVERHEAD_ROUNDS})"
+        )
+    if args.output:
+        save_results(document, args.output)
+    
+    regressed = False
+    if args.baseline:
+        comparison = compare(document, load_results(args.baseline), args.threshold)
+        print(format_comparison(comparison))
+        regressed = comparison["status"] == "REGRESSED"
+    return 1 if regressed or over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
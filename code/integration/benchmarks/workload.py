@@ -0,0 +1,282 @@
+"""
+Synthetic Pattern Workloads
+
+Seeded generator of realistic pattern streams for load testing. A
+workload controls:
+- the status mix: the fraction of SOVEREIGN / STABLE / UNSTABLE /
+  INVALID patterns, produced by pushing a sovereign pattern past the
+  UniversalLaws thresholds (partial results for STABLE, one or two
+  violations for UNSTABLE, three or more for INVALID);
+- the duplicate rate: the fraction of emitted items (patterns from
+  ``stream``, batches from ``batches``) that repeat a recent one, so
+  the PatternCache sees hits;
+- the pillar distribution and the structure size and nesting depth.
+
+Streams are lazy and unbounded unless a count is given. They can be
+written to JSONL (``.jsonl`` / ``.jsonl.gz``, readable by
+``iter_jsonl_batches``) or to columnar pattern files (``.npy``,
+``.arrow``, ``.parquet``; see ``columnar``). Patterns are drawn from one
+seeded generator, so the same workload parameters always give the same
+stream.
+"""
+
+from __future__ import annotations
+from collections import deque
+from dataclasses import replace
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+import gzip
+import json
+import random
+
+from ..engine import IntegrationPattern
+from ..universal_laws import OVERALL_STATUSES, UniversalLaws
+from .patterns import PILLAR_MODES, synthetic_pattern
+
+
+DEFAULT_MIX = {"SOVEREIGN": 0.7, "STABLE": 0.15, "UNSTABLE": 0.1, "INVALID": 0.05}
+
+_LAWS = UniversalLaws
+_PILLAR_MODE = dict(PILLAR_MODES)
+
+
+def _without_triad(pattern: IntegrationPattern, elements: int) -> Dict[str, Any]:
+    structure = {key: value for key, value in pattern.structure.items() if key != "triad"}
+    structure["elements"] = list(range(elements))
+    return structure
+
+
+# Field changes that make one law partially satisfied, keyed by law
+_PARTIALS: Dict[str, Callable[[IntegrationPattern, random.Random], Dict[str, Any]]] = {
+    "triad": lambda p, rnd: {"structure": _without_triad(p, max(3, len(p.structure.get("elements", ()))))},
+    "convergence": lambda p, rnd: {"convergence_point": None},
+    "stability": lambda p, rnd: {"stability_score": round(rnd.uniform(0.0, 0.49), 6)},
+    "coherence": lambda p, rnd: {
+        "coherence": round(rnd.uniform(_LAWS.COHERENCE_THRESHOLD * 0.7 + 0.001, _LAWS.COHERENCE_THRESHOLD - 0.001), 6)
+    },
+    "threshold": lambda p, rnd: {"threshold": 0.5, "threshold_managed": False},
+    "closure": lambda p, rnd: {"sovereignty": False},
+}
+
+# Field changes that make one law violated, keyed by law
+_VIOLATIONS: Dict[str, Callable[[IntegrationPattern, random.Random], Dict[str, Any]]] = {
+    "triad": lambda p, rnd: {"structure": _without_triad(p, 1)},
+    "recursion": lambda p, rnd: {"recursion_depth": _LAWS.MAX_RECURSION_DEPTH + rnd.randint(1, 5)},
+    "similarity": lambda p, rnd: {
+        "similarity_ratio": rnd.choice([
+            round(rnd.uniform(0.0, _LAWS.GOLDEN_RATIO_LOWER - 0.01), 6),
+            round(rnd.uniform(_LAWS.GOLDEN_RATIO_UPPER + 0.01, 3.0), 6),
+        ])
+    },
+    "convergence": lambda p, rnd: {"converges": False},
+    "apex": lambda p, rnd: {"apex": None},
+    "stability": lambda p, rnd: {"stable": False},
+    "embedding": lambda p, rnd: {
+        "embedding_ratio": round(_LAWS.GOLDEN_RATIO + rnd.choice([-1, 1]) * rnd.uniform(0.15, 0.6), 6)
+    },
+    "coherence": lambda p, rnd: {"coherence": round(rnd.uniform(0.0, _LAWS.COHERENCE_THRESHOLD * 0.7 - 0.01), 6)},
+    "operators": lambda p, rnd: {"operators": p.operators[:rnd.randint(0, _LAWS.MIN_OPERATORS - 1)]},
+    "invariant": lambda p, rnd: {"invariant_preserved": False},
+    "closure": lambda p, rnd: {"closed": False},
+}
+
+
+def _normalized(weights: Dict[str, float], allowed: Tuple[str, ...], what: str) -> Tuple[List[str], List[float]]:
+    """Validate a weight table and return (keys, cumulative weights)."""
+    unknown = set(weights) - set(allowed)
+    if unknown:
+        raise ValueError(f"Unknown {what} {sorted(unknown)} (expected {list(allowed)})")
+    if any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+        raise ValueError(f"{what} weights must be non-negative with a positive sum")
+    keys = [key for key in allowed if weights.get(key, 0) > 0]
+    total, cumulative = 0.0, []
+    for key in keys:
+        total += weights[key]
+        cumulative.append(total)
+    return keys, cumulative
+
+
+class PatternWorkload:
+    """
+    Seeded, tunable stream of synthetic IntegrationPatterns.
+    
+    ``stats`` counts the patterns generated per intended status and the
+    duplicates emitted.
+    """
+    
+    def __init__(
+        self,
+        mix: Optional[Dict[str, float]] = None,
+        duplicate_rate: float = 0.0,
+        pillar_weights: Optional[Dict[str, float]] = None,
+        size: int = 3,
+        depth: Tuple[int, int] = (1, 3),
+        seed: int = 0,
+        duplicate_window: int = 1024
+    ):
+        """
+        Initialize workload.
+        
+        Args:
+            mix: Weight per overall status (default: DEFAULT_MIX)
+            duplicate_rate: Fraction of emitted items repeating a recent one
+            pillar_weights: Weight per pillar (default: uniform)
+            size: Structure elements, operators and leaves per nesting level
+            depth: Inclusive (min, max) nesting depth of the structure payload
+            seed: Random seed
+            duplicate_window: How many recent items duplicates are drawn from
+        """
+        if not 0.0 <= duplicate_rate <= 1.0:
+            raise ValueError("duplicate_rate must be within [0, 1]")
+        if size < 3:
+            raise ValueError("size must be at least 3")
+        if not 1 <= depth[0] <= depth[1]:
+            raise ValueError("depth must be a (min, max) range with 1 <= min <= max")
+        
+        self.mix = dict(mix if mix is not None else DEFAULT_MIX)
+        self._statuses, self._status_weights = _normalized(self.mix, OVERALL_STATUSES, "status")
+        self.pillar_weights = dict(pillar_weights or {pillar: 1.0 for pillar, _ in PILLAR_MODES})
+        self._pillars, self._pillar_weights = _normalized(
+            self.pillar_weights, tuple(_PILLAR_MODE), "pillar"
+        )
+        self.duplicate_rate = duplicate_rate
+        self.size = size
+        self.depth = depth
+        self.seed = seed
+        self.duplicate_window = duplicate_window
+        self._rnd = random.Random(seed)
+        self._index = 0
+        self.stats: Dict[str, int] = {status: 0 for status in OVERALL_STATUSES}
+        self.stats["duplicates"] = 0
+    
+    def _choose(self, keys: List[str], cumulative: List[float]) -> str:
+        return self._rnd.choices(keys, cum_weights=cumulative)[0]
+    
+    def _degrade(self, pattern: IntegrationPattern, status: str) -> IntegrationPattern:
+        """Push a sovereign pattern to ``status`` via distinct-law changes."""
+        rnd = self._rnd
+        if status == "SOVEREIGN":
+            return pattern
+        if status == "STABLE":
+            violations, partials = 0, rnd.randint(1, 2)
+        elif status == "UNSTABLE":
+            violations, partials = rnd.randint(1, 2), rnd.randint(0, 1)
+        else:
+            violations, partials = rnd.randint(3, 5), rnd.randint(0, 1)
+        
+        changes: Dict[str, Any] = {}
+        laws = rnd.sample(sorted(_VIOLATIONS), violations)
+        for law in laws:
+            changes.update(_VIOLATIONS[law](pattern, rnd))
+        remaining = sorted(set(_PARTIALS) - set(laws))
+        for law in rnd.sample(remaining, partials):
+            changes.update(_PARTIALS[law](pattern, rnd))
+        return replace(pattern, **changes)
+    
+    def pattern(self) -> IntegrationPattern:
+        """
+        Generate the next fresh pattern (never a duplicate).
+        
+        Returns:
+            IntegrationPattern with the intended status drawn from the mix
+        """
+        index = self._index
+        self._index += 1
+        pillar = self._choose(self._pillars, self._pillar_weights)
+        status = self._choose(self._statuses, self._status_weights)
+        depth = self._rnd.randint(*self.depth)
+        
+        pattern = synthetic_pattern(index, self.size, depth, self.seed)
+        pattern = replace(pattern, pillar=pillar, mode=_PILLAR_MODE[pillar])
+        self.stats[status] += 1
+        return self._degrade(pattern, status)
+    
+    def _with_duplicates(self, fresh: Callable[[], Any], count: Optional[int]) -> Iterator[Any]:
+        """Emit ``fresh()`` items, repeating recent ones at the duplicate rate."""
+        recent: Deque[Any] = deque(maxlen=self.duplicate_window)
+        emitted = 0
+        while count is None or emitted < count:
+            if recent and self._rnd.random() < self.duplicate_rate:
+                self.stats["duplicates"] += 1
+                yield self._rnd.choice(recent)
+            else:
+                item = fresh()
+                recent.append(item)
+                yield item
+            emitted += 1
+    
+    def stream(self, count: Optional[int] = None) -> Iterator[IntegrationPattern]:
+        """
+        Lazily generate patterns.
+        
+        Duplicates are the same (read-only) pattern object re-emitted.
+        
+        Args:
+            count: Number of patterns (None = unbounded)
+            
+        Yields:
+            IntegrationPatterns
+        """
+        return self._with_duplicates(self.pattern, count)
+    
+    def batches(self, batch_size: int = 3, count: Optional[int] = None) -> Iterator[List[IntegrationPattern]]:
+        """
+        Lazily generate pattern batches; duplicates repeat whole batches.
+        
+        Args:
+            batch_size: Patterns per batch
+            count: Number of batches (None = unbounded)
+            
+        Yields:
+            Pattern lists (repeated batches are new lists of the same patterns)
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        fresh = lambda: [self.pattern() for _ in range(batch_size)]
+        for batch in self._with_duplicates(fresh, count):
+            yield list(batch)
+    
+    def write_jsonl(self, path: str, count: int) -> int:
+        """
+        Write ``count`` patterns as JSON lines (gzip for ``.gz`` paths).
+        
+        Args:
+            path: Destination path
+            count: Number of patterns
+            
+        Returns:
+            Number of patterns written
+        """
+        opener = gzip.open if path.endswith(".gz") else open
+        written = 0
+        with opener(path, "wt", encoding="utf-8") as f:
+            for pattern in self.stream(count):
+                f.write(json.dumps(pattern.to_dict(), separators=(",", ":")))
+                f.write("\n")
+                written += 1
+        return written
+    
+    def write_columnar(self, path: str, count: int) -> int:
+        """
+        Write ``count`` patterns to a columnar pattern file.
+        
+        The patterns are collected in a PatternBatch first, so the whole
+        workload must fit in memory in columnar form.
+        
+        Args:
+            path: ``.npy``, ``.arrow``/``.feather``/``.ipc`` or ``.parquet`` path
+            count: Number of patterns
+            
+        Returns:
+            Number of patterns written
+        """
+        from ..columnar import NPY_SUFFIXES, is_columnar_path, save_arrow, save_npy
+        from ..pattern_batch import PatternBatch
+        
+        if not is_columnar_path(path):
+            raise ValueError(f"Unknown columnar pattern file type: {path!r}")
+        batch = PatternBatch(self.stream(count))
+        if path.endswith(NPY_SUFFIXES):
+            save_npy(batch, path)
+        else:
+            save_arrow(batch, path)
+        return len(batch)
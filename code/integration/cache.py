@@ -6,10 +6,100 @@ to improve performance and reduce redundant computations.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional
-from hashlib import sha256
-import json
+from collections import ChainMap, OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+import sys
+import threading
 from .meta_operators import ThreeFingerWaltz
+from .fingerprint import PatternFingerprinter
+
+if TYPE_CHECKING:
+    from .persistent_cache import PersistentPatternCache
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Estimate the deep in-memory size of a result in bytes.
+    
+    Walks dicts, lists, tuples and sets, counting every distinct object
+    once (shared sub-structures such as the waltz triad are not counted
+    twice).
+    
+    Args:
+        obj: Object to measure
+        
+    Returns:
+        Approximate size in bytes
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, Mapping):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
+
+
+def freeze(obj: Any, _memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Build a deep read-only view of a result.
+    
+    Dicts become ``MappingProxyType`` views, lists/tuples become tuples
+    and sets become frozensets. Shared sub-structures (the waltz triad
+    references every earlier phase dict) are frozen once and stay shared.
+    
+    Args:
+        obj: Result (or any nested value) to freeze
+        
+    Returns:
+        Read-only equivalent of ``obj``
+    """
+    if _memo is None:
+        _memo = {}
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    frozen = _memo.get(id(obj))
+    if frozen is not None:
+        return frozen
+    if isinstance(obj, Mapping):
+        frozen = MappingProxyType({k: freeze(v, _memo) for k, v in obj.items()})
+    elif isinstance(obj, (list, tuple)):
+        frozen = tuple(freeze(v, _memo) for v in obj)
+    elif isinstance(obj, (set, frozenset)):
+        frozen = frozenset(freeze(v, _memo) for v in obj)
+    else:
+        frozen = obj
+    _memo[id(obj)] = frozen
+    return frozen
+
+
+def thaw(obj: Any) -> Any:
+    """
+    Convert a frozen result back into plain, mutable dicts and lists.
+    
+    Args:
+        obj: Frozen (or partially frozen) value
+        
+    Returns:
+        Deep mutable copy using dict/list containers
+    """
+    if isinstance(obj, Mapping):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [thaw(v) for v in obj]
+    if isinstance(obj, frozenset):
+        return set(thaw(v) for v in obj)
+    return obj
 
 
 class PatternCache:
@@ -18,72 +108,160 @@ class PatternCache:
     
     Caches integration results based on pattern hash to avoid
     redundant waltz executions for identical pattern sets.
+    
+    Entries are kept in recency order in an OrderedDict, so lookups,
+    inserts and evictions are all O(1). The cache is bounded by entry
+    count (``max_size``) and optionally by the estimated total size of
+    the cached results (``max_bytes``).
+    
+    Keys come from a PatternFingerprinter. Callers that do a lookup and
+    then an insert for the same patterns should compute the key once with
+    ``key_for()`` and pass it to both ``get()`` and ``put()``.
+    
+    Results are stored frozen (see ``freeze``) and hits return the shared
+    read-only entry itself, so a hit allocates nothing and callers cannot
+    corrupt cached results through nested dicts.
+    
+    The cache is thread-safe: the recency list and counters are guarded by
+    one lock, while fingerprinting, sizing and freezing happen outside it.
     """
     
-    def __init__(self, max_size: int = 128):
+    def __init__(
+        self, 
+        max_size: int = 128, 
+        max_bytes: Optional[int] = None, 
+        hash_mode: str = "sha256"
+    ):
         """
         Initialize pattern cache.
         
         Args:
-            max_size: Maximum number of cached results
+            max_size: Maximum number of cached results (0 disables caching)
+            max_bytes: Optional budget for the estimated size of all cached
+                       results (see ``estimate_size``)
+            hash_mode: Fingerprint hash mode ("sha256", "blake2b" or "fast")
         """
         self.max_size = max_size
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._access_count: Dict[str, int] = {}
+        self.max_bytes = max_bytes
+        self.fingerprinter = PatternFingerprinter(hash_mode)
+        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._entry_bytes: Dict[str, int] = {}
+        self._bytes = 0
         self._total_hits = 0
         self._total_misses = 0
+        self._total_puts = 0
+        self._size_evictions = 0
+        self._byte_evictions = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
     
-    def _hash_patterns(self, patterns: List[Any]) -> str:
+    def key_for(self, patterns: List[Any], namespace: str = "") -> str:
         """
-        Generate SHA256 hash of pattern list.
+        Compute the cache key for a pattern list.
         
         Args:
-            patterns: List of patterns to hash
+            patterns: List of patterns to fingerprint
+            namespace: Optional key prefix separating result kinds
+                       (e.g. batch vs. single-pattern waltz results)
             
         Returns:
-            Hexadecimal hash string
+            Hexadecimal fingerprint
         """
-        pattern_str = json.dumps(patterns, sort_keys=True, default=str)
-        return sha256(pattern_str.encode()).hexdigest()
+        return self.fingerprinter.key(patterns, namespace)
     
-    def get(self, patterns: List[Any]) -> Optional[Dict[str, Any]]:
+    def get(
+        self, 
+        patterns: List[Any], 
+        namespace: str = "", 
+        key: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieve cached result if exists.
         
+        A hit marks the entry as most recently used.
+        
         Args:
             patterns: List of patterns to look up
+            namespace: Optional key prefix (see ``key_for``)
+            key: Precomputed key from ``key_for`` (skips fingerprinting)
             
         Returns:
-            Cached result dictionary, or None if not in cache
+            Frozen cached result (read-only mapping), or None if not in cache
         """
-        pattern_hash = self._hash_patterns(patterns)
-        if pattern_hash in self._cache:
-            self._access_count[pattern_hash] += 1
-            self._total_hits += 1
-            return self._cache[pattern_hash].copy()
-        
-        self._total_misses += 1
-        return None
+        pattern_hash = key if key is not None else self.key_for(patterns, namespace)
+        with self._lock:
+            entry = self._cache.get(pattern_hash)
+            if entry is not None:
+                self._cache.move_to_end(pattern_hash)
+                self._total_hits += 1
+                return entry
+            
+            self._total_misses += 1
+            return None
     
-    def put(self, patterns: List[Any], result: Dict[str, Any]):
+    def put(
+        self, 
+        patterns: List[Any], 
+        result: Dict[str, Any], 
+        namespace: str = "", 
+        key: Optional[str] = None, 
+        frozen: bool = False
+    ):
         """
         Cache integration result.
         
+        Inserts (or refreshes) the entry as most recently used, then evicts
+        least recently used entries until both the size and byte bounds
+        hold again.
+        
         Args:
             patterns: List of patterns that were integrated
             result: Result dictionary to cache
+            namespace: Optional key prefix (see ``key_for``)
+            key: Precomputed key from ``key_for`` (skips fingerprinting)
+            frozen: ``result`` is already a ``freeze()`` view (e.g. from a
+                    persistent cache) and is stored as-is
         """
-        pattern_hash = self._hash_patterns(patterns)
+        if self.max_size <= 0:
+            return
+        
+        pattern_hash = key if key is not None else self.key_for(patterns, namespace)
+        
+        entry_bytes = 0
+        if self.max_bytes is not None:
+            entry_bytes = estimate_size(result)
+            if entry_bytes > self.max_bytes:
+                # Would evict the whole cache and still not fit
+                with self._lock:
+                    self._rejected += 1
+                return
         
-        # LRU eviction if cache is full
-        if len(self._cache) >= self.max_size and pattern_hash not in self._cache:
-            # Find least recently used item
-            lru_key = min(self._access_count, key=self._access_count.get)
-            del self._cache[lru_key]
-            del self._access_count[lru_key]
+        entry = result if frozen else freeze(result)
         
-        self._cache[pattern_hash] = result.copy()
-        self._access_count[pattern_hash] = 1
+        with self._lock:
+            if pattern_hash in self._cache:
+                self._bytes -= self._entry_bytes[pattern_hash]
+                self._cache.move_to_end(pattern_hash)
+            
+            self._cache[pattern_hash] = entry
+            self._entry_bytes[pattern_hash] = entry_bytes
+            self._bytes += entry_bytes
+            self._total_puts += 1
+            
+            # Evict least recently used entries
+            while len(self._cache) > self.max_size:
+                self._evict_lru()
+                self._size_evictions += 1
+            
+            if self.max_bytes is not None:
+                while self._bytes > self.max_bytes:
+                    self._evict_lru()
+                    self._byte_evictions += 1
+    
+    def _evict_lru(self):
+        """Drop the least recently used entry (caller holds ``_lock``)."""
+        lru_key, _ = self._cache.popitem(last=False)
+        self._bytes -= self._entry_bytes.pop(lru_key)
     
     def _calculate_hit_rate(self) -> float:
         """Calculate cache hit rate."""
@@ -99,21 +277,38 @@ class PatternCache:
         Returns:
             Dictionary with cache metrics
         """
+        with self._lock:
+            return self._stats_locked()
+    
+    def _stats_locked(self) -> Dict[str, Any]:
+        """Build the stats dict (caller holds ``_lock``)."""
         return {
             "size": len(self._cache),
             "max_size": self.max_size,
-            "total_accesses": sum(self._access_count.values()),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "total_accesses": self._total_puts + self._total_hits,
             "hit_rate": self._calculate_hit_rate(),
             "total_hits": self._total_hits,
-            "total_misses": self._total_misses
+            "total_misses": self._total_misses,
+            "evictions": self._size_evictions + self._byte_evictions,
+            "size_evictions": self._size_evictions,
+            "byte_evictions": self._byte_evictions,
+            "rejected": self._rejected
         }
     
     def clear(self):
         """Clear all cached data."""
-        self._cache.clear()
-        self._access_count.clear()
-        self._total_hits = 0
-        self._total_misses = 0
+        with self._lock:
+            self._cache.clear()
+            self._entry_bytes.clear()
+            self._bytes = 0
+            self._total_hits = 0
+            self._total_misses = 0
+            self._total_puts = 0
+            self._size_evictions = 0
+            self._byte_evictions = 0
+            self._rejected = 0
 
 
 class CachedThreeFingerWaltz(ThreeFingerWaltz):
@@ -122,46 +317,126 @@ class CachedThreeFingerWaltz(ThreeFingerWaltz):
     
     Extends ThreeFingerWaltz to cache results of pattern integrations,
     improving performance for repeated pattern sets.
+    
+    An optional PersistentPatternCache acts as a second level shared by
+    every worker process on the host: in-process misses fall through to
+    it, its hits are promoted into the in-process cache, and fresh results
+    are written to both.
+    
+    Safe to share between threads when ``reentrant=True``: both cache
+    levels lock internally and the hit/miss counters share the waltz lock.
     """
     
-    def __init__(self, cache_size: int = 128, **kwargs):
+    def __init__(
+        self, 
+        cache_size: int = 128, 
+        cache_max_bytes: Optional[int] = None, 
+        hash_mode: str = "sha256", 
+        persistent_cache: Optional[PersistentPatternCache] = None, 
+        warm_start: int = 0, 
+        **kwargs
+    ):
         """
         Initialize cached waltz.
         
         Args:
             cache_size: Maximum cache size
+            cache_max_bytes: Optional byte budget for cached results
+            hash_mode: Cache key hash mode ("sha256", "blake2b" or "fast")
+            persistent_cache: Optional on-disk second-level cache (must use
+                              the same hash mode)
+            warm_start: Number of newest persistent entries to preload into
+                        the in-process cache
             **kwargs: Additional arguments for ThreeFingerWaltz
         """
         super().__init__(**kwargs)
-        self.cache = PatternCache(max_size=cache_size)
+        self.cache = PatternCache(
+            max_size=cache_size, 
+            max_bytes=cache_max_bytes, 
+            hash_mode=hash_mode
+        )
+        if persistent_cache is not None and persistent_cache.hash_mode != hash_mode:
+            raise ValueError(
+                f"Persistent cache hash mode {persistent_cache.hash_mode!r} "
+                f"does not match {hash_mode!r}"
+            )
+        self.persistent_cache = persistent_cache
         self._cache_hits = 0
         self._cache_misses = 0
+        self._persistent_hits = 0
+        
+        if persistent_cache is not None and warm_start > 0:
+            self.warm_start(warm_start)
     
-    def __call__(self, patterns: List[Any]) -> Dict[str, Any]:
+    def warm_start(self, limit: int) -> int:
+        """
+        Preload the newest persistent entries into the in-process cache.
+        
+        Args:
+            limit: Maximum number of entries to load
+            
+        Returns:
+            Number of entries loaded
+        """
+        if self.persistent_cache is None:
+            return 0
+        loaded = 0
+        for key, entry in self.persistent_cache.items(limit=min(limit, self.cache.max_size)):
+            self.cache.put([], entry, key=key, frozen=True)
+            loaded += 1
+        return loaded
+    
+    def __call__(self, patterns: List[Any], batch: bool = False) -> Dict[str, Any]:
         """
         Execute waltz with caching.
         
         Args:
             patterns: List of patterns to integrate
+            batch: Integrate every pattern in a single pass
             
         Returns:
-            Integration result (from cache or fresh execution)
+            Integration result (from cache or fresh execution). Cache hits
+            are a ChainMap of per-call metadata (``from_cache``,
+            ``cache_hit`` and anything the caller adds) over the shared
+            frozen entry.
         """
+        # Fingerprint once; shared by lookup and insert
+        with self._span("cache.hash"):
+            key = self.cache.key_for(patterns, "batch:" if batch else "")
+        
         # Try cache first
-        cached = self.cache.get(patterns)
+        with self._span("cache.lookup"):
+            cached = self.cache.get(patterns, key=key)
         if cached is not None:
-            self._cache_hits += 1
-            cached["from_cache"] = True
-            cached["cache_hit"] = True
-            return cached
+            with self._lock:
+                self._cache_hits += 1
+            return ChainMap({"from_cache": True, "cache_hit": True}, cached)
+        
+        # Fall through to the shared on-disk cache
+        if self.persistent_cache is not None:
+            with self._span("cache.persistent_lookup"):
+                stored = self.persistent_cache.get(patterns, key=key)
+            if stored is not None:
+                with self._lock:
+                    self._cache_hits += 1
+                    self._persistent_hits += 1
+                self.cache.put(patterns, stored, key=key, frozen=True)
+                return ChainMap(
+                    {"from_cache": True, "cache_hit": True, "cache_level": "persistent"}, 
+                    stored
+                )
         
         # Execute waltz
-        self._cache_misses += 1
-        result = super().__call__(patterns)
+        with self._lock:
+            self._cache_misses += 1
+        result = super().__call__(patterns, batch=batch)
         
         # Cache result (only if successful)
         if result.get("status") == "WALTZ_COMPLETE":
-            self.cache.put(patterns, result)
+            with self._span("cache.store"):
+                self.cache.put(patterns, result, key=key)
+                if self.persistent_cache is not None:
+                    self.persistent_cache.put(patterns, result, key=key)
         
         result["from_cache"] = False
         result["cache_hit"] = False
@@ -180,17 +455,27 @@ class CachedThreeFingerWaltz(ThreeFingerWaltz):
         total_requests = self._cache_hits + self._cache_misses
         hit_rate = self._cache_hits / total_requests if total_requests > 0 else 0.0
         
-        return {
+        stats = {
             **base_stats,
             "waltz_cache_hits": self._cache_hits,
             "waltz_cache_misses": self._cache_misses,
             "waltz_hit_rate": hit_rate,
             "total_waltz_requests": total_requests
         }
+        if self.persistent_cache is not None:
+            stats["persistent_hits"] = self._persistent_hits
+            stats["persistent"] = self.persistent_cache.stats()
+        return stats
     
     def reset(self):
-        """Reset waltz and clear cache."""
+        """
+        Reset waltz and clear the in-process cache.
+        
+        The persistent cache is shared with other processes and is left
+        untouched; call ``persistent_cache.clear()`` explicitly to drop it.
+        """
         super().reset()
         self.cache.clear()
         self._cache_hits = 0
         self._cache_misses = 0
+        self._persistent_hits = 0
@@ -0,0 +1,360 @@
+"""
+Columnar Pattern Ingestion
+
+Loads columnar pattern files directly into PatternBatch columns, so bulk
+validation (``validate_many``) runs over the file's arrays without
+building a dict or IntegrationPattern per row.
+
+Formats (chosen by file suffix):
+- ``.npy``: NumPy structured array (pure NumPy, memory-mapped). Numeric
+  and flag fields are native columns; string and object fields are
+  JSON-encoded fixed-width byte strings. Interned fields are decoded once
+  per distinct value; the object fields (name, structure, operators,
+  convergence_point) only when first accessed.
+- ``.arrow`` / ``.feather`` / ``.ipc``: Arrow IPC file (requires pyarrow;
+  memory-mapped, numeric columns without nulls are zero-copy).
+- ``.parquet``: Parquet file (requires pyarrow).
+
+Missing columns take the IntegrationPattern defaults (``name``,
+``pillar`` and ``mode`` are required). Object fields are JSON-encoded,
+so tuples read back as lists.
+"""
+
+from __future__ import annotations
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, Iterable, List
+import json
+import math
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pa = pc = pq = None
+
+from .engine import IntegrationPattern
+from .pattern_batch import (
+    PatternBatch,
+    INT_FIELDS,
+    FLOAT_FIELDS,
+    FLAG_FIELDS,
+    INTERNED_FIELDS,
+    OBJECT_FIELDS,
+)
+
+
+NPY_SUFFIXES = (".npy",)
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+PARQUET_SUFFIXES = (".parquet",)
+
+REQUIRED_FIELDS = ("name", "pillar", "mode")
+# Fields stored as JSON text in .npy files (Arrow files use native string
+# and list columns for all of them except _JSON_FIELDS)
+TEXT_FIELDS = INTERNED_FIELDS + OBJECT_FIELDS
+_JSON_FIELDS = ("structure", "convergence_point")
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for columnar pattern files")
+
+
+def _require_pyarrow(path: str):
+    if pa is None:
+        raise ImportError(
+            f"pyarrow is required to read or write {path!r}; "
+            "use a .npy pattern file for a NumPy-only setup"
+        )
+
+
+def _defaults() -> Dict[str, Callable[[], Any]]:
+    """IntegrationPattern default value factory per field."""
+    defaults = {}
+    for spec in fields(IntegrationPattern):
+        if spec.default is not MISSING:
+            defaults[spec.name] = (lambda value=spec.default: value)
+        elif spec.default_factory is not MISSING:
+            defaults[spec.name] = spec.default_factory
+    return defaults
+
+
+def _assemble(
+    length: int,
+    numeric: Dict[str, Any],
+    interned: Dict[str, tuple],
+    objects: Dict[str, Any],
+    source: str
+) -> PatternBatch:
+    """
+    Build a PatternBatch from loaded columns, filling absent fields.
+    
+    Args:
+        length: Number of rows
+        numeric: Loaded numeric/flag columns
+        interned: Loaded interned fields as (codes, vocabulary)
+        objects: Loaded object columns (lists or lazy callables)
+        source: File name for error messages
+        
+    Returns:
+        PatternBatch over the columns
+    """
+    missing = [name for name in REQUIRED_FIELDS if name not in interned and name not in objects]
+    if missing:
+        raise ValueError(f"{source}: missing required pattern columns {missing}")
+    
+    defaults = _defaults()
+    for name in INT_FIELDS + FLOAT_FIELDS + FLAG_FIELDS:
+        if name not in numeric:
+            value = defaults[name]()
+            numeric[name] = np.full(length, math.nan if value is None else value)
+    codes, vocabularies = {}, {}
+    for name in INTERNED_FIELDS:
+        if name in interned:
+            codes[name], vocabularies[name] = interned[name]
+        else:
+            codes[name], vocabularies[name] = np.zeros(length, dtype=np.int32), [defaults[name]()]
+    for name in OBJECT_FIELDS:
+        if name not in objects:
+            factory = defaults[name]
+            objects[name] = lambda factory=factory: [factory() for _ in range(length)]
+    return PatternBatch.from_columns(length, numeric, codes, vocabularies, objects)
+
+
+# ============================================================================
+# NUMPY (.npy)
+# ============================================================================
+
+def to_records(patterns: Iterable[Any]) -> Any:
+    """
+    Encode patterns as a NumPy structured array (the ``.npy`` layout).
+    
+    Args:
+        patterns: PatternBatch, IntegrationPattern objects or dicts
+        
+    Returns:
+        Structured ndarray with one record per pattern
+    """
+    _require_numpy()
+    batch = patterns if isinstance(patterns, PatternBatch) else PatternBatch(patterns)
+    columns = {}
+    for name in INT_FIELDS + FLOAT_FIELDS + FLAG_FIELDS:
+        columns[name] = batch.column(name)
+    for name in TEXT_FIELDS:
+        encoded = [json.dumps(value).encode("ascii") for value in batch.column(name)]
+        columns[name] = np.array(encoded, dtype=bytes) if encoded else np.array([], dtype="S1")
+    
+    dtype = [(name, column.dtype) for name, column in columns.items()]
+    records = np.empty(len(batch), dtype=dtype)
+    for name, column in columns.items():
+        records[name] = column
+    return records
+
+
+def save_npy(patterns: Iterable[Any], path: str):
+    """
+    Write patterns to a ``.npy`` pattern file.
+    
+    Args:
+        patterns: PatternBatch, IntegrationPattern objects or dicts
+        path: Destination path
+    """
+    np.save(path, to_records(patterns), allow_pickle=False)
+
+
+def load_npy(path: str, mmap: bool = True) -> PatternBatch:
+    """
+    Load a ``.npy`` pattern file as a PatternBatch.
+    
+    Args:
+        path: Source path
+        mmap: Memory-map the file instead of reading it into memory
+        
+    Returns:
+        PatternBatch over the file's columns
+    """
+    _require_numpy()
+    records = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+    if records.dtype.names is None or records.ndim != 1:
+        raise ValueError(f"{path}: expected a 1-d structured pattern array")
+    
+    available = set(records.dtype.names)
+    numeric = {
+        name: records[name] for name in INT_FIELDS + FLOAT_FIELDS + FLAG_FIELDS
+        if name in available
+    }
+    interned = {}
+    for name in INTERNED_FIELDS:
+        if name in available:
+            # One JSON decode per distinct value, not per row
+            values, inverse = np.unique(records[name], return_inverse=True)
+            interned[name] = (
+                inverse.astype(np.int32).ravel(),
+                [json.loads(value) for value in values]
+            )
+    objects = {}
+    for name in OBJECT_FIELDS:
+        if name in available:
+            column = records[name]
+            objects[name] = lambda column=column: [json.loads(value) for value in column]
+    return _assemble(len(records), numeric, interned, objects, path)
+
+
+# ============================================================================
+# ARROW / PARQUET
+# ============================================================================
+
+def _arrow_table(patterns: Iterable[Any]) -> Any:
+    """Arrow table for patterns (native types, JSON for structure/convergence_point)."""
+    batch = patterns if isinstance(patterns, PatternBatch) else PatternBatch(patterns)
+    arrays, names = [], []
+    for name in INT_FIELDS + FLOAT_FIELDS + FLAG_FIELDS:
+        column = batch.column(name)
+        mask = np.isnan(column) if name == "threshold" else None
+        arrays.append(pa.array(column, mask=mask))
+        names.append(name)
+    for name in INTERNED_FIELDS:
+        arrays.append(pa.array(batch.column(name), type=pa.string()).dictionary_encode())
+        names.append(name)
+    arrays.append(pa.array(batch.column("name"), type=pa.string()))
+    arrays.append(pa.array(batch.column("operators"), type=pa.list_(pa.string())))
+    names += ["name", "operators"]
+    for name in _JSON_FIELDS:
+        arrays.append(pa.array([json.dumps(value) for value in batch.column(name)], type=pa.string()))
+        names.append(name)
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def save_arrow(patterns: Iterable[Any], path: str):
+    """
+    Write patterns to an Arrow IPC or Parquet pattern file.
+    
+    Args:
+        patterns: PatternBatch, IntegrationPattern objects or dicts
+        path: Destination (``.parquet`` writes Parquet, otherwise Arrow IPC)
+    """
+    _require_numpy()
+    _require_pyarrow(path)
+    table = _arrow_table(patterns)
+    if path.endswith(PARQUET_SUFFIXES):
+        pq.write_table(table, path)
+    else:
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _decode_json(column: Any) -> List[Any]:
+    return [None if value is None else json.loads(value) for value in column.to_pylist()]
+
+
+def batch_from_arrow(table: Any, source: str = "<arrow>") -> PatternBatch:
+    """
+    Wrap an Arrow table's columns in a PatternBatch.
+    
+    Args:
+        table: ``pyarrow.Table`` with pattern columns
+        source: Name used in error messages
+        
+    Returns:
+        PatternBatch over the table's columns
+    """
+    _require_numpy()
+    available = set(table.column_names)
+    numeric = {}
+    for name in INT_FIELDS + FLOAT_FIELDS + FLAG_FIELDS:
+        if name not in available:
+            continue
+        column = table.column(name).combine_chunks()
+        if column.null_count:
+            if name != "threshold":
+                raise ValueError(f"{source}: column {name!r} contains nulls")
+            column = pc.fill_null(column.cast(pa.float64()), math.nan)
+        # Zero-copy for null-free primitive columns (bools are bit-packed)
+        numeric[name] = column.to_numpy(zero_copy_only=False)
+    
+    interned = {}
+    for name in INTERNED_FIELDS:
+        if name not in available:
+            continue
+        column = table.column(name).combine_chunks()
+        if not pa.types.is_dictionary(column.type):
+            column = column.dictionary_encode()
+        vocabulary = column.dictionary.to_pylist()
+        indices = column.indices
+        if indices.null_count:
+            indices = pc.fill_null(indices, len(vocabulary))
+            vocabulary.append(None)
+        interned[name] = (indices.to_numpy(zero_copy_only=False), vocabulary)
+    
+    objects = {}
+    for name in OBJECT_FIELDS:
+        if name not in available:
+            continue
+        column = table.column(name)
+        if name in _JSON_FIELDS and pa.types.is_string(column.type):
+            objects[name] = lambda column=column: _decode_json(column)
+        else:
+            objects[name] = column.to_pylist
+    return _assemble(table.num_rows, numeric, interned, objects, source)
+
+
+def load_arrow(path: str, mmap: bool = True) -> PatternBatch:
+    """
+    Load an Arrow IPC pattern file as a PatternBatch.
+    
+    Args:
+        path: Source path
+        mmap: Memory-map the file (numeric columns then stay on disk)
+        
+    Returns:
+        PatternBatch over the file's columns
+    """
+    _require_pyarrow(path)
+    source = pa.memory_map(path, "r") if mmap else pa.OSFile(path, "rb")
+    table = pa.ipc.open_file(source).read_all()
+    return batch_from_arrow(table, path)
+
+
+def load_parquet(path: str, mmap: bool = True) -> PatternBatch:
+    """
+    Load a Parquet pattern file as a PatternBatch.
+    
+    Args:
+        path: Source path
+        mmap: Memory-map the file while decoding
+        
+    Returns:
+        PatternBatch over the decoded columns
+    """
+    _require_pyarrow(path)
+    return batch_from_arrow(pq.read_table(path, memory_map=mmap), path)
+
+
+def load_patterns(path: str, mmap: bool = True) -> PatternBatch:
+    """
+    Load a columnar pattern file, choosing the reader by suffix.
+    
+    Args:
+        path: ``.npy``, ``.arrow``/``.feather``/``.ipc`` or ``.parquet`` file
+        mmap: Memory-map the file where the format allows it
+        
+    Returns:
+        PatternBatch over the file's columns
+    """
+    if path.endswith(NPY_SUFFIXES):
+        return load_npy(path, mmap)
+    if path.endswith(ARROW_SUFFIXES):
+        return load_arrow(path, mmap)
+    if path.endswith(PARQUET_SUFFIXES):
+        return load_parquet(path, mmap)
+    raise ValueError(f"Unknown columnar pattern file type: {path!r}")
+
+
+def is_columnar_path(path: str) -> bool:
+    """Whether ``path`` names a columnar pattern file (by suffix)."""
+    return path.endswith(NPY_SUFFIXES + ARROW_SUFFIXES + PARQUET_SUFFIXES)
@@ -5,33 +5,93 @@ The Integration Engine is the supreme orchestrator that binds the Three-Pillar
 Architecture (Phoenix, Hydrogenesi, The Third) into unified sovereignty.
 
 Capabilities:
-- Pattern validation against 12 Universal Laws
+- Pattern validation against 12 Universal Laws (single or bulk)
 - Cross-pillar transitions via LifeLightBifurcation
 - Pattern integration via ThreeFingerWaltz (with caching & telemetry)
 - Sovereignty verification
-- Full integration cycle execution
+- Full integration cycle execution (materialized or streamed)
+- Concurrent submit()/map() execution on a thread or process pool
 """
 
 from __future__ import annotations
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Any, Mapping, Optional, Tuple
 import logging
+import os
+import threading
+import weakref
 
 from code.universal.operators import LifeLightBifurcation, BifurcationVector
-from .universal_laws import UniversalLaws, LawStatus
+from .universal_laws import UniversalLaws, LawStatus, BulkValidation, IncrementalValidation, OVERALL_STATUSES
 from .meta_operators import ThreeFingerWaltz, WaltzPhase
 from .validator import IntegrationValidator, ValidationReport
-from .cache import CachedThreeFingerWaltz
-from .telemetry import InstrumentedThreeFingerWaltz
+from .cache import CachedThreeFingerWaltz, thaw
+from .telemetry import InstrumentedThreeFingerWaltz, TELEMETRY_MODES
+from .profiler import NULL_SPAN, SpanProfiler, traced
+from .hooks import HookRegistry, hooked
+from .allocations import AllocationTracker
+from .fingerprint import fingerprint_pattern
+from .streaming import chunked, iter_jsonl_batches, stream_integration_cycle
+from .retention import RetentionBuffer
 
+if TYPE_CHECKING:
+    from .persistent_cache import PersistentPatternCache
 
-@dataclass
+
+# Engine methods that can be dispatched through submit()/map()
+SUBMITTABLE_METHODS = ("validate", "integrate", "full_integration_cycle", "transition")
+EXECUTOR_KINDS = ("thread", "process")
+
+# Per-process engine used by process-pool workers (see _init_worker)
+_WORKER_ENGINE: Optional[IntegrationEngine] = None
+
+
+def _init_worker(config: Dict[str, Any]):
+    """Process-pool initializer: build this worker's engine from config."""
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = IntegrationEngine(**config)
+
+
+def _run_worker_task(method: str, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool task: run an engine method and return a picklable result."""
+    result = getattr(_WORKER_ENGINE, method)(*args, **kwargs)
+    # Cache hits are ChainMaps over read-only views; ship plain dicts
+    return thaw(result)
+
+
+# IntegrationPattern fields exposed as pattern keys (``to_dict()`` order)
+PATTERN_FIELDS = (
+    "name", "pillar", "mode", "structure", "recursion_depth",
+    "similarity_ratio", "converges", "convergence_point", "apex", "stable",
+    "stability_score", "embedding_ratio", "coherence", "operators",
+    "threshold", "threshold_managed", "invariant", "invariant_preserved",
+    "closed", "sovereignty",
+)
+_PATTERN_KEYS = frozenset(PATTERN_FIELDS)
+
+
+@dataclass(slots=True)
 class IntegrationPattern:
     """
     Cross-pillar integration pattern.
     
     Represents a pattern that can be validated, transitioned between pillars,
     and integrated into sovereign form.
+    
+    Instances are slotted (no per-instance ``__dict__``) and support
+    read-only mapping access to the PATTERN_FIELDS (``pattern["apex"]``,
+    ``pattern.get("coherence")``, ``"threshold" in pattern``), so the laws
+    and validators read them directly without ``to_dict()``. For millions
+    of patterns, see PatternBatch.
+    
+    ``fingerprint`` may hold a precomputed cache key for the pattern (see
+    ``compute_fingerprint``); the waltz cache then uses it instead of
+    re-serializing the pattern. Assigning any other field clears it; after
+    mutating a container field in place, recompute it.
+    
+    Field assignments are tracked so ``revalidate`` can re-run only the
+    laws that read the changed fields.
     """
     name: str
     pillar: str
@@ -53,6 +113,104 @@ class IntegrationPattern:
     invariant_preserved: bool = True
     closed: bool = False
     sovereignty: bool = False
+    fingerprint: Optional[str] = field(default=None, compare=False, repr=False)
+    # Incremental validation state (see revalidate)
+    _validation: Optional[IncrementalValidation] = field(
+        default=None, init=False, compare=False, repr=False
+    )
+    _changed: Optional[set] = field(default=None, init=False, compare=False, repr=False)
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name in _PATTERN_KEYS:
+            object.__setattr__(self, "fingerprint", None)
+            # Unset while __init__ is still assigning fields
+            changed = getattr(self, "_changed", None)
+            if changed is not None:
+                changed.add(name)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies and unpickled patterns start without validation state
+        state = {name: getattr(self, name) for name in PATTERN_FIELDS}
+        state["fingerprint"] = self.fingerprint
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_validation", None)
+        object.__setattr__(self, "_changed", None)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in _PATTERN_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in _PATTERN_KEYS
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Mapping-style field access (same keys as ``to_dict()``).
+        
+        Args:
+            key: Field name
+            default: Value for keys that are not pattern fields
+            
+        Returns:
+            Field value or ``default``
+        """
+        if key in _PATTERN_KEYS:
+            return getattr(self, key)
+        return default
+    
+    def keys(self) -> Tuple[str, ...]:
+        """Pattern keys, in ``to_dict()`` order."""
+        return PATTERN_FIELDS
+    
+    def revalidate(self, laws: UniversalLaws) -> Dict[str, Any]:
+        """
+        Validate against all 12 Universal Laws, incrementally.
+        
+        The first call runs every law; later calls re-run only the laws
+        that read fields assigned (or container fields mutated in place)
+        since the previous call, against the same ``laws``.
+        
+        Args:
+            laws: UniversalLaws instance to validate with
+            
+        Returns:
+            Validation results, identical to ``laws.validate_all``
+        """
+        state = self._validation
+        if state is None or state.laws is not laws:
+            state = IncrementalValidation(laws, self)
+            object.__setattr__(self, "_changed", set())
+            object.__setattr__(self, "_validation", state)
+            return state.report()
+        
+        with state.lock:
+            changed = self._changed
+            object.__setattr__(self, "_changed", set())
+            changed.update(state.mutated_fields())
+            if changed:
+                state.update({name: getattr(self, name) for name in changed})
+            else:
+                state.recomputed = 0
+            return state.report()
+    
+    def compute_fingerprint(self, mode: str = "sha256") -> str:
+        """
+        Compute and store the pattern's fingerprint.
+        
+        Args:
+            mode: Hash mode ("sha256", "blake2b" or "fast")
+            
+        Returns:
+            Hexadecimal fingerprint
+        """
+        self.fingerprint = fingerprint_pattern(self.to_dict(), mode)
+        return self.fingerprint
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert pattern to dictionary for validation."""
@@ -80,6 +238,28 @@ class IntegrationPattern:
         }
 
 
+def _add_counts(into: Dict[Any, int], counts: Dict[Any, int]):
+    """Add ``counts`` to ``into`` key by key."""
+    for key, count in counts.items():
+        into[key] = into.get(key, 0) + count
+
+
+class _OutcomeCounts(threading.local):
+    """
+    Per-thread validation and transition counters.
+    
+    Each thread increments its own dicts without a lock. On its first
+    count a thread registers its dicts as a shard, and readers sum the
+    shards (see IntegrationEngine._read_counts).
+    """
+    
+    def __init__(self, shards: List[Tuple[Any, Dict[str, int], Dict[Any, int]]], lock: threading.Lock):
+        self.validations: Dict[str, int] = {}
+        self.transitions: Dict[Tuple[str, str, str], int] = {}
+        with lock:
+            shards.append((weakref.ref(threading.current_thread()), self.validations, self.transitions))
+
+
 class IntegrationEngine:
     """
     Integration Engine - Supreme Orchestrating Intelligence.
@@ -96,6 +276,16 @@ class IntegrationEngine:
     
     The engine maintains sovereignty through triadic closure and ensures
     all patterns conform to Universal Laws.
+    
+    Concurrency: with the default reentrant waltz the engine is safe to call
+    from many threads (e.g. a threaded web server). Every call works on its
+    own local state; the shared caches, metrics and integrated-pattern list
+    are lock-protected. ``submit()``/``map()`` additionally run validate,
+    integrate and full_integration_cycle on a worker pool. A ``"process"``
+    pool sidesteps the GIL to use every core: each worker process builds
+    its own engine from this engine's configuration (share results between
+    them with a ``persistent_cache``), and integrated patterns are recorded
+    back on this engine as results arrive.
     """
     
     def __init__(
@@ -103,7 +293,23 @@ class IntegrationEngine:
         enable_cache: bool = True, 
         enable_telemetry: bool = True,
         cache_size: int = 128,
-        log_level: int = logging.INFO
+        log_level: int = logging.INFO,
+        single_shot: bool = False,
+        cache_max_bytes: Optional[int] = None,
+        hash_mode: str = "sha256",
+        persistent_cache: Optional[PersistentPatternCache] = None,
+        warm_start: int = 0,
+        workers: Optional[int] = None,
+        executor: str = "thread",
+        retain_patterns: Optional[int] = 1024,
+        retain_bytes: Optional[int] = None,
+        spill_path: Optional[str] = None,
+        lazy_validation: bool = False,
+        memoize_laws: bool = False,
+        incremental_validation: bool = False,
+        telemetry_mode: str = "standard",
+        profiler: Optional[SpanProfiler] = None,
+        hooks: Optional[HookRegistry] = None
     ):
         """
         Initialize Integration Engine with all subsystems.
@@ -113,32 +319,137 @@ class IntegrationEngine:
             enable_telemetry: Enable logging and metrics collection
             cache_size: Maximum cache size (if caching enabled)
             log_level: Logging level (if telemetry enabled)
+            single_shot: Restore the classic irreversible waltz (the
+                meta-operator completes once and then reports
+                ALREADY_COMPLETE). By default the waltz is reentrant so a
+                single engine can integrate pattern sets back to back.
+            cache_max_bytes: Optional byte budget for cached waltz results
+            hash_mode: Cache key hash mode ("sha256", "blake2b" or "fast")
+            persistent_cache: Optional on-disk cache shared across worker
+                processes (second level behind the in-process cache;
+                requires enable_cache)
+            warm_start: Number of newest persistent entries to preload
+            workers: Pool size for ``submit()``/``map()`` (default:
+                ``os.cpu_count()``); the pool is started on first use
+            executor: Pool kind, ``"thread"`` or ``"process"``
+            retain_patterns: Most recent integrated patterns to keep in
+                memory (None = unbounded); totals are always counted
+            retain_bytes: Optional byte cap for retained integrated patterns
+            spill_path: Optional JSONL file receiving evicted patterns
+            lazy_validation: Decide validation status with short-circuit
+                law evaluation (``UniversalLaws.validate_lazy``); the
+                per-law results are then computed only when accessed
+            memoize_laws: Memoize per-law results by the fields each law
+                reads (helps workloads re-validating pattern variants)
+            incremental_validation: Re-validate IntegrationPattern objects
+                incrementally, re-running only the laws that read fields
+                changed since their previous validation (each pattern then
+                keeps its field snapshots and law results, several KB, so
+                enable it for workloads re-validating long-lived patterns)
+            telemetry_mode: "standard" or "fast" (sampled, asynchronous
+                logging with a bounded overhead; see ``telemetry``)
+            profiler: Optional SpanProfiler recording engine, cache, waltz
+                phase and waltz spans (in-process calls only)
+            hooks: Hook registry to share (default: a new empty one);
+                hooks run around each stage in HOOK_STAGES and can be
+                attached or removed at any time (in-process calls only)
         """
-        self.universal_laws = UniversalLaws()
+        if executor not in EXECUTOR_KINDS:
+            raise ValueError(
+                f"Unknown executor {executor!r} (expected one of {EXECUTOR_KINDS})"
+            )
+        if telemetry_mode not in TELEMETRY_MODES:
+            raise ValueError(
+                f"Unknown telemetry mode {telemetry_mode!r} (expected one of {TELEMETRY_MODES})"
+            )
+        
+        self.universal_laws = UniversalLaws(memoize=memoize_laws)
         self.validator = IntegrationValidator()
         self._sovereign = False
-        self._integrated_patterns: List[Dict[str, Any]] = []
+        self._integrated_patterns = RetentionBuffer(
+            max_entries=retain_patterns, 
+            max_bytes=retain_bytes, 
+            spill_path=spill_path
+        )
         
         # Initialize meta-operator based on configuration
+        reentrant = not single_shot
         if enable_telemetry and enable_cache:
             self.meta_operator = InstrumentedThreeFingerWaltz(
                 cache_size=cache_size,
-                log_level=log_level
+                cache_max_bytes=cache_max_bytes,
+                hash_mode=hash_mode,
+                persistent_cache=persistent_cache,
+                warm_start=warm_start,
+                log_level=log_level,
+                telemetry_mode=telemetry_mode,
+                reentrant=reentrant
             )
         elif enable_cache:
-            self.meta_operator = CachedThreeFingerWaltz(cache_size=cache_size)
+            self.meta_operator = CachedThreeFingerWaltz(
+                cache_size=cache_size,
+                cache_max_bytes=cache_max_bytes,
+                hash_mode=hash_mode,
+                persistent_cache=persistent_cache,
+                warm_start=warm_start,
+                reentrant=reentrant
+            )
         elif enable_telemetry:
             # Telemetry without cache (cache_size=0 effectively disables it)
             self.meta_operator = InstrumentedThreeFingerWaltz(
                 cache_size=0,
-                log_level=log_level
+                log_level=log_level,
+                telemetry_mode=telemetry_mode,
+                reentrant=reentrant
             )
         else:
-            self.meta_operator = ThreeFingerWaltz()
+            self.meta_operator = ThreeFingerWaltz(reentrant=reentrant)
+        
+        self.profiler = profiler
+        self.meta_operator.profiler = profiler
+        self.hooks = hooks if hooks is not None else HookRegistry()
         
         self._cache_enabled = enable_cache
         self._telemetry_enabled = enable_telemetry
+        self._telemetry_mode = telemetry_mode
+        self._single_shot = single_shot
+        self._lazy_validation = lazy_validation
+        self._incremental_validation = incremental_validation
+        
+        # Worker pool (created lazily by submit())
+        self._workers = workers if workers is not None else (os.cpu_count() or 1)
+        self._executor_kind = executor
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        # Outcome counters (read by metrics collectors on demand): the hot
+        # path counts per thread, readers sum the shards under the lock and
+        # fold in those of exited threads
+        self._counts_lock = threading.Lock()
+        self._count_shards: List[Tuple[Any, Dict[str, int], Dict[Any, int]]] = []
+        self._counts = _OutcomeCounts(self._count_shards, self._counts_lock)
+        self._validation_counts: Dict[str, int] = dict.fromkeys(OVERALL_STATUSES, 0)
+        self._transition_counts: Dict[Tuple[str, str, str], int] = {}
+        # Process workers rebuild an equivalent engine from this config
+        self._worker_config = {
+            "enable_cache": enable_cache,
+            "enable_telemetry": enable_telemetry,
+            "cache_size": cache_size,
+            "log_level": log_level,
+            "single_shot": single_shot,
+            "cache_max_bytes": cache_max_bytes,
+            "hash_mode": hash_mode,
+            "persistent_cache": persistent_cache,
+            "warm_start": warm_start,
+            "lazy_validation": lazy_validation,
+            "memoize_laws": memoize_laws,
+            "incremental_validation": incremental_validation,
+            "telemetry_mode": telemetry_mode,
+            # Results are recorded by the parent engine
+            "retain_patterns": 0,
+        }
         
+    @traced("engine.validate")
+    @hooked("validate")
     def validate(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate pattern against all 12 Universal Laws.
@@ -147,22 +458,76 @@ class IntegrationEngine:
             pattern: Pattern to validate (dict or IntegrationPattern)
             
         Returns:
-            Validation result with law checks and status
+            Validation result with law checks and status (with
+            ``lazy_validation`` the ``validation`` entry is a LawVerdict
+            and there is no top-level ``message``: building it evaluates
+            every skipped law, so read ``result["validation"].message``
+            when needed)
         """
-        # Convert IntegrationPattern to dict if needed
-        if isinstance(pattern, IntegrationPattern):
-            pattern = pattern.to_dict()
+        # Validate against Universal Laws (pattern objects are read
+        # directly; tracked ones only re-run the laws whose fields changed)
+        if (
+            self._incremental_validation
+            and not self._lazy_validation
+            and isinstance(pattern, IntegrationPattern)
+        ):
+            result = pattern.revalidate(self.universal_laws)
+        elif self._lazy_validation:
+            result = self.universal_laws.validate_lazy(pattern)
+        else:
+            result = self.universal_laws.validate_all(pattern)
         
-        # Validate against Universal Laws
-        result = self.universal_laws.validate_all(pattern)
+        status = result["status"]
+        self._count_validations((status,))
         
+        if self._lazy_validation:
+            return {
+                "status": status,
+                "validation": result,
+                "pattern_name": pattern.get("name", "unknown")
+            }
         return {
-            "status": result["status"],
+            "status": status,
             "message": result["message"],
             "validation": result,
             "pattern_name": pattern.get("name", "unknown")
         }
     
+    @traced("engine.validate_many")
+    @hooked("validate_many")
+    def validate_many(self, patterns: List[Dict[str, Any]], backend: Optional[str] = None) -> BulkValidation:
+        """
+        Validate many patterns at once (compact status matrix).
+        
+        Args:
+            patterns: Patterns to validate (dicts, IntegrationPattern
+                      objects or a PatternBatch)
+            backend: "numpy" or "python" (default: NumPy when installed)
+            
+        Returns:
+            BulkValidation; call ``details(i)`` for one pattern's full result
+        """
+        bulk = self.universal_laws.validate_many(patterns, backend=backend)
+        _add_counts(self._counts.validations, bulk.status_counts())
+        return bulk
+    
+    def validate_file(self, path: str, backend: Optional[str] = None, mmap: bool = True) -> BulkValidation:
+        """
+        Bulk-validate a columnar pattern file without per-row objects.
+        
+        Args:
+            path: ``.npy``, Arrow IPC or Parquet pattern file (see ``columnar``)
+            backend: "numpy" or "python" (default: NumPy when installed)
+            mmap: Memory-map the file where the format allows it
+            
+        Returns:
+            BulkValidation over the file's patterns
+        """
+        from .columnar import load_patterns
+        return self.validate_many(load_patterns(path, mmap=mmap), backend=backend)
+    
+    @traced("engine.transition")
+    @hooked("transition")
     def transition(
         self, 
         pattern: Dict[str, Any], 
@@ -229,6 +594,7 @@ class IntegrationEngine:
                 "transitioned": True
             }
             
+            self._count_transition(from_pillar, to_pillar, "SUCCESS")
             return {
                 "status": "SUCCESS",
                 "message": f"✓ Transition {from_pillar} → {to_pillar} via {bifurcation_result['vector']} vector",
@@ -238,6 +604,7 @@ class IntegrationEngine:
                 "pattern": transitioned_pattern
             }
         except Exception as e:
+            self._count_transition(from_pillar, to_pillar, "FAILED")
             return {
                 "status": "FAILED",
                 "message": f"✗ Transition failed: {str(e)}",
@@ -246,7 +613,52 @@ class IntegrationEngine:
                 "error": str(e)
             }
     
-    def integrate(self, patterns: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _span(self, name: str):
+        """Span context of the profiler (a no-op without one)."""
+        profiler = self.profiler
+        return NULL_SPAN if profiler is None else profiler.span(name)
+    
+    def _count_validations(self, outcomes: Iterable[Any]):
+        """Count validation statuses (strings or result dicts)."""
+        counts = self._counts.validations
+        for outcome in outcomes:
+            status = outcome if isinstance(outcome, str) else outcome["status"]
+            counts[status] = counts.get(status, 0) + 1
+    
+    def _count_transition(self, from_pillar: str, to_pillar: str, status: str):
+        counts = self._counts.transitions
+        key = (from_pillar, to_pillar, status)
+        counts[key] = counts.get(key, 0) + 1
+    
+    def _read_counts(self) -> Tuple[Dict[str, int], Dict[Tuple[str, str, str], int]]:
+        """
+        Sum the per-thread outcome counters.
+        
+        Returns:
+            Validation counts and transition counts
+        """
+        with self._counts_lock:
+            live = []
+            for shard in self._count_shards:
+                thread = shard[0]()
+                if thread is None or not thread.is_alive():
+                    _add_counts(self._validation_counts, shard[1])
+                    _add_counts(self._transition_counts, shard[2])
+                else:
+                    live.append(shard)
+            self._count_shards[:] = live
+            validations = dict(self._validation_counts)
+            transitions = dict(self._transition_counts)
+            for _, shard_validations, shard_transitions in live:
+                # dict.copy() is atomic, so a concurrent increment is
+                # either fully in or out of this read
+                _add_counts(validations, shard_validations.copy())
+                _add_counts(transitions, shard_transitions.copy())
+        return validations, transitions
+    
+    @traced("engine.integrate")
+    @hooked("integrate")
+    def integrate(self, patterns: List[Dict[str, Any]], batch: bool = False) -> Mapping[str, Any]:
         """
         Unify multiple patterns via ThreeFingerWaltz.
         
@@ -255,10 +667,16 @@ class IntegrationEngine:
         Uses caching and telemetry if enabled.
         
         Args:
-            patterns: List of patterns to integrate
+            patterns: List of patterns to integrate (dicts or
+                      IntegrationPattern objects)
+            batch: Integrate every pattern in a single column-wise pass
+                   (result carries per-pattern ``results`` and ``aggregate``)
             
         Returns:
-            Integration result with unified pattern
+            Integration result with unified pattern, as a read-only
+            Mapping: cache hits are views over the shared frozen cache
+            entry (see CachedThreeFingerWaltz), so use ``cache.thaw`` for
+            a mutable or JSON-serializable copy
         """
         if not patterns:
             return {
@@ -267,14 +685,44 @@ class IntegrationEngine:
             }
         
         # Execute waltz via meta-operator (handles caching/telemetry internally)
-        result = self.meta_operator(patterns)
+        result = self.meta_operator(patterns, batch=batch)
         
-        # Store integrated pattern
+        # Store integrated pattern(s)
         if result.get("status") == "WALTZ_COMPLETE":
-            self._integrated_patterns.append(result["pattern"])
+            self._record_integration(result, batch)
         
         return result
     
+    def _record_integration(self, result: Dict[str, Any], batch: bool):
+        """
+        Append a completed waltz result to the integrated patterns.
+        
+        Args:
+            result: WALTZ_COMPLETE waltz result
+            batch: Result came from a batch waltz (record every pattern)
+        """
+        with self._lock:
+            if batch:
+                self._integrated_patterns.extend(result["results"])
+            else:
+                self._integrated_patterns.append(result["pattern"])
+    
+    @traced("engine.generate_report")
+    @hooked("generate_report")
+    def generate_report(self, pattern: Dict[str, Any]) -> ValidationReport:
+        """
+        Generate a full validation report for an integrated pattern.
+        
+        Not called by full_integration_cycle (see hooks.HOOK_STAGES).
+        
+        Args:
+            pattern: Pattern to report on
+            
+        Returns:
+            ValidationReport from the integration validator
+        """
+        return self.validator.generate_report(pattern)
+    
     def verify_sovereignty(self) -> Dict[str, Any]:
         """
         Verify system sovereignty status.
@@ -289,12 +737,14 @@ class IntegrationEngine:
         has_laws = self.universal_laws is not None
         has_validator = self.validator is not None
         
-        # Check if any patterns have been integrated
-        has_integrated = len(self._integrated_patterns) > 0
+        # Check if any patterns have been integrated (retained or not)
+        integrated_total = self._integrated_patterns.total
+        has_integrated = integrated_total > 0
         
         # Determine sovereignty status
         if has_laws and has_validator:
-            self._sovereign = True
+            with self._lock:
+                self._sovereign = True
             
             if has_integrated:
                 message = "✓ Integration Engine: SOVEREIGN (with integrated patterns)"
@@ -308,7 +758,7 @@ class IntegrationEngine:
                 "subsystems": {
                     "universal_laws": has_laws,
                     "validator": has_validator,
-                    "integrated_patterns": len(self._integrated_patterns)
+                    "integrated_patterns": integrated_total
                 }
             }
         else:
@@ -319,11 +769,17 @@ class IntegrationEngine:
                 "subsystems": {
                     "universal_laws": has_laws,
                     "validator": has_validator,
-                    "integrated_patterns": len(self._integrated_patterns)
+                    "integrated_patterns": integrated_total
                 }
             }
     
-    def full_integration_cycle(self, patterns: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @traced("engine.full_integration_cycle")
+    @hooked("full_integration_cycle")
+    def full_integration_cycle(
+        self, 
+        patterns: List[Dict[str, Any]], 
+        batch: bool = False
+    ) -> Dict[str, Any]:
         """
         Execute complete integration workflow.
         
@@ -333,8 +789,11 @@ class IntegrationEngine:
         3. Validate integrated result
         4. Verify sovereignty
         
+        Step 3 uses ``validator.quick_check`` (see hooks.HOOK_STAGES).
+        
         Args:
             patterns: List of patterns to integrate
+            batch: Integrate every pattern in a single waltz pass
             
         Returns:
             Complete integration cycle results
@@ -370,7 +829,7 @@ class IntegrationEngine:
             return results
         
         # Step 2: Execute Three-Finger Waltz
-        waltz_result = self.integrate(patterns)
+        waltz_result = self.integrate(patterns, batch=batch)
         results["steps"].append({
             "step": "2",
             "action": "three_finger_waltz",
@@ -385,11 +844,13 @@ class IntegrationEngine:
         
         # Step 3: Validate integrated pattern
         integrated_pattern = waltz_result["pattern"]
-        integrated_validation = self.validator.generate_report(integrated_pattern)
+        # Only status/message/score are reported, so skip the full report
+        with self._span("validator.quick_check"):
+            integrated_validation = self.validator.quick_check(integrated_pattern)
         results["steps"].append({
             "step": "3",
             "action": "validate_integrated",
-            "result": integrated_validation.status
+            "result": integrated_validation["status"]
         })
         
         # Step 4: Verify sovereignty
@@ -401,7 +862,7 @@ class IntegrationEngine:
         })
         
         # Final status
-        if sovereignty["status"] == "SOVEREIGN" and integrated_validation.status in ["SOVEREIGN", "STABLE"]:
+        if sovereignty["status"] == "SOVEREIGN" and integrated_validation["status"] in ["SOVEREIGN", "STABLE"]:
             results["status"] = "COMPLETE"
             results["message"] = "✓ Full integration cycle complete - Sovereignty achieved"
         else:
@@ -410,15 +871,68 @@ class IntegrationEngine:
         
         results["validations"] = validation_results
         results["waltz"] = waltz_result
-        results["integrated_validation"] = {
-            "status": integrated_validation.status,
-            "message": integrated_validation.message,
-            "score": integrated_validation.overall_score
-        }
+        results["integrated_validation"] = integrated_validation
         results["sovereignty"] = sovereignty
         
         return results
     
+    def stream_integration_cycle(
+        self, 
+        batches: Iterable[List[Dict[str, Any]]], 
+        batch: bool = False, 
+        fail_fast: bool = True, 
+        include_validations: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the integration workflow over a stream of pattern batches.
+        
+        Yields one ``full_integration_cycle`` result per batch (tagged with
+        ``batch_index``/``batch_size``) without materializing the input or
+        accumulating results.
+        
+        Args:
+            batches: Iterable of pattern lists
+            batch: Integrate every pattern of a batch in one waltz pass
+            fail_fast: Stop after the first batch that fails validation
+            include_validations: Keep per-pattern law results in each result
+            
+        Returns:
+            Iterator over per-batch cycle results
+        """
+        return stream_integration_cycle(
+            self, batches, 
+            batch=batch, 
+            fail_fast=fail_fast, 
+            include_validations=include_validations
+        )
+    
+    def stream_integration_file(
+        self, 
+        path: str, 
+        batch_size: int = 3, 
+        **kwargs: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream integration cycles over a JSONL or columnar pattern dump.
+        
+        Args:
+            path: JSONL file (``.gz`` supported; see ``iter_jsonl_batches``)
+                  or a columnar ``.npy``/Arrow/Parquet file (rows are
+                  materialized one batch at a time)
+            batch_size: Patterns per batch for one-pattern-per-line and
+                        columnar files
+            **kwargs: Options for ``stream_integration_cycle``
+            
+        Returns:
+            Iterator over per-batch cycle results
+        """
+        from .columnar import is_columnar_path, load_patterns
+        if is_columnar_path(path):
+            batches = chunked(load_patterns(path), batch_size)
+        else:
+            batches = iter_jsonl_batches(path, batch_size)
+        return self.stream_integration_cycle(batches, **kwargs)
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Get current engine status.
@@ -428,7 +942,8 @@ class IntegrationEngine:
         """
         status = {
             "sovereign": self._sovereign,
-            "integrated_patterns": len(self._integrated_patterns),
+            "integrated_patterns": self._integrated_patterns.total,
+            "retention": self._integrated_patterns.stats(),
             "subsystems": {
                 "universal_laws": self.universal_laws is not None,
                 "validator": self.validator is not None,
@@ -436,7 +951,16 @@ class IntegrationEngine:
             },
             "features": {
                 "cache_enabled": self._cache_enabled,
-                "telemetry_enabled": self._telemetry_enabled
+                "telemetry_enabled": self._telemetry_enabled,
+                "telemetry_mode": self._telemetry_mode,
+                "single_shot": self._single_shot,
+                "lazy_validation": self._lazy_validation,
+                "incremental_validation": self._incremental_validation
+            },
+            "pool": {
+                "executor": self._executor_kind,
+                "workers": self._workers,
+                "running": self._executor is not None
             }
         }
         
@@ -467,7 +991,177 @@ class IntegrationEngine:
         if hasattr(self.meta_operator, 'cache_stats'):
             return self.meta_operator.cache_stats()
         return {}
+    
+    def get_allocation_stats(self) -> Dict[str, Any]:
+        """
+        Get per-stage allocation statistics if an AllocationTracker is attached.
+        
+        Returns:
+            ``AllocationTracker.summary()`` of the first attached tracker,
+            or empty dict
+        """
+        trackers = self.hooks.find(AllocationTracker)
+        return trackers[0].summary() if trackers else {}
+    
+    def get_validation_counts(self) -> Dict[str, int]:
+        """
+        Get the number of patterns validated per overall status.
+        
+        Counts ``validate``, ``validate_many`` and ``validate_file`` calls
+        (including the validations of full integration cycles).
+        
+        Returns:
+            Dictionary mapping each status to its count
+        """
+        return self._read_counts()[0]
+    
+    def get_transition_counts(self) -> Dict[Tuple[str, str, str], int]:
+        """
+        Get the number of transitions per outcome.
+        
+        Returns:
+            Dictionary mapping (from_pillar, to_pillar, status) to its count
+        """
+        return self._read_counts()[1]
 
+    
+    def _get_executor(self) -> Executor:
+        """
+        Return the worker pool, starting it on first use.
+        
+        Returns:
+            ThreadPoolExecutor or ProcessPoolExecutor
+        """
+        with self._lock:
+            if self._executor is None:
+                if self._single_shot:
+                    raise RuntimeError(
+                        "Worker pool requires the reentrant waltz (single_shot=False)"
+                    )
+                if self._executor_kind == "process":
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self._workers,
+                        initializer=_init_worker,
+                        initargs=(self._worker_config,)
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._workers,
+                        thread_name_prefix="integration-engine"
+                    )
+            return self._executor
+    
+    def submit(self, method: str, *args: Any, **kwargs: Any) -> Future:
+        """
+        Run an engine method on the worker pool.
+        
+        Args:
+            method: One of SUBMITTABLE_METHODS
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+            
+        Returns:
+            Future resolving to the method's result dict
+        """
+        if method not in SUBMITTABLE_METHODS:
+            raise ValueError(
+                f"Cannot submit {method!r} (expected one of {SUBMITTABLE_METHODS})"
+            )
+        
+        executor = self._get_executor()
+        if self._executor_kind == "thread":
+            return executor.submit(getattr(self, method), *args, **kwargs)
+        
+        # Process workers have their own engine; record integrations here
+        # before the caller's future resolves.
+        outer: Future = Future()
+        inner = executor.submit(_run_worker_task, method, args, kwargs)
+        batch = kwargs.get("batch", args[1] if len(args) > 1 else False)
+        
+        def _relay(done: Future):
+            try:
+                result = done.result()
+                self._absorb_worker_result(method, result, batch)
+            except BaseException as e:
+                outer.set_exception(e)
+            else:
+                outer.set_result(result)
+        
+        inner.add_done_callback(_relay)
+        return outer
+    
+    def _absorb_worker_result(self, method: str, result: Dict[str, Any], batch: bool):
+        """
+        Mirror a process worker's integration onto this engine.
+        
+        Args:
+            method: Method the worker ran
+            result: Worker result
+            batch: Whether the waltz ran in batch mode
+        """
+        if method == "validate":
+            self._count_validations([result])
+            return
+        if method == "transition":
+            self._count_transition(result["from_pillar"], result["to_pillar"], result["status"])
+            return
+        if method == "integrate":
+            if result.get("status") == "WALTZ_COMPLETE":
+                self._record_integration(result, batch)
+            return
+        if method != "full_integration_cycle":
+            return
+        
+        # A waltz result's "sovereignty" is a flag; only cycles carry the
+        # sovereignty check as a mapping.
+        self._count_validations(result.get("validations", ()))
+        waltz_result = result.get("waltz", {})
+        if waltz_result.get("status") == "WALTZ_COMPLETE":
+            self._record_integration(waltz_result, batch)
+        if result.get("sovereignty", {}).get("sovereign"):
+            with self._lock:
+                self._sovereign = True
+    
+    def map(self, method: str, items: Iterable[Any], **kwargs: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Run an engine method over many inputs on the worker pool.
+        
+        All items are submitted up front; results are yielded in input
+        order as they become available.
+        
+        Args:
+            method: One of SUBMITTABLE_METHODS
+            items: Inputs, each passed as the method's first argument
+                   (a pattern for validate and transition, a pattern
+                   list otherwise)
+            **kwargs: Keyword arguments applied to every call
+            
+        Returns:
+            Iterator over result dicts
+        """
+        futures = [self.submit(method, item, **kwargs) for item in items]
+        return (future.result() for future in futures)
+    
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the worker pool (a later submit() starts a new one) and
+        flush asynchronous telemetry logging.
+        
+        Args:
+            wait: Block until pending tasks finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        if isinstance(self.meta_operator, InstrumentedThreeFingerWaltz):
+            self.meta_operator.close()
+    
+    def __enter__(self) -> IntegrationEngine:
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.shutdown()
 
 def initialize_integration_engine() -> IntegrationEngine:
     """
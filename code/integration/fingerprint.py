@@ -0,0 +1,153 @@
+"""
+Pattern Fingerprinting for the Integration Engine
+
+Provides cheap, canonical cache keys for pattern lists. Patterns are
+hashed one at a time into a single running digest, and patterns that
+carry a precomputed fingerprint (e.g. IntegrationPattern) are not
+re-serialized at all.
+
+Hash modes:
+- "sha256":  canonical JSON + SHA-256 (default, dependency-free)
+- "blake2b": canonical JSON + 128-bit BLAKE2b
+- "fast":    non-cryptographic; uses orjson / xxhash when installed and
+             falls back to canonical JSON + 128-bit BLAKE2b otherwise
+"""
+
+from __future__ import annotations
+from collections.abc import Mapping
+from typing import Any, Callable, List
+import hashlib
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+
+
+HASH_MODES = ("sha256", "blake2b", "fast")
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def _default(obj: Any) -> Any:
+    """JSON fallback for values the encoder does not know."""
+    fingerprint = getattr(obj, "fingerprint", None)
+    if isinstance(fingerprint, str):
+        return f"fingerprint::{fingerprint}"
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    return str(obj)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Canonical (sorted-key, compact) JSON encoding."""
+    return json.dumps(
+        obj, sort_keys=True, default=_default, separators=(",", ":")
+    ).encode()
+
+
+def _dumps_fast(obj: Any) -> bytes:
+    """Canonical encoding via orjson, falling back to the json module."""
+    if orjson is None:
+        return _dumps_json(obj)
+    try:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    except (TypeError, orjson.JSONEncodeError):
+        # e.g. integers beyond 64 bits or mixed-type keys
+        return _dumps_json(obj)
+
+
+def _hasher_factory(mode: str) -> Callable[[], Any]:
+    """Return a constructor for the incremental hasher of ``mode``."""
+    if mode == "sha256":
+        return hashlib.sha256
+    if mode == "blake2b":
+        return lambda: hashlib.blake2b(digest_size=16)
+    if mode == "fast":
+        if xxhash is not None:
+            return xxhash.xxh3_128
+        return lambda: hashlib.blake2b(digest_size=16)
+    raise ValueError(f"Unknown hash mode {mode!r} (expected one of {HASH_MODES})")
+
+
+class PatternFingerprinter:
+    """
+    Incremental fingerprinting of pattern lists.
+    
+    Each pattern is encoded canonically and fed into one running digest
+    (length-prefixed, so pattern boundaries are unambiguous). Objects with
+    a ``fingerprint`` attribute contribute that string directly.
+    """
+    
+    def __init__(self, mode: str = "sha256"):
+        """
+        Initialize fingerprinter.
+        
+        Args:
+            mode: Hash mode ("sha256", "blake2b" or "fast")
+        """
+        self.mode = mode
+        self._new_hasher = _hasher_factory(mode)
+        self._dumps = _dumps_fast if mode == "fast" else _dumps_json
+    
+    def fingerprint(self, pattern: Any) -> str:
+        """
+        Fingerprint a single pattern.
+        
+        Args:
+            pattern: Pattern dict (or object with ``to_dict()``)
+            
+        Returns:
+            Hexadecimal digest
+        """
+        hasher = self._new_hasher()
+        hasher.update(self._dumps(pattern))
+        return hasher.hexdigest()
+    
+    def key(self, patterns: List[Any], namespace: str = "") -> str:
+        """
+        Fingerprint a list of patterns as one cache key.
+        
+        Args:
+            patterns: Patterns to fingerprint
+            namespace: Optional key prefix separating result kinds
+            
+        Returns:
+            Hexadecimal digest
+        """
+        hasher = self._new_hasher()
+        hasher.update(namespace.encode())
+        for pattern in patterns:
+            precomputed = getattr(pattern, "fingerprint", None)
+            if isinstance(precomputed, str):
+                chunk = b"P" + precomputed.encode()
+            else:
+                chunk = b"J" + self._dumps(pattern)
+            hasher.update(len(chunk).to_bytes(8, "little"))
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+
+def fingerprint_pattern(pattern: Any, mode: str = "sha256") -> str:
+    """
+    Convenience wrapper around ``PatternFingerprinter.fingerprint``.
+    
+    Args:
+        pattern: Pattern to fingerprint
+        mode: Hash mode
+        
+    Returns:
+        Hexadecimal digest
+    """
+    return PatternFingerprinter(mode).fingerprint(pattern)
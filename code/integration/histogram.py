@@ -0,0 +1,411 @@
+"""
+Streaming Histograms for Telemetry
+
+Fixed-memory latency histograms used by WaltzMetrics:
+- LogHistogram: HDR-style log-bucketed histogram. Each power of two is
+  split into SUB_BUCKETS linear sub-buckets, so quantiles are reported
+  within 1/(2 * SUB_BUCKETS) (~1.6%) relative error. Count, sum, min and
+  max are exact. Recording is O(1), and memory and quantile queries are
+  bounded by the number of buckets, not by the number of samples.
+- LogHistogram.record_many buckets batches with NumPy when it is
+  installed (same buckets as the pure-Python loop).
+- RollingHistogram: a ring of per-slot LogHistograms, merged on demand
+  into rolling windows (1m/5m/15m by default); slots leaving the ring are
+  folded into an all-time histogram. A sample is recorded into one slot
+  only. Window edges are accurate to one slot (10 seconds).
+"""
+
+from __future__ import annotations
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+import math
+import time
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+
+SUB_BUCKETS = 32
+
+# Values are clamped to this range for bucketing (min/max stay exact)
+MIN_VALUE = 1e-9
+MAX_VALUE = 1e6
+
+DEFAULT_QUANTILES = (50, 90, 99)
+DEFAULT_WINDOWS = (60, 300, 900)
+
+
+_frexp = math.frexp
+_SCALE = 2 * SUB_BUCKETS
+
+# Batches at least this long are bucketed with NumPy when available
+_NUMPY_MIN_BATCH = 32
+
+
+# A value with mantissa m in [0.5, 1) and exponent e lands in bucket
+# e * SUB_BUCKETS + int(m * 2 * SUB_BUCKETS), i.e. sub-bucket
+# int((m - 0.5) * 2 * SUB_BUCKETS) of octave e + 1 (see _bucket_midpoint)
+
+def _bucket_midpoint(index: int) -> float:
+    """Representative (midpoint) value of a bucket."""
+    octave, sub = divmod(index, SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub + 0.5) / _SCALE, octave - 1)
+
+
+def window_label(seconds: int) -> str:
+    """Label of a rolling window (60 -> "1m", 30 -> "30s")."""
+    return f"{seconds // 60}m" if seconds % 60 == 0 else f"{seconds}s"
+
+
+class LogHistogram:
+    """
+    Log-bucketed histogram of non-negative values (e.g. durations).
+    
+    Buckets are stored sparsely (only non-empty ones) and are bounded by
+    the clamped value range, so memory does not grow with the sample
+    count.
+    """
+    
+    __slots__ = ("counts", "count", "total", "min", "max")
+    
+    def __init__(self):
+        """Initialize empty histogram."""
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def record(self, value: float):
+        """
+        Record one value.
+        
+        Args:
+            value: Non-negative sample
+        """
+        if MIN_VALUE <= value <= MAX_VALUE:
+            mantissa, exponent = _frexp(value)
+        else:
+            mantissa, exponent = _frexp(min(max(value, MIN_VALUE), MAX_VALUE))
+        index = exponent * SUB_BUCKETS + int(mantissa * _SCALE)
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def record_many(self, values: Sequence[float]):
+        """
+        Record several values (a tight loop; cheaper than ``record`` each).
+        
+        Args:
+            values: Non-negative samples
+        """
+        if not values:
+            return
+        counts = self.counts
+        get = counts.get
+        if np is not None and len(values) >= _NUMPY_MIN_BATCH:
+            samples = np.asarray(values, dtype=np.float64)
+            mantissas, exponents = np.frexp(
+                np.minimum(np.maximum(samples, MIN_VALUE), MAX_VALUE)
+            )
+            indexes = exponents.astype(np.int64) * SUB_BUCKETS + (mantissas * _SCALE).astype(np.int64)
+            base = int(indexes.min())
+            binned = np.bincount(indexes - base)
+            for offset in np.flatnonzero(binned).tolist():
+                index = base + offset
+                counts[index] = get(index, 0) + int(binned[offset])
+            self.count += len(values)
+            self.total += float(samples.sum())
+            self.min = min(self.min, float(samples.min()))
+            self.max = max(self.max, float(samples.max()))
+            return
+        else:
+            for value in values:
+                if MIN_VALUE <= value <= MAX_VALUE:
+                    mantissa, exponent = _frexp(value)
+                else:
+                    mantissa, exponent = _frexp(min(max(value, MIN_VALUE), MAX_VALUE))
+                index = exponent * SUB_BUCKETS + int(mantissa * _SCALE)
+                counts[index] = get(index, 0) + 1
+        self.count += len(values)
+        self.total += math.fsum(values)
+        self.min = min(self.min, min(values))
+        self.max = max(self.max, max(values))
+    
+    def merge(self, other: LogHistogram):
+        """
+        Add another histogram's samples to this one.
+        
+        Args:
+            other: Histogram to merge in
+        """
+        counts = self.counts
+        for index, count in other.counts.items():
+            counts[index] = counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    @property
+    def mean(self) -> float:
+        """Exact mean (0 when empty)."""
+        return self.total / self.count if self.count else 0.0
+    
+    def percentile(self, q: float) -> float:
+        """
+        Approximate percentile.
+        
+        Args:
+            q: Percentile in [0, 100]
+            
+        Returns:
+            Bucket midpoint holding the q-th percentile, clamped to the
+            exact min/max (0 when empty)
+        """
+        return self.percentiles((q,))[q]
+    
+    def percentiles(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[float, float]:
+        """
+        Several percentiles in one pass over the buckets.
+        
+        Args:
+            quantiles: Percentiles in [0, 100]
+            
+        Returns:
+            Dictionary mapping each percentile to its value
+        """
+        if not self.count:
+            return {q: 0.0 for q in quantiles}
+        
+        targets = sorted((max(1, math.ceil(q / 100.0 * self.count)), q) for q in quantiles)
+        results = {}
+        position = 0
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            while position < len(targets) and targets[position][0] <= seen:
+                value = min(max(_bucket_midpoint(index), self.min), self.max)
+                results[targets[position][1]] = value
+                position += 1
+            if position == len(targets):
+                break
+        return results
+    
+    def summary(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, float]:
+        """
+        Count, mean, percentiles and max.
+        
+        Args:
+            quantiles: Percentiles to report (keys ``p50``, ``p90``, ...)
+            
+        Returns:
+            Summary dictionary
+        """
+        summary = {"count": self.count, "mean": self.mean}
+        for q, value in self.percentiles(quantiles).items():
+            summary[f"p{q:g}"] = value
+        summary["max"] = self.max if self.count else 0.0
+        return summary
+    
+    def bucket_counts(self, bounds: Sequence[float]) -> List[int]:
+        """
+        Cumulative sample counts at fixed upper bounds (Prometheus ``le``).
+        
+        Samples are placed at their bucket midpoint, so counts near a bound
+        carry the histogram's relative error; bounds at or above the exact
+        max count every sample.
+        
+        Args:
+            bounds: Ascending upper bounds
+            
+        Returns:
+            Number of samples <= each bound
+        """
+        indexes = sorted(self.counts)
+        cumulative = []
+        position = 0
+        seen = 0
+        for bound in bounds:
+            if bound >= self.max:
+                cumulative.append(self.count)
+                continue
+            while position < len(indexes) and _bucket_midpoint(indexes[position]) <= bound:
+                seen += self.counts[indexes[position]]
+                position += 1
+            cumulative.append(seen)
+        return cumulative
+    
+    def reset(self):
+        """Drop all samples."""
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+
+class RollingHistogram:
+    """
+    All-time histogram plus rolling-window histograms.
+    
+    Samples are buffered and folded into the histogram of the current
+    time slot in batches (at most FLUSH_SIZE pending values), so a record
+    costs a slot check and a list append. A window query merges the slots
+    it covers, so its cost is bounded by the number of slots; the
+    all-time histogram is the retired slots plus the live ones.
+    
+    Not thread-safe; WaltzMetrics guards it with its lock.
+    """
+    
+    FLUSH_SIZE = 256
+    
+    def __init__(
+        self,
+        windows: Sequence[int] = DEFAULT_WINDOWS,
+        slot_seconds: int = 10,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize rolling histogram.
+        
+        Args:
+            windows: Window lengths in seconds
+            slot_seconds: Slot width (window edge resolution)
+            clock: Monotonic time source in seconds
+        """
+        self.windows = tuple(windows)
+        self.slot_seconds = slot_seconds
+        self.clock = clock
+        self._capacity = math.ceil(max(self.windows) / slot_seconds)
+        self._slots: Deque[Tuple[int, LogHistogram]] = deque()
+        self._retired = LogHistogram()
+        self._current_slot: Optional[int] = None
+        self._pending: List[float] = []
+    
+    def _slot(self) -> int:
+        return int(self.clock() // self.slot_seconds)
+    
+    def _flush(self):
+        """Fold buffered values into the current slot's histogram."""
+        if self._pending:
+            self._slots[-1][1].record_many(self._pending)
+            self._pending.clear()
+    
+    def _open_slot(self, slot: int):
+        """Start a new current slot, retiring the oldest beyond capacity."""
+        self._flush()
+        slots = self._slots
+        while len(slots) >= self._capacity:
+            self._retired.merge(slots.popleft()[1])
+        slots.append((slot, LogHistogram()))
+        self._current_slot = slot
+    
+    def record(self, value: float, now: Optional[float] = None):
+        """
+        Record one value.
+        
+        Args:
+            value: Non-negative sample
+            now: Clock reading of the sample (saves a clock call when the
+                 caller records several histograms at once); readings older
+                 than the current slot count towards the current slot
+        """
+        slot = int((self.clock() if now is None else now) // self.slot_seconds)
+        if self._current_slot is None or slot > self._current_slot:
+            self._open_slot(slot)
+        pending = self._pending
+        pending.append(value)
+        if len(pending) >= self.FLUSH_SIZE:
+            self._flush()
+    
+    def record_many(self, values: Sequence[float], now: Optional[float] = None):
+        """
+        Record several values taken in the same time slot.
+        
+        Args:
+            values: Non-negative samples
+            now: Clock reading of the samples (see ``record``)
+        """
+        slot = int((self.clock() if now is None else now) // self.slot_seconds)
+        if self._current_slot is None or slot > self._current_slot:
+            self._open_slot(slot)
+        pending = self._pending
+        pending.extend(values)
+        if len(pending) >= self.FLUSH_SIZE:
+            self._flush()
+    
+    @property
+    def all_time(self) -> LogHistogram:
+        """Histogram of every recorded sample (a new object)."""
+        self._flush()
+        merged = LogHistogram()
+        merged.merge(self._retired)
+        for _, histogram in self._slots:
+            merged.merge(histogram)
+        return merged
+    
+    def window(self, seconds: int) -> LogHistogram:
+        """
+        Histogram of the samples of the last ``seconds`` (to slot resolution).
+        
+        Args:
+            seconds: Window length
+            
+        Returns:
+            Merged LogHistogram (a new object)
+        """
+        self._flush()
+        oldest = self._slot() - math.ceil(seconds / self.slot_seconds) + 1
+        merged = LogHistogram()
+        for slot, histogram in reversed(self._slots):
+            if slot < oldest:
+                break
+            merged.merge(histogram)
+        return merged
+    
+    def summary(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Dict[str, float]]:
+        """
+        All-time and per-window summaries.
+        
+        Args:
+            quantiles: Percentiles to report
+            
+        Returns:
+            Dictionary keyed by ``all`` and window labels (``1m``, ...)
+        """
+        # One newest-to-oldest pass, summarizing at each window edge
+        self._flush()
+        current = self._slot()
+        edges = sorted(
+            (current - math.ceil(seconds / self.slot_seconds) + 1, seconds) 
+            for seconds in self.windows
+        )
+        windows = {}
+        merged = LogHistogram()
+        for slot, histogram in reversed(self._slots):
+            while edges and slot < edges[-1][0]:
+                windows[edges.pop()[1]] = merged.summary(quantiles)
+            merged.merge(histogram)
+        for _, seconds in edges:
+            windows[seconds] = merged.summary(quantiles)
+        merged.merge(self._retired)
+        
+        summary = {"all": merged.summary(quantiles)}
+        for seconds in self.windows:
+            summary[window_label(seconds)] = windows[seconds]
+        return summary
+    
+    def reset(self):
+        """Drop all samples."""
+        self._retired.reset()
+        self._slots.clear()
+        self._pending.clear()
+        self._current_slot = None
@@ -0,0 +1,553 @@
+"""
+Engine Profiling Hooks
+
+Pre/post callbacks around the IntegrationEngine's hot-path stages
+(HOOK_STAGES), attachable and removable at runtime:
+- HookRegistry: per-stage hook lists, swapped atomically on change. A
+  stage with no hooks (or a disabled registry) costs the engine one dict
+  lookup per call.
+- Hook: base class; ``pre`` returns a per-call state handed to ``post``.
+- CProfileHook: profiles 1 in N calls per stage with cProfile.
+- TracemallocHook: tracemalloc snapshot diff per call, aggregated by
+  stage and allocation site.
+- WallClockHook: inclusive and self wall time per stage, rendered as a
+  breakdown table.
+
+Hooks run on the calling thread, so a registry change is seen by the
+next call of every thread (including ``submit()`` thread workers). Hook
+errors are logged and never fail the engine call, except the exception
+types a hook declares in ``propagates`` (see allocations.AllocationTracker).
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+import cProfile
+import functools
+import io
+import itertools
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+
+from .histogram import LogHistogram
+
+
+# "generate_report" fires only for direct IntegrationEngine.generate_report
+# calls: full_integration_cycle checks its integrated result with
+# validator.quick_check and is timed as a whole under its own stage.
+HOOK_STAGES = (
+    "validate",
+    "validate_many",
+    "transition",
+    "integrate",
+    "full_integration_cycle",
+    "generate_report",
+)
+
+_logger = logging.getLogger(__name__)
+
+
+def _check_stages(stages: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Validate a stage selection (None = every stage)."""
+    if stages is None:
+        return HOOK_STAGES
+    stages = tuple(stages)
+    unknown = set(stages) - set(HOOK_STAGES)
+    if unknown:
+        raise ValueError(f"Unknown hook stages {sorted(unknown)} (expected {list(HOOK_STAGES)})")
+    return stages
+
+
+class Hook:
+    """
+    Base class of engine hooks.
+    
+    ``stages`` limits the stages the hook is registered for by default.
+    Exceptions of the ``propagates`` types raised by ``post`` fail the
+    stage call (e.g. budget enforcement); any other hook error is logged.
+    """
+    
+    stages: Optional[Tuple[str, ...]] = None
+    propagates: Tuple[Type[BaseException], ...] = ()
+    
+    def pre(self, stage: str) -> Any:
+        """
+        Called before a stage runs.
+        
+        Args:
+            stage: Stage name
+            
+        Returns:
+            State passed to ``post`` for this call
+        """
+        return None
+    
+    def post(self, stage: str, state: Any, error: Optional[BaseException]):
+        """
+        Called after a stage ran (also when it raised).
+        
+        Args:
+            stage: Stage name
+            state: Value returned by ``pre``
+            error: Exception raised by the stage, if any
+        """
+
+
+class HookRegistry:
+    """
+    Hooks attached to engine stages.
+    
+    Hooks of a stage run ``pre`` in registration order and ``post`` in
+    reverse order. Changes replace immutable per-stage tuples, so calls in
+    flight keep the hooks they started with.
+    """
+    
+    def __init__(self):
+        """Initialize empty registry."""
+        self.enabled = True
+        self.errors = 0
+        self._hooks: Dict[str, Tuple[Hook, ...]] = {}
+        self._active: Dict[str, Tuple[Hook, ...]] = {}
+        self._lock = threading.Lock()
+    
+    def _publish(self):
+        """Rebuild the lookup table read by the engine (caller holds ``_lock``)."""
+        self._active = {
+            stage: hooks for stage, hooks in self._hooks.items() if hooks
+        } if self.enabled else {}
+    
+    def add(self, hook: Hook, stages: Optional[Iterable[str]] = None) -> Hook:
+        """
+        Attach a hook.
+        
+        Args:
+            hook: Hook to attach
+            stages: Stages to hook (default: ``hook.stages`` or every stage)
+            
+        Returns:
+            The hook
+        """
+        stages = _check_stages(stages if stages is not None else hook.stages)
+        with self._lock:
+            for stage in stages:
+                if hook not in self._hooks.get(stage, ()):
+                    self._hooks[stage] = self._hooks.get(stage, ()) + (hook,)
+            self._publish()
+        return hook
+    
+    def remove(self, hook: Hook, stages: Optional[Iterable[str]] = None):
+        """
+        Detach a hook.
+        
+        Args:
+            hook: Hook to detach
+            stages: Stages to detach it from (default: all)
+        """
+        stages = _check_stages(stages)
+        with self._lock:
+            for stage in stages:
+                self._hooks[stage] = tuple(h for h in self._hooks.get(stage, ()) if h is not hook)
+            self._publish()
+    
+    def clear(self):
+        """Detach every hook."""
+        with self._lock:
+            self._hooks = {}
+            self._publish()
+    
+    def enable(self):
+        """Run attached hooks."""
+        with self._lock:
+            self.enabled = True
+            self._publish()
+    
+    def disable(self):
+        """Stop running hooks (they stay attached)."""
+        with self._lock:
+            self.enabled = False
+            self._publish()
+    
+    def hooks(self, stage: str) -> Tuple[Hook, ...]:
+        """
+        Hooks attached to a stage.
+        
+        Args:
+            stage: Stage name
+            
+        Returns:
+            Hooks in registration order
+        """
+        return self._hooks.get(stage, ())
+    
+    def find(self, kind: Type[Hook]) -> List[Hook]:
+        """
+        Attached hooks of a type (each listed once).
+        
+        Args:
+            kind: Hook class
+            
+        Returns:
+            Matching hooks in registration order
+        """
+        found: List[Hook] = []
+        for hooks in list(self._hooks.values()):
+            for hook in hooks:
+                if isinstance(hook, kind) and hook not in found:
+                    found.append(hook)
+        return found
+    
+    def run(self, stage: str, hooks: Tuple[Hook, ...], func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run ``func`` between the hooks' pre and post callbacks.
+        
+        Args:
+            stage: Stage name
+            hooks: Hooks to run
+            func: Stage implementation
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+            
+        Returns:
+            Result of ``func``
+        """
+        states = []
+        for hook in hooks:
+            try:
+                states.append((hook, hook.pre(stage)))
+            except Exception:
+                self._failed(hook, stage)
+        
+        error = None
+        try:
+            return func(*args, **kwargs)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            escalated = None
+            for hook, state in reversed(states):
+                try:
+                    hook.post(stage, state, error)
+                except hook.propagates as e:
+                    escalated = escalated or e
+                except Exception:
+                    self._failed(hook, stage)
+            if escalated is not None:
+                raise escalated
+    
+    def _failed(self, hook: Hook, stage: str):
+        self.errors += 1
+        _logger.exception("Hook %r failed in stage %r", hook, stage)
+
+
+def hooked(stage: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorate an engine method to run the owner's ``hooks`` for a stage.
+    
+    Args:
+        stage: One of HOOK_STAGES
+        
+    Returns:
+        Method decorator
+    """
+    _check_stages((stage,))
+    
+    def decorator(method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            hooks = self.hooks._active.get(stage)
+            if not hooks:
+                return method(self, *args, **kwargs)
+            return self.hooks.run(stage, hooks, method, self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ============================================================================
+# BUILT-IN HOOKS
+# ============================================================================
+
+class CProfileHook(Hook):
+    """
+    Profiles 1 in ``every`` calls per stage with cProfile.
+    
+    One call is profiled at a time per process (cProfile cannot nest),
+    so a sampled call that starts while another is being profiled is
+    skipped; a profiled outer stage includes its inner stages.
+    """
+    
+    def __init__(self, every: int = 100, stages: Optional[Sequence[str]] = None):
+        """
+        Initialize cProfile hook.
+        
+        Args:
+            every: Profile one call in this many per stage
+            stages: Default stages (None = every stage)
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+        self.stages = _check_stages(stages) if stages is not None else None
+        self.samples: Dict[str, int] = {}
+        self._counters = {stage: itertools.count() for stage in HOOK_STAGES}
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._running = threading.Lock()
+    
+    def pre(self, stage: str) -> Optional[cProfile.Profile]:
+        if next(self._counters[stage]) % self.every:
+            return None
+        if not self._running.acquire(blocking=False):
+            return None
+        profile = self._profiles.setdefault(stage, cProfile.Profile())
+        profile.enable()
+        return profile
+    
+    def post(self, stage: str, state: Optional[cProfile.Profile], error: Optional[BaseException]):
+        if state is None:
+            return
+        state.disable()
+        self.samples[stage] = self.samples.get(stage, 0) + 1
+        self._running.release()
+    
+    def stats(self, stage: str) -> Optional[pstats.Stats]:
+        """
+        Accumulated profile of a stage.
+        
+        Args:
+            stage: Stage name
+            
+        Returns:
+            pstats.Stats over every sampled call (None before the first)
+        """
+        profile = self._profiles.get(stage)
+        if profile is None or not self.samples.get(stage):
+            return None
+        return pstats.Stats(profile)
+    
+    def report(self, stage: str, sort: str = "cumulative", limit: int = 20) -> str:
+        """
+        Text report of a stage's profile.
+        
+        Args:
+            stage: Stage name
+            sort: pstats sort key
+            limit: Number of functions listed
+            
+        Returns:
+            pstats listing (empty before the first sample)
+        """
+        profile = self._profiles.get(stage)
+        if profile is None or not self.samples.get(stage):
+            return ""
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+    
+    def dump(self, stage: str, path: str):
+        """
+        Write a stage's profile in the ``pstats`` file format.
+        
+        Args:
+            stage: Stage name
+            path: Destination path (readable by snakeviz, gprof2dot, ...)
+        """
+        self._profiles[stage].dump_stats(path)
+    
+    def reset(self):
+        """Drop the collected profiles."""
+        self._profiles = {}
+        self.samples = {}
+
+
+class TracemallocHook(Hook):
+    """
+    Per-call tracemalloc snapshot diffs, aggregated per stage.
+    
+    Starts tracemalloc on first use (and ``close()`` stops it again if
+    this hook started it). Snapshots are taken process-wide, so
+    allocations of concurrent threads are attributed to whichever stage
+    is being measured; taking them is slow, use ``every`` to sample.
+    """
+    
+    def __init__(self, every: int = 1, frames: int = 1, stages: Optional[Sequence[str]] = None):
+        """
+        Initialize tracemalloc hook.
+        
+        Args:
+            every: Measure one call in this many per stage
+            frames: Traceback depth recorded per allocation
+            stages: Default stages (None = every stage)
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+        self.frames = frames
+        self.stages = _check_stages(stages) if stages is not None else None
+        self._counters = {stage: itertools.count() for stage in HOOK_STAGES}
+        self._started = False
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Dict[str, int]] = {}
+        self._sites: Dict[str, Dict[str, List[int]]] = {}
+    
+    def pre(self, stage: str) -> Optional[tracemalloc.Snapshot]:
+        if next(self._counters[stage]) % self.every:
+            return None
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+        return tracemalloc.take_snapshot()
+    
+    def post(self, stage: str, state: Optional[tracemalloc.Snapshot], error: Optional[BaseException]):
+        if state is None:
+            return
+        diff = tracemalloc.take_snapshot().compare_to(state, "lineno")
+        with self._lock:
+            totals = self._totals.setdefault(stage, {"calls": 0, "bytes": 0, "blocks": 0})
+            sites = self._sites.setdefault(stage, {})
+            totals["calls"] += 1
+            for stat in diff:
+                if stat.size_diff <= 0:
+                    continue
+                totals["bytes"] += stat.size_diff
+                totals["blocks"] += max(stat.count_diff, 0)
+                site = sites.setdefault(str(stat.traceback[0]), [0, 0])
+                site[0] += stat.size_diff
+                site[1] += max(stat.count_diff, 0)
+    
+    def summary(self, top: int = 10) -> Dict[str, Dict[str, Any]]:
+        """
+        Retained allocations per stage.
+        
+        Args:
+            top: Number of allocation sites listed per stage
+            
+        Returns:
+            Dictionary keyed by stage with ``calls``, ``bytes`` and
+            ``blocks`` (net growth summed over measured calls, per-call
+            means ``bytes_per_call``) and ``top`` (site, bytes, blocks)
+        """
+        with self._lock:
+            summary = {}
+            for stage, totals in self._totals.items():
+                sites = sorted(self._sites[stage].items(), key=lambda item: -item[1][0])[:top]
+                summary[stage] = {
+                    **totals,
+                    "bytes_per_call": totals["bytes"] / totals["calls"] if totals["calls"] else 0.0,
+                    "top": [(site, size, count) for site, (size, count) in sites]
+                }
+            return summary
+    
+    def reset(self):
+        """Drop the collected statistics."""
+        with self._lock:
+            self._totals = {}
+            self._sites = {}
+    
+    def close(self):
+        """Stop tracemalloc if this hook started it."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+
+class WallClockHook(Hook):
+    """
+    Wall-clock time per stage, inclusive and self (excluding nested stages).
+    """
+    
+    def __init__(self, stages: Optional[Sequence[str]] = None, clock: Callable[[], int] = time.perf_counter_ns):
+        """
+        Initialize wall-clock hook.
+        
+        Args:
+            stages: Default stages (None = every stage)
+            clock: Nanosecond clock
+        """
+        self.stages = _check_stages(stages) if stages is not None else None
+        self.clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LogHistogram] = {}
+        self._self_ns: Dict[str, int] = {}
+    
+    def _stack(self) -> List[List[int]]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+    
+    def pre(self, stage: str) -> List[int]:
+        # [start, nested time]
+        frame = [self.clock(), 0]
+        self._stack().append(frame)
+        return frame
+    
+    def post(self, stage: str, state: List[int], error: Optional[BaseException]):
+        elapsed = self.clock() - state[0]
+        stack = self._stack()
+        stack.pop()
+        if stack:
+            stack[-1][1] += elapsed
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = LogHistogram()
+            histogram.record(elapsed / 1e9)
+            self._self_ns[stage] = self._self_ns.get(stage, 0) + elapsed - state[1]
+    
+    def breakdown(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-stage timing.
+        
+        Returns:
+            Dictionary keyed by stage with ``calls``, ``total_seconds``
+            (inclusive), ``self_seconds``, ``mean_seconds``, ``p50``,
+            ``p99`` and ``max`` (seconds) and ``self_share`` (fraction of
+            all self time)
+        """
+        with self._lock:
+            all_self = sum(self._self_ns.values()) or 1
+            breakdown = {}
+            for stage, histogram in self._histograms.items():
+                percentiles = histogram.percentiles((50, 99))
+                breakdown[stage] = {
+                    "calls": histogram.count,
+                    "total_seconds": histogram.total,
+                    "self_seconds": self._self_ns[stage] / 1e9,
+                    "mean_seconds": histogram.mean,
+                    "p50": percentiles[50],
+                    "p99": percentiles[99],
+                    "max": histogram.max,
+                    "self_share": self._self_ns[stage] / all_self
+                }
+            return breakdown
+    
+    def table(self) -> str:
+        """
+        Breakdown as a text table, by descending self time.
+        
+        Returns:
+            Table with one row per stage (times in milliseconds)
+        """
+        rows = sorted(self.breakdown().items(), key=lambda item: -item[1]["self_seconds"])
+        lines = [
+            f"{'stage':<24}{'calls':>8}{'total ms':>12}{'self ms':>12}{'self %':>8}"
+            f"{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+        ]
+        for stage, row in rows:
+            lines.append(
+                f"{stage:<24}{row['calls']:>8}{row['total_seconds'] * 1e3:>12.3f}"
+                f"{row['self_seconds'] * 1e3:>12.3f}{row['self_share'] * 100:>7.1f}%"
+                f"{row['mean_seconds'] * 1e3:>10.3f}{row['p50'] * 1e3:>10.3f}"
+                f"{row['p99'] * 1e3:>10.3f}{row['max'] * 1e3:>10.3f}"
+            )
+        return "\n".join(lines)
+    
+    def reset(self):
+        """Drop the collected timings."""
+        with self._lock:
+            self._histograms = {}
+            self._self_ns = {}
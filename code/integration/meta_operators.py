@@ -6,10 +6,16 @@ Unifies Phoenix (BEGIN), Hydrogenesi (EXTEND), and The Third (HOLD) into soverei
 """
 
 from __future__ import annotations
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence
+import threading
+import time
+
+from .profiler import NULL_SPAN, SpanProfiler
+from .retention import RetentionBuffer
 
 
 class WaltzPhase(Enum):
@@ -47,6 +53,345 @@ class WaltzStep:
         return f"Step {self.step_number}: {self.phase.value} | {self.pillar} --[{self.transformation_applied}]--> {self.mode}"
 
 
+# ============================================================================
+# PHASE TRANSFORMS (pure)
+# ============================================================================
+
+def _as_mapping(pattern: Any) -> Dict[str, Any]:
+    """Accept pattern objects exposing ``to_dict()`` (e.g. IntegrationPattern)."""
+    if isinstance(pattern, Mapping):
+        return pattern
+    to_dict = getattr(pattern, "to_dict", None)
+    return to_dict() if to_dict is not None else pattern
+
+
+def _pattern_name(pattern: Any) -> Any:
+    """Name of a pattern dict or pattern object."""
+    if isinstance(pattern, Mapping):
+        return pattern.get("name", "unknown")
+    return getattr(pattern, "name", "unknown")
+
+
+def _ignite(pattern: Dict[str, Any]) -> Dict[str, Any]:
+    """Phoenix ignition transform (Phase 1, BEGIN)."""
+    name = pattern.get("name", "unknown")
+    return {
+        "original": pattern,
+        "pillar": "Phoenix",
+        "mode": "BEGIN",
+        "phase": "INITIATION",
+        "transformation": "ignition",
+        "core": name,
+        "ignited": True,
+        "apex": f"apex::{name}",
+        "phoenix_signature": ["Burn", "Collapse", "Rise"]
+    }
+
+
+def _propagate(ignited_pattern: Dict[str, Any]) -> Dict[str, Any]:
+    """Hydrogenesi propagation transform (Phase 2, EXTEND)."""
+    return {
+        "ignited": ignited_pattern,
+        "pillar": "Hydrogenesi",
+        "mode": "EXTEND",
+        "phase": "TRANSFORMATION",
+        "transformation": "propagation",
+        "lineage": f"ROOT::{ignited_pattern.get('core', 'unknown')}::GEN-1",
+        "propagated": True,
+        "recursive_depth": 1,
+        "hydrogenesi_signature": ["Compress", "Ignite", "Replicate"]
+    }
+
+
+def _bind(propagated_pattern: Dict[str, Any]) -> Dict[str, Any]:
+    """The Third binding transform (Phase 3, HOLD)."""
+    return {
+        "propagated": propagated_pattern,
+        "pillar": "The Third",
+        "mode": "HOLD",
+        "phase": "INTEGRATION",
+        "transformation": "binding",
+        "threshold_reached": True,
+        "bound": True,
+        "sovereignty": True,
+        "the_third_signature": ["At Threshold", "Hold", "Bind"]
+    }
+
+
+def _close(integrated_pattern: Dict[str, Any]) -> Dict[str, Any]:
+    """Triadic closure transform (Phase 4, COMPLETE)."""
+    return {
+        "integrated": integrated_pattern,
+        "phase": "COMPLETION",
+        "mode": "COMPLETE",
+        "transformation": "closure",
+        "triadic_closure": True,
+        "sovereignty_confirmed": True,
+        "waltz_complete": True,
+        "triad": {
+            "phoenix": integrated_pattern["propagated"]["ignited"],
+            "hydrogenesi": integrated_pattern["propagated"],
+            "the_third": integrated_pattern
+        },
+        "unified_signature": list(_UNIFIED_SIGNATURE),
+        "signature": "🜂🜁🜃"  # Triadic signature
+    }
+
+
+# (phase, pillar, mode, transformation) for the four waltz steps
+_STEP_SUMMARIES = (
+    (WaltzPhase.INITIATION, "Phoenix", "BEGIN", "Phoenix Ignition"),
+    (WaltzPhase.TRANSFORMATION, "Hydrogenesi", "EXTEND", "Hydrogenesi Propagation"),
+    (WaltzPhase.INTEGRATION, "The Third", "HOLD", "The Third Binding"),
+    (WaltzPhase.COMPLETION, "Unified", "COMPLETE", "Triadic Closure"),
+)
+
+# Energy conservation after the final phase (The Third binding at 90%)
+_FINAL_ENERGY = 0.90
+
+_UNIFIED_SIGNATURE = [
+    "Begin", "Extend", "Hold",
+    "Ignite", "Propagate", "Bind",
+    "Sovereign"
+]
+
+
+def _summarize_steps() -> List[Dict[str, Any]]:
+    """Build the per-step summaries reported in waltz results."""
+    return [
+        {
+            "phase": phase.value,
+            "pillar": pillar,
+            "mode": mode,
+            "transformation": transformation,
+            "step_number": number
+        }
+        for number, (phase, pillar, mode, transformation)
+        in enumerate(_STEP_SUMMARIES, start=1)
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class WaltzPass:
+    """
+    Result of a single stateless waltz pass.
+
+    Holds only the completed pattern (which already references every
+    earlier phase output through its triad) so that a long-lived caller
+    can run passes back to back without accumulating per-call state.
+    """
+    completed: Dict[str, Any]
+    energy_conservation: float = _FINAL_ENERGY
+
+    def to_result(self, recursion_depth: int = 1) -> Dict[str, Any]:
+        """
+        Render the pass in the standard ``dance()`` result format.
+
+        Args:
+            recursion_depth: Recursion depth to report
+
+        Returns:
+            Waltz result dictionary (status WALTZ_COMPLETE)
+        """
+        return {
+            "status": "WALTZ_COMPLETE",
+            "message": "✓ Three-Finger Waltz complete - Sovereignty achieved",
+            "pattern": self.completed,
+            "steps": _summarize_steps(),
+            "phase_count": len(_STEP_SUMMARIES),
+            "sovereignty": True,
+            "triadic_closure": True,
+            "recursion_depth": recursion_depth,
+            "energy_conservation": self.energy_conservation
+        }
+
+
+class _PhaseTimer:
+    """
+    Times consecutive waltz phases.
+    
+    ``lap(phase)`` closes the phase that started at the previous lap (or at
+    construction) and, when a profiler is recording, adds it as a
+    ``phase.<name>`` span.
+    """
+    
+    __slots__ = ("profiler", "clock", "durations", "_last")
+    
+    def __init__(self, profiler: Optional[SpanProfiler]):
+        self.profiler = profiler if profiler is not None and profiler.enabled else None
+        self.clock = time.perf_counter_ns if self.profiler is None else self.profiler.clock
+        self.durations: Dict[WaltzPhase, float] = {}
+        self._last = self.clock()
+    
+    def lap(self, phase: WaltzPhase):
+        now = self.clock()
+        self.durations[phase] = (now - self._last) / 1e9
+        if self.profiler is not None:
+            self.profiler.add(f"phase.{phase.value}", self._last, now)
+        self._last = now
+
+
+_PHASE_TRANSFORMS = (
+    (WaltzPhase.INITIATION, _ignite),
+    (WaltzPhase.TRANSFORMATION, _propagate),
+    (WaltzPhase.INTEGRATION, _bind),
+    (WaltzPhase.COMPLETION, _close),
+)
+
+
+def perform_waltz(pattern: Dict[str, Any]) -> WaltzPass:
+    """
+    Run one pattern through all four waltz phases without side effects.
+
+    Pure counterpart of ``ThreeFingerWaltz.dance()``: no steps, history,
+    counters or completion flags are touched, so it is safe to call
+    repeatedly (and concurrently) from a single long-lived owner.
+
+    Args:
+        pattern: Pattern to integrate
+
+    Returns:
+        WaltzPass holding the completed sovereign triad
+    """
+    return WaltzPass(completed=_close(_bind(_propagate(_ignite(_as_mapping(pattern))))))
+
+
+@dataclass(frozen=True, slots=True)
+class WaltzBatch:
+    """
+    Column-wise result of a batched waltz pass.
+    
+    Each phase is applied across the whole batch at once and only the
+    columns that actually vary per pattern (core, apex, lineage) are kept.
+    Binding and closure are identical for every pattern, so nothing is
+    stored for them. Per-pattern records are cheap flat dicts; the full
+    nested triad for a pattern is only built on request via ``pattern()``.
+    """
+    originals: Sequence[Dict[str, Any]]
+    cores: List[Any]
+    apexes: List[str]
+    lineages: List[str]
+    energy_conservation: float = _FINAL_ENERGY
+    
+    def __len__(self) -> int:
+        return len(self.cores)
+    
+    def record(self, index: int) -> Dict[str, Any]:
+        """
+        Flat integration record for one pattern of the batch.
+        
+        Args:
+            index: Position of the pattern in the batch
+            
+        Returns:
+            Dict with the pattern's core, apex, lineage and closure markers
+        """
+        return {
+            "index": index,
+            "core": self.cores[index],
+            "apex": self.apexes[index],
+            "lineage": self.lineages[index],
+            "sovereignty": True,
+            "triadic_closure": True,
+            "signature": "🜂🜁🜃"
+        }
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """Flat integration records for every pattern, in batch order."""
+        return [self.record(i) for i in range(len(self.cores))]
+    
+    def pattern(self, index: int) -> Dict[str, Any]:
+        """
+        Materialize the full completed triad for one pattern.
+        
+        Identical to ``perform_waltz(originals[index]).completed``.
+        
+        Args:
+            index: Position of the pattern in the batch
+            
+        Returns:
+            Complete sovereign triad
+        """
+        return perform_waltz(self.originals[index]).completed
+    
+    def aggregate(self) -> Dict[str, Any]:
+        """
+        Aggregate outcome of the batch.
+        
+        Returns:
+            Dict with pattern/sovereign counts and the unified signature
+        """
+        count = len(self.cores)
+        return {
+            "patterns_integrated": count,
+            "sovereign_count": count,
+            "triadic_closure": count > 0,
+            "energy_conservation": self.energy_conservation,
+            "unified_signature": list(_UNIFIED_SIGNATURE),
+            "signature": "🜂🜁🜃"
+        }
+    
+    def to_result(self, recursion_depth: int = 1) -> Dict[str, Any]:
+        """
+        Render the batch as a waltz result.
+        
+        ``pattern`` carries the full triad of the first pattern so callers
+        of the single-pattern API keep working; ``results`` has one record
+        per pattern and ``aggregate`` summarizes the batch.
+        
+        Args:
+            recursion_depth: Recursion depth to report
+            
+        Returns:
+            Waltz result dictionary (status WALTZ_COMPLETE)
+        """
+        return {
+            "status": "WALTZ_COMPLETE",
+            "message": f"✓ Three-Finger Waltz complete - {len(self.cores)} patterns integrated",
+            "pattern": self.pattern(0),
+            "results": self.records(),
+            "aggregate": self.aggregate(),
+            "batch_size": len(self.cores),
+            "steps": _summarize_steps(),
+            "phase_count": len(_STEP_SUMMARIES),
+            "sovereignty": True,
+            "triadic_closure": True,
+            "recursion_depth": recursion_depth,
+            "energy_conservation": self.energy_conservation
+        }
+
+
+def perform_waltz_batch(patterns: Sequence[Dict[str, Any]]) -> WaltzBatch:
+    """
+    Run every pattern through all four waltz phases in a single pass.
+    
+    Phases are applied column-wise across the batch (INITIATION derives the
+    core/apex columns, TRANSFORMATION the lineage column; INTEGRATION and
+    COMPLETION are constant) instead of building four nested dicts per
+    pattern. Like ``perform_waltz()`` this has no side effects.
+    
+    Args:
+        patterns: Non-empty sequence of patterns to integrate
+        
+    Returns:
+        WaltzBatch with one entry per pattern
+    """
+    # Phase 1: INITIATION (Phoenix) - core identity and apex per pattern
+    cores = [_pattern_name(pattern) for pattern in patterns]
+    apexes = [f"apex::{core}" for core in cores]
+    
+    # Phase 2: TRANSFORMATION (Hydrogenesi) - lineage per pattern
+    lineages = [f"ROOT::{core}::GEN-1" for core in cores]
+    
+    # Phases 3-4: INTEGRATION / COMPLETION are uniform across the batch
+    return WaltzBatch(
+        originals=patterns,
+        cores=cores,
+        apexes=apexes,
+        lineages=lineages
+    )
+
+
 @dataclass
 class ThreeFingerWaltz:
     """
@@ -76,6 +421,23 @@ class ThreeFingerWaltz:
     
     The waltz is irreversible - once completed, the pattern achieves
     permanent sovereign status.
+    
+    With ``reentrant=True`` the waltz instead serves every call through the
+    stateless ``perform_waltz()`` path: no steps or history are retained and
+    the instance never reports ALREADY_COMPLETE, so one waltz can integrate
+    any number of pattern sets back to back.
+    
+    ``waltz_history`` is a RetentionBuffer; ``history_limit`` caps how many
+    completions it keeps while ``history_total`` still counts all of them.
+    
+    With ``time_phases=True`` (or while ``profiler`` is recording) each
+    phase of a single-pattern dance is timed; ``last_phase_durations()``
+    returns the timings of the calling thread's latest dance. Batch passes
+    run the phases column-wise and are timed as one ``waltz.batch`` span.
+    
+    Both modes are safe to call from several threads: reentrant passes share
+    no state beyond a locked pass counter, and classic dances are serialized
+    on the instance lock.
     """
     
     patterns: List[Dict[str, Any]] = field(default_factory=list)
@@ -87,12 +449,34 @@ class ThreeFingerWaltz:
     _initialized_at: datetime = field(default_factory=lambda: datetime.now())
     recursion_depth: int = 0
     max_recursion: int = 7
-    waltz_history: List[Dict[str, Any]] = field(default_factory=list)
+    waltz_history: RetentionBuffer = field(default_factory=RetentionBuffer)
+    history_limit: Optional[int] = None
+    reentrant: bool = False
+    time_phases: bool = False
+    profiler: Optional[SpanProfiler] = field(default=None, repr=False, compare=False)
+    _passes_completed: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+    _phase_local: threading.local = field(
+        default_factory=threading.local, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Initialize waltz state."""
         if not self.patterns:
             self.patterns = []
+        if not isinstance(self.waltz_history, RetentionBuffer):
+            history = RetentionBuffer(max_entries=self.history_limit)
+            history.extend(self.waltz_history)
+            self.waltz_history = history
+        elif self.history_limit is not None:
+            self.waltz_history.max_entries = self.history_limit
+    
+    @property
+    def history_total(self) -> int:
+        """Number of completions recorded, including ones no longer retained."""
+        return self.waltz_history.total
     
     def __repr__(self) -> str:
         """Enhanced string representation."""
@@ -102,6 +486,25 @@ class ThreeFingerWaltz:
             f"energy={self._energy_conservation:.2f}, recursion={self.recursion_depth}/{self.max_recursion})"
         )
     
+    def _span(self, name: str):
+        """Span context of the profiler (a no-op without one)."""
+        profiler = self.profiler
+        return NULL_SPAN if profiler is None else profiler.span(name)
+    
+    def _should_time_phases(self) -> bool:
+        """Whether the next reentrant pass is timed per phase."""
+        return self.time_phases
+    
+    def last_phase_durations(self) -> Dict[WaltzPhase, float]:
+        """
+        Phase durations of the calling thread's latest dance.
+        
+        Returns:
+            Dictionary mapping phases to seconds (empty when the latest dance
+            was a batch pass, returned early or was not timed)
+        """
+        return getattr(self._phase_local, "durations", {})
+    
     def execute_phase_1_initiation(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
         """
         Phase 1: INITIATION - Phoenix ignites (BEGIN mode)
@@ -116,17 +519,7 @@ class ThreeFingerWaltz:
             Ignited pattern with Phoenix signature
         """
         # Apply Phoenix ignition
-        ignited = {
-            "original": pattern,
-            "pillar": "Phoenix",
-            "mode": "BEGIN",
-            "phase": "INITIATION",
-            "transformation": "ignition",
-            "core": pattern.get("name", "unknown"),
-            "ignited": True,
-            "apex": f"apex::{pattern.get('name', 'unknown')}",
-            "phoenix_signature": ["Burn", "Collapse", "Rise"]
-        }
+        ignited = _ignite(pattern)
         
         # Track energy: Phoenix ignition starts at 100%
         self._energy_conservation = 1.0
@@ -160,17 +553,7 @@ class ThreeFingerWaltz:
             Propagated pattern with Hydrogenesi signature
         """
         # Apply Hydrogenesi propagation
-        propagated = {
-            "ignited": ignited_pattern,
-            "pillar": "Hydrogenesi",
-            "mode": "EXTEND",
-            "phase": "TRANSFORMATION",
-            "transformation": "propagation",
-            "lineage": f"ROOT::{ignited_pattern.get('core', 'unknown')}::GEN-1",
-            "propagated": True,
-            "recursive_depth": 1,
-            "hydrogenesi_signature": ["Compress", "Ignite", "Replicate"]
-        }
+        propagated = _propagate(ignited_pattern)
         
         # Track energy: Hydrogenesi propagation at 95%
         self._energy_conservation = 0.95
@@ -204,17 +587,7 @@ class ThreeFingerWaltz:
             Integrated sovereign pattern with The Third signature
         """
         # Apply The Third binding
-        integrated = {
-            "propagated": propagated_pattern,
-            "pillar": "The Third",
-            "mode": "HOLD",
-            "phase": "INTEGRATION",
-            "transformation": "binding",
-            "threshold_reached": True,
-            "bound": True,
-            "sovereignty": True,
-            "the_third_signature": ["At Threshold", "Hold", "Bind"]
-        }
+        integrated = _bind(propagated_pattern)
         
         # Track energy: The Third binding at 90%
         self._energy_conservation = 0.90
@@ -248,26 +621,7 @@ class ThreeFingerWaltz:
             Complete sovereign triad
         """
         # Confirm triadic closure
-        completed = {
-            "integrated": integrated_pattern,
-            "phase": "COMPLETION",
-            "mode": "COMPLETE",
-            "transformation": "closure",
-            "triadic_closure": True,
-            "sovereignty_confirmed": True,
-            "waltz_complete": True,
-            "triad": {
-                "phoenix": integrated_pattern["propagated"]["ignited"],
-                "hydrogenesi": integrated_pattern["propagated"],
-                "the_third": integrated_pattern
-            },
-            "unified_signature": [
-                "Begin", "Extend", "Hold",
-                "Ignite", "Propagate", "Bind",
-                "Sovereign"
-            ],
-            "signature": "🜂🜁🜃"  # Triadic signature
-        }
+        completed = _close(integrated_pattern)
         
         # Final energy conservation
         # Energy is maintained at 90% through completion
@@ -288,7 +642,11 @@ class ThreeFingerWaltz:
         
         return completed
     
-    def dance(self, patterns: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    def dance(
+        self, 
+        patterns: Optional[List[Dict[str, Any]]] = None, 
+        batch: bool = False
+    ) -> Dict[str, Any]:
         """
         Execute the complete Three-Finger Waltz.
         
@@ -301,10 +659,36 @@ class ThreeFingerWaltz:
         Args:
             patterns: Optional list of patterns to integrate.
                      If None, uses patterns provided at initialization.
+            batch: Integrate every pattern (column-wise, single pass) instead
+                   of only the first one. The result then also carries
+                   ``results`` (one record per pattern) and ``aggregate``.
         
         Returns:
             Dict containing waltz results with unified sovereign pattern
         """
+        self._phase_local.durations = {}
+        with self._span("waltz.dance"):
+            if self.reentrant:
+                return self._dance_reentrant(patterns, batch)
+            
+            with self._lock:
+                return self._dance_classic(patterns, batch)
+    
+    def _dance_classic(
+        self, 
+        patterns: Optional[List[Dict[str, Any]]], 
+        batch: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute the stateful, single-shot waltz (caller holds ``_lock``).
+        
+        Args:
+            patterns: Patterns to integrate (falls back to stored patterns)
+            batch: Integrate every pattern instead of only the first
+            
+        Returns:
+            Waltz result dictionary
+        """
         if self._completed:
             return {
                 "status": "ALREADY_COMPLETE",
@@ -337,25 +721,41 @@ class ThreeFingerWaltz:
         # Increment recursion depth
         self.recursion_depth += 1
         
+        if batch:
+            with self._span("waltz.batch"):
+                waltz_result = perform_waltz_batch(patterns_to_integrate).to_result(self.recursion_depth)
+            self._current_phase = WaltzPhase.COMPLETION
+            self._energy_conservation = waltz_result["energy_conservation"]
+            self._completed = True
+            self.waltz_history.append(waltz_result)
+            return waltz_result
+        
         # For multiple patterns, integrate the first one through full waltz
         # (In production, this could be enhanced to handle multiple patterns)
-        primary_pattern = patterns_to_integrate[0]
+        primary_pattern = _as_mapping(patterns_to_integrate[0])
+        
+        timer = _PhaseTimer(self.profiler)
         
         # Phase 1: Initiation
         self._current_phase = WaltzPhase.INITIATION
         ignited = self.execute_phase_1_initiation(primary_pattern)
+        timer.lap(WaltzPhase.INITIATION)
         
         # Phase 2: Transformation
         self._current_phase = WaltzPhase.TRANSFORMATION
         propagated = self.execute_phase_2_transformation(ignited)
+        timer.lap(WaltzPhase.TRANSFORMATION)
         
         # Phase 3: Integration
         self._current_phase = WaltzPhase.INTEGRATION
         integrated = self.execute_phase_3_integration(propagated)
+        timer.lap(WaltzPhase.INTEGRATION)
         
         # Phase 4: Completion
         self._current_phase = WaltzPhase.COMPLETION
         completed = self.execute_phase_4_completion(integrated)
+        timer.lap(WaltzPhase.COMPLETION)
+        self._phase_local.durations = timer.durations
         
         # Store in history
         waltz_result = {
@@ -383,6 +783,49 @@ class ThreeFingerWaltz:
         
         return waltz_result
     
+    def _dance_reentrant(
+        self, 
+        patterns: Optional[List[Dict[str, Any]]], 
+        batch: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute one stateless waltz pass (``reentrant=True``).
+        
+        Args:
+            patterns: Patterns to integrate (falls back to stored patterns)
+            batch: Integrate every pattern instead of only the first
+            
+        Returns:
+            Waltz result dictionary
+        """
+        patterns_to_integrate = patterns if patterns is not None else self.patterns
+        
+        if not patterns_to_integrate:
+            return {
+                "status": "NO_PATTERNS",
+                "message": "✗ No patterns provided for integration",
+                "steps": 0
+            }
+        
+        profiler = self.profiler
+        if batch:
+            with self._span("waltz.batch"):
+                waltz_pass = perform_waltz_batch(patterns_to_integrate)
+        elif self._should_time_phases() or (profiler is not None and profiler.enabled):
+            timer = _PhaseTimer(profiler)
+            pattern = _as_mapping(patterns_to_integrate[0])
+            for phase, transform in _PHASE_TRANSFORMS:
+                pattern = transform(pattern)
+                timer.lap(phase)
+            self._phase_local.durations = timer.durations
+            waltz_pass = WaltzPass(completed=pattern)
+        else:
+            waltz_pass = perform_waltz(patterns_to_integrate[0])
+        with self._lock:
+            self._passes_completed += 1
+        
+        return waltz_pass.to_result()
+    
     def get_current_phase(self) -> str:
         """Get current waltz phase."""
         return self._current_phase.value
@@ -412,6 +855,8 @@ class ThreeFingerWaltz:
     
     def is_ready(self) -> bool:
         """Check if waltz is ready to execute."""
+        if self.reentrant:
+            return True
         return not self._completed and self.recursion_depth < self.max_recursion
     
     def get_status(self) -> Dict[str, Any]:
@@ -431,7 +876,10 @@ class ThreeFingerWaltz:
             "current_phase": self._current_phase.value,
             "completed": self._completed,
             "patterns_count": len(self.patterns),
-            "history_count": len(self.waltz_history)
+            "history_count": len(self.waltz_history),
+            "history_total": self.history_total,
+            "reentrant": self.reentrant,
+            "passes_completed": self._passes_completed
         }
     
     def visualize_waltz(self) -> str:
@@ -524,20 +972,22 @@ class ThreeFingerWaltz:
         self._current_phase = WaltzPhase.INITIATION
         self._energy_conservation = 1.0
         self.recursion_depth = 0
-        self.waltz_history = []
+        self.waltz_history.clear()
+        self._passes_completed = 0
         self._initialized_at = datetime.now()
     
-    def __call__(self, patterns: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def __call__(self, patterns: List[Dict[str, Any]], batch: bool = False) -> Dict[str, Any]:
         """
         Allow direct invocation of waltz.
         
         Args:
             patterns: List of patterns to integrate
+            batch: Integrate every pattern in a single pass
             
         Returns:
             Waltz execution result
         """
-        return self.dance(patterns)
+        return self.dance(patterns, batch=batch)
 
 
 def execute_waltz(phoenix_data: Any, hydro_data: Any, third_data: Any) -> Dict[str, Any]:
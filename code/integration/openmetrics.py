@@ -0,0 +1,432 @@
+"""
+OpenMetrics Exposition
+
+Prometheus/OpenMetrics text exposition of the engine's metrics:
+- MetricFamily: one metric family (counter, gauge or histogram) and its
+  samples, rendered in the OpenMetrics 1.0 text format.
+- MetricsRegistry: the set of collectors behind one scrape endpoint.
+- EngineCollector: exports an IntegrationEngine's waltz metrics
+  (WaltzMetrics counters and duration histograms), pattern cache stats,
+  validation status counts and transition outcomes.
+- start_http_server: optional stdlib HTTP exporter serving ``/metrics``.
+
+Collection is pull-based: collectors read the counters and histograms the
+engine already keeps, and only when scraped, so exposition adds no work
+to the validate/integrate hot path.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import math
+import threading
+
+from .allocations import AllocationTracker
+from .histogram import LogHistogram
+
+if TYPE_CHECKING:
+    from .engine import IntegrationEngine
+
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+METRIC_TYPES = ("counter", "gauge", "histogram")
+
+# Histogram upper bounds (seconds) for waltz durations
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Histogram upper bounds (bytes) for per-stage peak allocations
+ALLOCATION_BUCKETS = tuple(1024 * 4 ** i for i in range(9))
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_value(value: float) -> str:
+    """
+    Format a sample value (integers without a fraction, ``+Inf``/``NaN``).
+    
+    Args:
+        value: Sample value
+        
+    Returns:
+        OpenMetrics number
+    """
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+@dataclass
+class MetricFamily:
+    """
+    One metric family and its samples.
+    
+    Counter samples are exposed with the ``_total`` suffix; histogram
+    samples with ``_bucket``/``_count``/``_sum``. A ``unit`` must be the
+    last component of the family name (``..._seconds``).
+    """
+    
+    name: str
+    type: str
+    help: str
+    unit: str = ""
+    samples: List[Tuple[str, Dict[str, str], float]] = field(default_factory=list)
+    
+    def __post_init__(self):
+        if self.type not in METRIC_TYPES:
+            raise ValueError(f"Unknown metric type {self.type!r} (expected one of {METRIC_TYPES})")
+        if self.unit and not self.name.endswith("_" + self.unit):
+            raise ValueError(f"Metric name {self.name!r} must end with its unit {self.unit!r}")
+    
+    def add(self, value: float, labels: Optional[Dict[str, str]] = None) -> MetricFamily:
+        """
+        Add a counter or gauge sample.
+        
+        Args:
+            value: Sample value
+            labels: Label names and values
+            
+        Returns:
+            This family (for chaining)
+        """
+        if self.type == "histogram":
+            raise ValueError("Use add_histogram() for histogram families")
+        suffix = "_total" if self.type == "counter" else ""
+        self.samples.append((suffix, dict(labels or {}), value))
+        return self
+    
+    def add_histogram(
+        self,
+        histogram: LogHistogram,
+        bounds: Sequence[float] = DEFAULT_BUCKETS,
+        labels: Optional[Dict[str, str]] = None
+    ) -> MetricFamily:
+        """
+        Add the bucket, count and sum samples of a LogHistogram.
+        
+        Args:
+            histogram: Histogram to expose
+            bounds: Ascending ``le`` upper bounds (``+Inf`` is appended)
+            labels: Label names and values shared by the samples
+            
+        Returns:
+            This family (for chaining)
+        """
+        if self.type != "histogram":
+            raise ValueError("add_histogram() needs a histogram family")
+        labels = dict(labels or {})
+        for bound, count in zip(bounds, histogram.bucket_counts(bounds)):
+            self.samples.append(("_bucket", {**labels, "le": format_value(float(bound))}, count))
+        self.samples.append(("_bucket", {**labels, "le": "+Inf"}, histogram.count))
+        self.samples.append(("_count", labels, histogram.count))
+        self.samples.append(("_sum", labels, histogram.total))
+        return self
+    
+    def render(self) -> str:
+        """
+        Render the family in the OpenMetrics text format.
+        
+        Returns:
+            Metadata and sample lines (newline-terminated)
+        """
+        lines = [f"# TYPE {self.name} {self.type}"]
+        if self.unit:
+            lines.append(f"# UNIT {self.name} {self.unit}")
+        if self.help:
+            lines.append(f"# HELP {self.name} {_escape(self.help)}")
+        for suffix, labels, value in self.samples:
+            lines.append(f"{self.name}{suffix}{_format_labels(labels)} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsRegistry:
+    """
+    Collectors exposed together on one endpoint.
+    
+    A collector is any object with a ``collect()`` method (or a plain
+    callable) returning MetricFamily objects; it is called on every scrape.
+    """
+    
+    def __init__(self):
+        """Initialize empty registry."""
+        self._collectors: List[Any] = []
+        self._lock = threading.Lock()
+    
+    def register(self, collector: Any) -> Any:
+        """
+        Add a collector.
+        
+        Args:
+            collector: Object with ``collect()``, or a callable
+            
+        Returns:
+            The collector
+        """
+        with self._lock:
+            self._collectors.append(collector)
+        return collector
+    
+    def unregister(self, collector: Any):
+        """
+        Remove a collector.
+        
+        Args:
+            collector: Previously registered collector
+        """
+        with self._lock:
+            self._collectors.remove(collector)
+    
+    def collect(self) -> List[MetricFamily]:
+        """
+        Gather the metric families of every collector.
+        
+        Returns:
+            Metric families in registration order
+            
+        Raises:
+            ValueError: Two collectors exposed the same family name
+        """
+        with self._lock:
+            collectors = list(self._collectors)
+        families: List[MetricFamily] = []
+        seen = set()
+        for collector in collectors:
+            collect: Callable[[], Iterable[MetricFamily]] = getattr(collector, "collect", collector)
+            for family in collect():
+                if family.name in seen:
+                    raise ValueError(f"Duplicate metric family {family.name!r}")
+                seen.add(family.name)
+                families.append(family)
+        return families
+    
+    def exposition(self) -> str:
+        """
+        Render every family in the OpenMetrics text format.
+        
+        Returns:
+            Exposition text, terminated by ``# EOF``
+        """
+        return "".join(family.render() for family in self.collect()) + "# EOF\n"
+
+
+class EngineCollector:
+    """
+    Exports an IntegrationEngine's metrics.
+    
+    Families (with the default ``integration`` prefix):
+    - integration_waltz_executions / _errors / _patterns (counters) and
+      integration_waltz_duration_seconds, integration_waltz_phase_duration_seconds
+      (histograms) and integration_waltz_duration_window_seconds
+      (rolling-window quantile gauges), when telemetry is enabled
+    - integration_cache_* (entries, bytes, hits, misses, evictions by
+      reason, rejections), when caching is enabled
+    - integration_validations{status} and
+      integration_transitions{from_pillar,to_pillar,status} (counters)
+    - integration_integrated_patterns (counter) and integration_sovereign
+      (gauge)
+    - integration_stage_peak_bytes{stage} (histogram),
+      integration_stage_net_bytes / _net_blocks (gauges),
+      integration_stage_gc_collections and
+      integration_allocation_budget_violations (counters), when an
+      AllocationTracker is attached to the engine's hooks
+    """
+    
+    def __init__(
+        self,
+        engine: IntegrationEngine,
+        prefix: str = "integration",
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        """
+        Initialize collector.
+        
+        Args:
+            engine: Engine to export
+            prefix: Metric family name prefix
+            buckets: Histogram upper bounds in seconds
+        """
+        self.engine = engine
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+    
+    def _family(self, name: str, type: str, help: str, unit: str = "") -> MetricFamily:
+        return MetricFamily(f"{self.prefix}_{name}", type, help, unit)
+    
+    def collect(self) -> List[MetricFamily]:
+        """
+        Read the engine's current metrics.
+        
+        Returns:
+            Metric families
+        """
+        families = self._waltz_families() + self._cache_families() + self._allocation_families()
+        
+        validations = self._family("validations", "counter", "Patterns validated, by overall status")
+        for status, count in self.engine.get_validation_counts().items():
+            validations.add(count, {"status": status})
+        
+        transitions = self._family("transitions", "counter", "Cross-pillar transitions, by outcome")
+        for (from_pillar, to_pillar, status), count in sorted(self.engine.get_transition_counts().items()):
+            transitions.add(count, {"from_pillar": from_pillar, "to_pillar": to_pillar, "status": status})
+        
+        status = self.engine.get_status()
+        families += [
+            validations,
+            transitions,
+            self._family(
+                "integrated_patterns", "counter", "Patterns integrated by completed waltzes"
+            ).add(status["integrated_patterns"]),
+            self._family(
+                "sovereign", "gauge", "1 once the engine has verified sovereignty"
+            ).add(int(status["sovereign"])),
+        ]
+        return families
+    
+    def _waltz_families(self) -> List[MetricFamily]:
+        metrics = getattr(self.engine.meta_operator, "metrics", None)
+        if metrics is None:
+            return []
+        snapshot = metrics.snapshot()
+        
+        duration = self._family(
+            "waltz_duration_seconds", "histogram", "Waltz execution duration", "seconds"
+        ).add_histogram(snapshot["duration"], self.buckets)
+        
+        phases = self._family(
+            "waltz_phase_duration_seconds", "histogram", "Waltz phase duration", "seconds"
+        )
+        for phase, histogram in snapshot["phases"].items():
+            phases.add_histogram(histogram, self.buckets, {"phase": phase})
+        
+        windows = self._family(
+            "waltz_duration_window_seconds", "gauge",
+            "Waltz duration quantiles over rolling windows", "seconds"
+        )
+        for window, summary in snapshot["windows"].items():
+            if window == "all":
+                continue
+            for key, value in summary.items():
+                if key.startswith("p"):
+                    windows.add(value, {"window": window, "quantile": format_value(float(key[1:]) / 100)})
+        
+        return [
+            self._family("waltz_executions", "counter", "Completed waltz calls (including cache hits)").add(snapshot["executions"]),
+            self._family("waltz_errors", "counter", "Failed waltz executions").add(snapshot["errors"]),
+            self._family("waltz_patterns", "counter", "Patterns passed to completed waltz calls").add(snapshot["patterns"]),
+            duration,
+            phases,
+            windows,
+        ]
+    
+    def _allocation_families(self) -> List[MetricFamily]:
+        trackers = self.engine.hooks.find(AllocationTracker)
+        if not trackers:
+            return []
+        tracker = trackers[0]
+        
+        peaks = self._family(
+            "stage_peak_bytes", "histogram", "Peak traced allocation per stage call", "bytes"
+        )
+        for stage, histogram in tracker.histograms().items():
+            peaks.add_histogram(histogram, ALLOCATION_BUCKETS, {"stage": stage})
+        
+        net_bytes = self._family("stage_net_bytes", "gauge", "Traced memory retained by stage calls", "bytes")
+        net_blocks = self._family("stage_net_blocks", "gauge", "Memory blocks retained by stage calls")
+        collections = self._family("stage_gc_collections", "counter", "Garbage collections during stage calls")
+        violations = self._family("allocation_budget_violations", "counter", "Stage calls over their allocation budget")
+        for stage, summary in tracker.summary().items():
+            labels = {"stage": stage}
+            net_bytes.add(summary["net_bytes"], labels)
+            net_blocks.add(summary["net_blocks"], labels)
+            collections.add(summary["gc_collections"], labels)
+            violations.add(summary["violations"], labels)
+        return [peaks, net_bytes, net_blocks, collections, violations]
+    
+    def _cache_families(self) -> List[MetricFamily]:
+        stats = self.engine.get_cache_stats()
+        if not stats:
+            return []
+        evictions = self._family("cache_evictions", "counter", "Pattern cache evictions, by reason")
+        evictions.add(stats["size_evictions"], {"reason": "size"})
+        evictions.add(stats["byte_evictions"], {"reason": "bytes"})
+        families = [
+            self._family("cache_entries", "gauge", "Pattern cache entries").add(stats["size"]),
+            self._family("cache_max_entries", "gauge", "Pattern cache entry limit").add(stats["max_size"]),
+            self._family("cache_bytes", "gauge", "Pattern cache payload size in bytes", "bytes").add(stats["bytes"]),
+        ]
+        if stats["max_bytes"] is not None:
+            families.append(
+                self._family("cache_max_bytes", "gauge", "Pattern cache byte limit", "bytes").add(stats["max_bytes"])
+            )
+        families += [
+            self._family("cache_hits", "counter", "Pattern cache hits").add(stats["total_hits"]),
+            self._family("cache_misses", "counter", "Pattern cache misses").add(stats["total_misses"]),
+            evictions,
+            self._family("cache_rejected", "counter", "Entries too large for the pattern cache").add(stats["rejected"]),
+            self._family("waltz_cache_hits", "counter", "Waltz calls answered from the cache").add(stats["waltz_cache_hits"]),
+            self._family("waltz_cache_misses", "counter", "Waltz calls that ran the waltz").add(stats["waltz_cache_misses"]),
+        ]
+        return families
+
+
+def start_http_server(
+    registry: MetricsRegistry,
+    port: int = 9464,
+    addr: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """
+    Serve ``GET /metrics`` from a daemon thread.
+    
+    Args:
+        registry: Registry to expose
+        port: TCP port (0 picks a free one; see ``server.server_address``)
+        addr: Bind address (loopback by default)
+        
+    Returns:
+        Running server; stop it with ``shutdown()`` and ``server_close()``
+    """
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            try:
+                body = registry.exposition().encode("utf-8")
+            except Exception as e:
+                self.send_error(500, str(e))
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="openmetrics-exporter", daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,382 @@
+"""
+Struct-of-Arrays Pattern Storage
+
+Provides PatternBatch, a compact container for large numbers of
+IntegrationPatterns. Instead of one object (and its containers) per
+pattern, every field is stored as a column: typed ``array`` buffers for
+the numeric and boolean fields (exposed as NumPy arrays when NumPy is
+installed), small integer codes into a per-field vocabulary of interned
+strings for the low-cardinality string fields, and plain lists for the
+remaining object fields.
+
+``UniversalLaws.validate_many`` (and ``IntegrationEngine.validate_many``)
+validate a batch straight from its columns; indexing or iterating a batch
+materializes IntegrationPattern rows for everything else.
+
+Batches can also wrap existing NumPy columns (``from_columns``), e.g.
+memory-mapped file data (see ``columnar``); such columns are used as-is
+until the first ``append``, which copies them into growable buffers.
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+import math
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+from .engine import IntegrationPattern, PATTERN_FIELDS
+
+
+# Column layout (every PATTERN_FIELDS entry appears in exactly one group)
+INT_FIELDS = ("recursion_depth",)
+FLOAT_FIELDS = (
+    "similarity_ratio", "stability_score", "embedding_ratio", "coherence", "threshold",
+)
+FLAG_FIELDS = (
+    "converges", "stable", "threshold_managed", "invariant_preserved", "closed",
+    "sovereignty",
+)
+INTERNED_FIELDS = ("pillar", "mode", "apex", "invariant")
+OBJECT_FIELDS = ("name", "structure", "operators", "convergence_point")
+
+# array typecode and NumPy dtype per numeric column group
+_COLUMN_TYPES = {
+    INT_FIELDS: ("q", "int64"),
+    FLOAT_FIELDS: ("d", "float64"),
+    FLAG_FIELDS: ("b", "bool"),
+}
+_FIELD_TYPES = {name: types for fields, types in _COLUMN_TYPES.items() for name in fields}
+
+
+class PatternBatch:
+    """
+    Column-oriented storage for many IntegrationPatterns.
+    
+    Rows are normalized on the way in: dict rows are read as
+    ``IntegrationPattern(**row)`` (so missing fields take the dataclass
+    defaults), floats are stored as float64, flags as bools and a ``None``
+    threshold as NaN; a non-integral ``recursion_depth`` is rejected.
+    Fingerprints and incremental validation state are not stored.
+    """
+    
+    def __init__(self, patterns: Iterable[Any] = ()):
+        """
+        Initialize pattern batch.
+        
+        Args:
+            patterns: Initial patterns (dicts or IntegrationPattern objects)
+        """
+        self._numeric: Dict[str, Any] = {
+            name: array(typecode) for name, (typecode, _) in _FIELD_TYPES.items()
+        }
+        self._codes: Dict[str, Any] = {name: array("i") for name in INTERNED_FIELDS}
+        self._vocab: Dict[str, List[Optional[str]]] = {name: [] for name in INTERNED_FIELDS}
+        self._vocab_index: Dict[str, Dict[Optional[str], int]] = {
+            name: {} for name in INTERNED_FIELDS
+        }
+        self._objects: Dict[str, List[Any]] = {name: [] for name in OBJECT_FIELDS}
+        # Object columns decoded on first access (see from_columns)
+        self._pending: Dict[str, Callable[[], List[Any]]] = {}
+        self._length = 0
+        self.extend(patterns)
+    
+    @classmethod
+    def from_patterns(cls, patterns: Iterable[Any]) -> PatternBatch:
+        """
+        Build a batch from patterns.
+        
+        Args:
+            patterns: Dicts or IntegrationPattern objects
+            
+        Returns:
+            New PatternBatch
+        """
+        return cls(patterns)
+    
+    @classmethod
+    def from_columns(
+        cls,
+        length: int,
+        numeric: Mapping[str, Any],
+        codes: Mapping[str, Any],
+        vocabularies: Mapping[str, List[Optional[str]]],
+        objects: Mapping[str, Union[List[Any], Callable[[], List[Any]]]]
+    ) -> PatternBatch:
+        """
+        Wrap existing column arrays without building per-row objects.
+        
+        Numeric arrays whose dtype already matches are used as read-only
+        views (memory-mapped arrays stay on disk); others are converted.
+        
+        Args:
+            length: Number of rows
+            numeric: INT/FLOAT/FLAG field -> NumPy array (NaN threshold
+                     means None)
+            codes: INTERNED field -> integer codes into its vocabulary
+            vocabularies: INTERNED field -> distinct values, indexed by code
+            objects: OBJECT field -> list of values, or a callable returning
+                     that list (decoded lazily, on first access)
+            
+        Returns:
+            New PatternBatch
+            
+        Raises:
+            ValueError: If a field is missing, a column has the wrong length
+                        or an INT column holds non-integral values
+        """
+        if np is None:
+            raise ImportError("NumPy is required for PatternBatch.from_columns")
+        
+        batch = cls()
+        for name in INT_FIELDS:
+            column = np.asarray(numeric[name])
+            if column.dtype.kind == "f" and not np.array_equal(column, np.trunc(column)):
+                raise ValueError(f"Column {name!r} holds non-integral values")
+        for name in batch._numeric:
+            batch._numeric[name] = cls._readonly(numeric[name], _FIELD_TYPES[name][1], length, name)
+        for name in INTERNED_FIELDS:
+            batch._codes[name] = cls._readonly(codes[name], "int32", length, name)
+            batch._vocab[name] = list(vocabularies[name])
+            batch._vocab_index[name] = {
+                value: code for code, value in enumerate(batch._vocab[name])
+            }
+        for name in OBJECT_FIELDS:
+            column = objects[name]
+            if callable(column):
+                del batch._objects[name]
+                batch._pending[name] = column
+            elif len(column) != length:
+                raise ValueError(f"Column {name!r} has {len(column)} rows, expected {length}")
+            else:
+                batch._objects[name] = list(column)
+        batch._length = length
+        return batch
+    
+    @staticmethod
+    def _readonly(column: Any, dtype: str, length: int, name: str) -> Any:
+        """Column as a read-only NumPy array of ``dtype`` (no copy if it matches)."""
+        column = np.asarray(column, dtype=dtype).view()
+        if column.shape != (length,):
+            raise ValueError(f"Column {name!r} has shape {column.shape}, expected ({length},)")
+        column.flags.writeable = False
+        return column
+    
+    def _object_column(self, name: str) -> List[Any]:
+        """Values of an object field, decoding a lazily loaded column once."""
+        if name in self._pending:
+            self._objects[name] = list(self._pending.pop(name)())
+        return self._objects[name]
+    
+    def _make_growable(self):
+        """Copy wrapped NumPy columns into appendable ``array`` buffers."""
+        for name, buffer in self._numeric.items():
+            if not isinstance(buffer, array):
+                typecode, dtype = _FIELD_TYPES[name]
+                growable = array(typecode)
+                growable.frombytes(np.ascontiguousarray(buffer, dtype=dtype).tobytes())
+                self._numeric[name] = growable
+        for name, buffer in self._codes.items():
+            if not isinstance(buffer, array):
+                growable = array("i")
+                growable.frombytes(np.ascontiguousarray(buffer, dtype=np.intc).tobytes())
+                self._codes[name] = growable
+        for name in list(self._pending):
+            self._object_column(name)
+    
+    def append(self, pattern: Any):
+        """
+        Add one pattern as a new row.
+        
+        Args:
+            pattern: Pattern dict or IntegrationPattern
+        """
+        if not isinstance(pattern, IntegrationPattern):
+            pattern = IntegrationPattern(
+                **{name: pattern[name] for name in PATTERN_FIELDS if name in pattern}
+            )
+        
+        # Convert everything first so a bad value leaves the batch unchanged
+        self._make_growable()
+        numeric = {}
+        for name in INT_FIELDS:
+            value = getattr(pattern, name)
+            numeric[name] = int(value)
+            if numeric[name] != value:
+                # Truncating would change the laws' verdict for the row
+                raise ValueError(f"Field {name!r} must be integral, got {value!r}")
+        for name in FLOAT_FIELDS:
+            value = getattr(pattern, name)
+            numeric[name] = math.nan if value is None else float(value)
+        for name in FLAG_FIELDS:
+            numeric[name] = 1 if getattr(pattern, name) else 0
+        
+        for name, value in numeric.items():
+            self._numeric[name].append(value)
+        for name in INTERNED_FIELDS:
+            self._codes[name].append(self._intern(name, getattr(pattern, name)))
+        for name in OBJECT_FIELDS:
+            self._objects[name].append(getattr(pattern, name))
+        self._length += 1
+    
+    def extend(self, patterns: Iterable[Any]):
+        """
+        Add several patterns.
+        
+        Args:
+            patterns: Dicts or IntegrationPattern objects
+        """
+        for pattern in patterns:
+            self.append(pattern)
+    
+    def _intern(self, name: str, value: Optional[str]) -> int:
+        """Vocabulary code for a string field value (added on first use)."""
+        index = self._vocab_index[name]
+        code = index.get(value)
+        if code is None:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            code = len(self._vocab[name])
+            self._vocab[name].append(value)
+            index[value] = code
+        return code
+    
+    def column(self, name: str) -> Any:
+        """
+        One field for every row.
+        
+        Args:
+            name: Pattern field name
+            
+        Returns:
+            NumPy array for numeric/flag fields (an ``array`` copy without
+            NumPy; wrapped columns are returned as their read-only view),
+            otherwise a list of values
+        """
+        if name in self._numeric:
+            buffer = self._numeric[name]
+            if np is None:
+                return array(buffer.typecode, buffer)
+            if not isinstance(buffer, array):
+                return buffer
+            return np.array(buffer, dtype=_FIELD_TYPES[name][1])
+        if name in self._codes:
+            vocab = self._vocab[name]
+            return [vocab[code] for code in self._codes[name]]
+        if name in OBJECT_FIELDS:
+            return list(self._object_column(name))
+        raise KeyError(name)
+    
+    def codes(self, name: str) -> Any:
+        """
+        Vocabulary codes of an interned string field.
+        
+        Args:
+            name: One of INTERNED_FIELDS
+            
+        Returns:
+            Codes per row (NumPy int32 array when available); see ``vocabulary``
+        """
+        codes = self._codes[name]
+        if np is None:
+            return array("i", codes)
+        return codes if not isinstance(codes, array) else np.array(codes, dtype=np.int32)
+    
+    def vocabulary(self, name: str) -> List[Optional[str]]:
+        """
+        Distinct values of an interned string field, indexed by code.
+        
+        Args:
+            name: One of INTERNED_FIELDS
+            
+        Returns:
+            List of values
+        """
+        return list(self._vocab[name])
+    
+    def is_none(self, name: str) -> Any:
+        """
+        Which rows hold ``None`` in a field.
+        
+        Args:
+            name: Pattern field name
+            
+        Returns:
+            Boolean NumPy array (list of bools without NumPy)
+        """
+        if name in self._codes:
+            none_code = self._vocab_index[name].get(None, -1)
+            if np is not None:
+                return self.codes(name) == none_code
+            return [code == none_code for code in self._codes[name]]
+        if name in FLOAT_FIELDS:
+            values = self._numeric[name]
+            if np is not None:
+                return np.isnan(self.column(name))
+            return [math.isnan(value) for value in values]
+        if name in OBJECT_FIELDS:
+            flags = [value is None for value in self._object_column(name)]
+            return np.array(flags, dtype=bool) if np is not None else flags
+        # Int and flag columns never hold None
+        if np is not None:
+            return np.zeros(self._length, dtype=bool)
+        return [False] * self._length
+    
+    def row(self, index: int) -> IntegrationPattern:
+        """
+        Materialize one row.
+        
+        Args:
+            index: Row index (negative indices count from the end)
+            
+        Returns:
+            IntegrationPattern with the row's values
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("PatternBatch index out of range")
+        
+        # int()/float() also unwrap NumPy scalars of wrapped columns
+        values: Dict[str, Any] = {}
+        for name in INT_FIELDS:
+            values[name] = int(self._numeric[name][index])
+        for name in FLOAT_FIELDS:
+            value = float(self._numeric[name][index])
+            values[name] = None if name == "threshold" and math.isnan(value) else value
+        for name in FLAG_FIELDS:
+            values[name] = bool(self._numeric[name][index])
+        for name in INTERNED_FIELDS:
+            values[name] = self._vocab[name][self._codes[name][index]]
+        for name in OBJECT_FIELDS:
+            values[name] = self._object_column(name)[index]
+        return IntegrationPattern(**values)
+    
+    def to_patterns(self) -> List[IntegrationPattern]:
+        """Materialize every row."""
+        return [self.row(index) for index in range(self._length)]
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the numeric and code columns."""
+        buffers = list(self._numeric.values()) + list(self._codes.values())
+        return sum(len(buffer) * buffer.itemsize for buffer in buffers)
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PatternBatch(self.row(i) for i in range(*index.indices(self._length)))
+        return self.row(index)
+    
+    def __iter__(self) -> Iterator[IntegrationPattern]:
+        for index in range(self._length):
+            yield self.row(index)
+    
+    def __repr__(self) -> str:
+        return f"PatternBatch(rows={self._length}, nbytes={self.nbytes})"
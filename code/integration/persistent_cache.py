@@ -0,0 +1,490 @@
+"""
+Persistent Waltz Result Cache
+
+Provides an on-disk, memory-mapped store of Three-Finger Waltz results
+that survives worker restarts and is shared by every engine process on a
+host. Used as a second cache level behind the in-process PatternCache.
+
+Layout (one directory per cache):
+- waltz_cache.dat:  append-only log of records, read through mmap
+- waltz_cache.lock: advisory lock file (fcntl.flock)
+
+Each record is ``<magic, key_len, payload_len, created_at, crc32>``
+followed by the ASCII key (the pattern fingerprint) and the JSON-encoded
+result; the CRC covers the header fields, key and payload. Scanning
+stops at the first record that is incomplete or fails its check (a torn
+tail left by a crashed writer), and the next writer truncates the log
+back to the last good record before appending. The in-memory index
+(key → payload offset) is rebuilt by scanning the log on start-up (warm
+start) and extended incrementally when other processes append. Writers
+append under an exclusive lock; when the TTL/size limits are exceeded
+the log is compacted into a fresh file and atomically swapped in with
+``os.replace``. Readers notice the swap by inode change.
+
+On platforms without ``fcntl`` the store still works but locking is a
+no-op, so it is only safe for a single writer process. Within a process,
+threads are serialized by an instance mutex (flock alone does not exclude
+threads sharing one descriptor).
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+
+from .cache import freeze, thaw
+from .fingerprint import PatternFingerprinter, HASH_MODES
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+class PersistentPatternCache:
+    """
+    mmap-backed on-disk cache for waltz results shared across processes.
+    
+    Mirrors the PatternCache interface (``key_for``/``get``/``put``/
+    ``stats``/``clear``). Results are returned frozen, like PatternCache.
+    """
+    
+    DATA_FILE = "waltz_cache.dat"
+    LOCK_FILE = "waltz_cache.lock"
+    
+    _MAGIC = b"TFWCACHE2"
+    _HEADER = struct.Struct("<9s16s")  # magic, hash mode
+    _RECORD_MAGIC = b"TFWR"
+    # record magic, key length, payload length, created_at, CRC32
+    _RECORD = struct.Struct("<4sIIdI")
+    
+    # Compaction shrinks the store to this fraction of its limits so that
+    # it does not have to compact again on the very next insert.
+    COMPACT_RATIO = 0.75
+    
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        hash_mode: str = "sha256",
+        fsync: bool = False
+    ):
+        """
+        Open (or create) a persistent cache directory.
+        
+        Args:
+            path: Cache directory (created if missing)
+            ttl_seconds: Entries older than this are treated as missing
+                         and dropped on compaction (None = no expiry)
+            max_bytes: Maximum size of the data file before compaction
+            max_entries: Maximum number of live entries before compaction
+            hash_mode: Fingerprint hash mode used for keys; must match the
+                       mode the store was created with
+            fsync: fsync the data file after every write
+        """
+        if hash_mode not in HASH_MODES:
+            raise ValueError(f"Unknown hash mode {hash_mode!r} (expected one of {HASH_MODES})")
+        
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hash_mode = hash_mode
+        self.fsync = fsync
+        self.fingerprinter = PatternFingerprinter(hash_mode)
+        
+        self._data_path = os.path.join(path, self.DATA_FILE)
+        self._lock_path = os.path.join(path, self.LOCK_FILE)
+        
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+        self._inode: Optional[int] = None
+        self._scanned_to = 0
+        # key -> (payload offset, payload length, created_at)
+        self._index: Dict[str, Tuple[int, int, float]] = {}
+        
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._writes = 0
+        self._compactions = 0
+        
+        self._mutex = threading.RLock()
+        os.makedirs(path, exist_ok=True)
+        self._lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        
+        # Warm start: map the existing log and build the index
+        with self._locked(exclusive=True):
+            self._ensure_data_file()
+        with self._locked(exclusive=False):
+            self._refresh()
+    
+    # ------------------------------------------------------------------
+    # Pickling (process pools reopen the store by path)
+    # ------------------------------------------------------------------
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "ttl_seconds": self.ttl_seconds,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            "hash_mode": self.hash_mode,
+            "fsync": self.fsync,
+        }
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(**state)
+    
+    # ------------------------------------------------------------------
+    # Locking and mapping
+    # ------------------------------------------------------------------
+    
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """Hold the instance mutex and the advisory lock file."""
+        with self._mutex:
+            if fcntl is None:
+                yield
+                return
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+    
+    def _ensure_data_file(self):
+        """Create the data file with its header, or check the header."""
+        try:
+            with open(self._data_path, "xb") as f:
+                f.write(self._HEADER.pack(self._MAGIC, self.hash_mode.encode()))
+            return
+        except FileExistsError:
+            pass
+        
+        with open(self._data_path, "rb") as f:
+            raw = f.read(self._HEADER.size)
+        if len(raw) < self._HEADER.size:
+            raise ValueError(f"Corrupt waltz cache header in {self._data_path}")
+        magic, mode = self._HEADER.unpack(raw)
+        if magic != self._MAGIC:
+            raise ValueError(f"{self._data_path} is not a waltz cache file")
+        stored_mode = mode.rstrip(b"\0").decode()
+        if stored_mode != self.hash_mode:
+            raise ValueError(
+                f"Waltz cache at {self.path} uses hash mode {stored_mode!r}, "
+                f"not {self.hash_mode!r}"
+            )
+    
+    @classmethod
+    def _record_crc(cls, key_len: int, payload_len: int, created_at: float, data: bytes) -> int:
+        """CRC32 of a record's header fields and its key + payload bytes."""
+        header = cls._RECORD.pack(cls._RECORD_MAGIC, key_len, payload_len, created_at, 0)
+        return zlib.crc32(data, zlib.crc32(header))
+    
+    @classmethod
+    def _pack_record(cls, key_bytes: bytes, payload: bytes, created_at: float) -> bytes:
+        """Encode one log record."""
+        data = key_bytes + payload
+        crc = cls._record_crc(len(key_bytes), len(payload), created_at, data)
+        return cls._RECORD.pack(
+            cls._RECORD_MAGIC, len(key_bytes), len(payload), created_at, crc
+        ) + data
+    
+    def _close_mapping(self):
+        """Release the current mmap and file handle."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._mapped_size = 0
+    
+    def _refresh(self):
+        """
+        Pick up records appended (or a compaction done) by any process.
+        
+        Caller must hold the lock (shared is enough).
+        """
+        stat = os.stat(self._data_path)
+        
+        if stat.st_ino != self._inode:
+            # New or compacted file: remap and rebuild the index
+            self._close_mapping()
+            self._index.clear()
+            self._inode = stat.st_ino
+            self._scanned_to = self._HEADER.size
+        
+        # Also remap when a writer truncated a torn tail, so the map never
+        # extends past end of file
+        if stat.st_size != self._mapped_size:
+            self._close_mapping()
+            self._file = open(self._data_path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = len(self._mmap)
+        
+        self._scan()
+    
+    def _scan(self):
+        """Index valid records between ``_scanned_to`` and end of map."""
+        buf = self._mmap
+        if buf is None:
+            return
+        offset = self._scanned_to
+        end = self._mapped_size
+        header_size = self._RECORD.size
+        
+        while offset + header_size <= end:
+            magic, key_len, payload_len, created_at, crc = self._RECORD.unpack_from(buf, offset)
+            record_end = offset + header_size + key_len + payload_len
+            if magic != self._RECORD_MAGIC or record_end > end:
+                break  # torn or partially written tail
+            key_start = offset + header_size
+            data = buf[key_start:record_end]
+            if self._record_crc(key_len, payload_len, created_at, data) != crc:
+                break
+            key = data[:key_len].decode("ascii")
+            self._index[key] = (key_start + key_len, payload_len, created_at)
+            offset = record_end
+        
+        self._scanned_to = offset
+    
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+    
+    # ------------------------------------------------------------------
+    # Cache interface
+    # ------------------------------------------------------------------
+    
+    def key_for(self, patterns: List[Any], namespace: str = "") -> str:
+        """
+        Compute the cache key for a pattern list.
+        
+        Args:
+            patterns: List of patterns to fingerprint
+            namespace: Optional key prefix separating result kinds
+            
+        Returns:
+            Hexadecimal fingerprint
+        """
+        return self.fingerprinter.key(patterns, namespace)
+    
+    def get(
+        self,
+        patterns: List[Any],
+        namespace: str = "",
+        key: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Retrieve a stored result.
+        
+        Args:
+            patterns: List of patterns to look up
+            namespace: Optional key prefix (see ``key_for``)
+            key: Precomputed key (skips fingerprinting)
+            
+        Returns:
+            Frozen result, or None if missing or expired
+        """
+        pattern_hash = key if key is not None else self.key_for(patterns, namespace)
+        
+        with self._mutex:
+            entry = self._index.get(pattern_hash)
+            if entry is None:
+                # Another process may have written it since our last scan
+                with self._locked(exclusive=False):
+                    self._refresh()
+                entry = self._index.get(pattern_hash)
+            
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            payload_offset, payload_len, created_at = entry
+            if self._is_expired(created_at, time.time()):
+                self._expired += 1
+                self._misses += 1
+                return None
+            
+            payload = self._mmap[payload_offset:payload_offset + payload_len]
+            self._hits += 1
+        return freeze(json.loads(payload))
+    
+    def put(
+        self,
+        patterns: List[Any],
+        result: Any,
+        namespace: str = "",
+        key: Optional[str] = None
+    ):
+        """
+        Append a result to the store.
+        
+        Args:
+            patterns: List of patterns that were integrated
+            result: Result to store (plain or frozen)
+            namespace: Optional key prefix (see ``key_for``)
+            key: Precomputed key (skips fingerprinting)
+        """
+        pattern_hash = key if key is not None else self.key_for(patterns, namespace)
+        key_bytes = pattern_hash.encode("ascii")
+        payload = json.dumps(thaw(result), default=str, separators=(",", ":")).encode()
+        record = self._pack_record(key_bytes, payload, time.time())
+        
+        with self._locked(exclusive=True):
+            self._refresh()
+            with open(self._data_path, "r+b") as f:
+                # Drop any torn tail so the new record follows the last good one
+                f.seek(self._scanned_to)
+                f.truncate()
+                f.write(record)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            self._writes += 1
+            self._refresh()
+            
+            if self._over_limits():
+                self._compact()
+    
+    def _over_limits(self) -> bool:
+        if self.max_bytes is not None and self._scanned_to > self.max_bytes:
+            return True
+        if self.max_entries is not None and len(self._index) > self.max_entries:
+            return True
+        return False
+    
+    def _compact(self):
+        """
+        Rewrite the log with only live entries, newest first, within limits.
+        
+        Caller must hold the exclusive lock.
+        """
+        now = time.time()
+        live = sorted(
+            (
+                (created_at, key, offset, length)
+                for key, (offset, length, created_at) in self._index.items()
+                if not self._is_expired(created_at, now)
+            ),
+            reverse=True
+        )
+        
+        byte_budget = (
+            int(self.max_bytes * self.COMPACT_RATIO) if self.max_bytes is not None else None
+        )
+        entry_budget = (
+            int(self.max_entries * self.COMPACT_RATIO) if self.max_entries is not None else None
+        )
+        
+        tmp_path = f"{self._data_path}.{os.getpid()}.tmp"
+        written = self._HEADER.size
+        kept: List[Tuple[float, str, int, int]] = []
+        for created_at, key, offset, length in live:
+            record_size = self._RECORD.size + len(key) + length
+            if byte_budget is not None and written + record_size > byte_budget:
+                break
+            if entry_budget is not None and len(kept) >= entry_budget:
+                break
+            kept.append((created_at, key, offset, length))
+            written += record_size
+        
+        with open(tmp_path, "wb") as f:
+            f.write(self._HEADER.pack(self._MAGIC, self.hash_mode.encode()))
+            # Oldest first so that append order stays chronological
+            for created_at, key, offset, length in reversed(kept):
+                payload = self._mmap[offset:offset + length]
+                f.write(self._pack_record(key.encode("ascii"), payload, created_at))
+            f.flush()
+            os.fsync(f.fileno())
+        
+        os.replace(tmp_path, self._data_path)
+        self._compactions += 1
+        self._refresh()
+    
+    def items(self, limit: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate live entries, newest first.
+        
+        Args:
+            limit: Maximum number of entries to yield
+            
+        Yields:
+            (key, frozen result) pairs
+        """
+        with self._locked(exclusive=False):
+            self._refresh()
+            now = time.time()
+            entries = sorted(
+                (
+                    (created_at, key)
+                    for key, (_, _, created_at) in self._index.items()
+                    if not self._is_expired(created_at, now)
+                ),
+                reverse=True
+            )
+        if limit is not None:
+            entries = entries[:limit]
+        for _, key in entries:
+            # Re-resolve under the mutex: a compaction may have moved it
+            with self._mutex:
+                entry = self._index.get(key)
+                if entry is None:
+                    continue
+                offset, length, _ = entry
+                payload = self._mmap[offset:offset + length]
+            yield key, freeze(json.loads(payload))
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+        
+        Returns:
+            Dictionary with store metrics
+        """
+        total = self._hits + self._misses
+        return {
+            "path": self.path,
+            "entries": len(self._index),
+            "bytes": self._scanned_to,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": self._hits / total if total > 0 else 0.0,
+            "total_hits": self._hits,
+            "total_misses": self._misses,
+            "expired": self._expired,
+            "writes": self._writes,
+            "compactions": self._compactions
+        }
+    
+    def clear(self):
+        """Remove every stored result (for all processes)."""
+        with self._locked(exclusive=True):
+            tmp_path = f"{self._data_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(self._HEADER.pack(self._MAGIC, self.hash_mode.encode()))
+            os.replace(tmp_path, self._data_path)
+            self._refresh()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._writes = 0
+        self._compactions = 0
+    
+    def close(self):
+        """Release the mapping and lock file descriptor."""
+        self._close_mapping()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
@@ -0,0 +1,336 @@
+"""
+Span Profiler
+
+Wall-clock span tracing for the integration pipeline:
+- SpanProfiler: records nested, named spans per thread while enabled.
+  Each finished top-level span is kept (with its children) as one trace
+  in a bounded ring, so memory is capped by ``capacity``.
+- Exports: Chrome trace-event JSON (``chrome://tracing`` / Perfetto) and
+  folded stacks (``root;child;leaf <self-time-ns>``) ready for
+  flamegraph.pl, speedscope or inferno.
+- traced: method decorator opening a span when the owner's profiler is
+  enabled.
+
+Span names used by the engine:
+- ``engine.<method>`` for validate / validate_many / transition /
+  integrate / full_integration_cycle / generate_report, and
+  ``validator.quick_check``
+- ``waltz`` (instrumented waltz call), ``waltz.dance``, ``waltz.batch``
+  and ``phase.<phase>`` (initiation, transformation, integration,
+  completion)
+- ``cache.hash``, ``cache.lookup``, ``cache.persistent_lookup``,
+  ``cache.store``
+
+Telemetry logging and metrics are not spans of their own: they are the
+self time of the ``waltz`` span.
+
+A disabled profiler hands out one shared no-op context manager, so
+instrumented code pays one attribute check per span.
+"""
+
+from __future__ import annotations
+from collections import deque
+from contextlib import nullcontext
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+import functools
+import json
+import os
+import threading
+import time
+
+
+# Context manager handed out while tracing is off
+NULL_SPAN = nullcontext()
+
+
+class Span:
+    """One timed region and the spans nested inside it."""
+    
+    __slots__ = ("name", "start_ns", "end_ns", "thread_id", "args", "children")
+    
+    def __init__(self, name: str, start_ns: int, thread_id: int, args: Optional[Dict[str, Any]] = None):
+        """
+        Initialize span.
+        
+        Args:
+            name: Span name
+            start_ns: Start time in nanoseconds (profiler clock)
+            thread_id: Identifier of the recording thread
+            args: Optional annotations (exported with the span)
+        """
+        self.name = name
+        self.start_ns = start_ns
+        self.end_ns = start_ns
+        self.thread_id = thread_id
+        self.args = args
+        self.children: List[Span] = []
+    
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, {self.duration_ns} ns, children={len(self.children)})"
+    
+    @property
+    def duration_ns(self) -> int:
+        """Wall time from start to end."""
+        return self.end_ns - self.start_ns
+    
+    @property
+    def self_ns(self) -> int:
+        """Wall time not covered by child spans."""
+        return self.duration_ns - sum(child.duration_ns for child in self.children)
+    
+    def walk(self, stack: Tuple[str, ...] = ()) -> Iterator[Tuple[Tuple[str, ...], Span]]:
+        """
+        Iterate over this span and its descendants, depth first.
+        
+        Args:
+            stack: Names of the enclosing spans
+            
+        Yields:
+            (stack of names ending with the span's own, span) pairs
+        """
+        stack = stack + (self.name,)
+        yield stack, self
+        for child in self.children:
+            yield from child.walk(stack)
+
+
+class _ActiveSpan:
+    """Context manager opening and closing one span."""
+    
+    __slots__ = ("profiler", "name", "args", "span")
+    
+    def __init__(self, profiler: SpanProfiler, name: str, args: Optional[Dict[str, Any]]):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+        self.span: Optional[Span] = None
+    
+    def __enter__(self) -> Span:
+        self.span = self.profiler._open(self.name, self.args)
+        return self.span
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.span.args = {**(self.span.args or {}), "error": exc_type.__name__}
+        self.profiler._close(self.span)
+
+
+class SpanProfiler:
+    """
+    Records nested spans per thread into a bounded ring of traces.
+    
+    Spans opened while another span of the same thread is open become its
+    children; a span opened with no enclosing span starts a new trace.
+    Thread-safe: each thread has its own span stack and finished traces
+    are appended under a lock.
+    """
+    
+    def __init__(
+        self,
+        capacity: int = 10000,
+        enabled: bool = True,
+        clock: Callable[[], int] = time.perf_counter_ns
+    ):
+        """
+        Initialize profiler.
+        
+        Args:
+            capacity: Maximum number of traces kept (oldest are dropped)
+            enabled: Start recording immediately
+            clock: Nanosecond clock
+        """
+        self.capacity = capacity
+        self.enabled = enabled
+        self.clock = clock
+        self._traces: Deque[Span] = deque(maxlen=capacity)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Start recording spans."""
+        self.enabled = True
+    
+    def stop(self):
+        """Stop recording spans (spans already open still finish)."""
+        self.enabled = False
+    
+    def clear(self):
+        """Drop every recorded trace."""
+        with self._lock:
+            self._traces.clear()
+    
+    def _stack(self) -> List[Span]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+    
+    def _open(self, name: str, args: Optional[Dict[str, Any]]) -> Span:
+        span = Span(name, self.clock(), threading.get_ident(), args)
+        stack = self._stack()
+        if stack:
+            stack[-1].children.append(span)
+        stack.append(span)
+        return span
+    
+    def _close(self, span: Span):
+        span.end_ns = self.clock()
+        stack = self._stack()
+        stack.pop()
+        if not stack:
+            with self._lock:
+                self._traces.append(span)
+    
+    def span(self, name: str, **args: Any):
+        """
+        Context manager timing a block as a span.
+        
+        Args:
+            name: Span name
+            **args: Annotations exported with the span
+            
+        Returns:
+            Context manager yielding the Span (None while disabled)
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return _ActiveSpan(self, name, args or None)
+    
+    def add(self, name: str, start_ns: int, end_ns: int, **args: Any) -> Optional[Span]:
+        """
+        Record an already-timed region as a span.
+        
+        The span becomes a child of the thread's open span (or a trace of
+        its own when none is open).
+        
+        Args:
+            name: Span name
+            start_ns: Start time (profiler clock)
+            end_ns: End time (profiler clock)
+            **args: Annotations exported with the span
+            
+        Returns:
+            The recorded Span (None while disabled)
+        """
+        if not self.enabled:
+            return None
+        span = Span(name, start_ns, threading.get_ident(), args or None)
+        span.end_ns = end_ns
+        stack = self._stack()
+        if stack:
+            stack[-1].children.append(span)
+        else:
+            with self._lock:
+                self._traces.append(span)
+        return span
+    
+    def traces(self) -> List[Span]:
+        """
+        Recorded traces, oldest first.
+        
+        Returns:
+            Top-level spans (a copy of the ring)
+        """
+        with self._lock:
+            return list(self._traces)
+    
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Build a Chrome trace-event document.
+        
+        Every span is a complete ("X") event; timestamps are microseconds
+        on the profiler clock.
+        
+        Returns:
+            Dictionary with ``traceEvents``, loadable by chrome://tracing
+            and Perfetto once serialized to JSON
+        """
+        pid = os.getpid()
+        events = []
+        for trace in self.traces():
+            for _, span in trace.walk():
+                event = {
+                    "name": span.name,
+                    "cat": span.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": span.start_ns / 1000.0,
+                    "dur": span.duration_ns / 1000.0,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                }
+                if span.args:
+                    event["args"] = span.args
+                events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ns"}
+    
+    def write_chrome_trace(self, path: str) -> int:
+        """
+        Write the Chrome trace-event JSON file.
+        
+        Args:
+            path: Destination path
+            
+        Returns:
+            Number of events written
+        """
+        document = self.chrome_trace()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, default=str)
+        return len(document["traceEvents"])
+    
+    def folded_stacks(self) -> Dict[str, int]:
+        """
+        Aggregate self time per span stack.
+        
+        Returns:
+            Dictionary mapping ``root;child;leaf`` stacks to their total
+            self time in nanoseconds
+        """
+        folded: Dict[str, int] = {}
+        for trace in self.traces():
+            for stack, span in trace.walk():
+                key = ";".join(stack)
+                folded[key] = folded.get(key, 0) + max(span.self_ns, 0)
+        return folded
+    
+    def write_folded(self, path: str) -> int:
+        """
+        Write folded stacks (one ``stack weight`` line each) for flame graphs.
+        
+        Args:
+            path: Destination path
+            
+        Returns:
+            Number of lines written
+        """
+        folded = self.folded_stacks()
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, weight in sorted(folded.items()):
+                f.write(f"{stack} {weight}\n")
+        return len(folded)
+
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorate a method to run inside a span of its owner's profiler.
+    
+    The owner's ``profiler`` attribute may be None; no span is opened then
+    or while the profiler is disabled.
+    
+    Args:
+        name: Span name
+        
+    Returns:
+        Method decorator
+    """
+    def decorator(method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            profiler = self.profiler
+            if profiler is None or not profiler.enabled:
+                return method(self, *args, **kwargs)
+            with _ActiveSpan(profiler, name, None):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,192 @@
+"""
+Bounded Retention for Engine Histories
+
+Provides RetentionBuffer, a list-like ring buffer used for the engine's
+integrated patterns and the waltz history. Each entry holds a full
+completed pattern (whose triad references every earlier phase dict), so
+long-running engines keep only the most recent entries, bounded by count
+and/or estimated bytes. Evicted entries can be spilled to a JSONL file
+instead of being dropped, and all-time totals are kept regardless, so
+status reporting does not depend on what is still retained.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterator, List, Optional
+from collections import deque
+import json
+
+
+class RetentionBuffer:
+    """
+    Ring buffer with count/byte caps, optional spill-to-disk and totals.
+    
+    Supports the list operations the engine uses (``append``, ``extend``,
+    ``pop``, ``len``, iteration, indexing, truthiness and equality with a
+    list). With no limits it behaves like an unbounded list that also
+    counts totals.
+    """
+    
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        spill_path: Optional[str] = None
+    ):
+        """
+        Initialize retention buffer.
+        
+        Args:
+            max_entries: Maximum retained entries (None = unbounded)
+            max_bytes: Maximum estimated size of retained entries
+            spill_path: JSONL file that evicted entries are appended to
+                        (None = evicted entries are dropped)
+        """
+        if max_entries is not None and max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.spill_path = spill_path
+        self._items: deque = deque()
+        self._sizes: deque = deque()
+        self._bytes = 0
+        self._total = 0
+        self._evicted = 0
+        self._spilled = 0
+    
+    @property
+    def total(self) -> int:
+        """Number of entries ever appended (minus entries popped)."""
+        return self._total
+    
+    def append(self, item: Any):
+        """
+        Retain an entry, evicting the oldest ones beyond the limits.
+        
+        Args:
+            item: Entry to retain
+        """
+        size = 0
+        if self.max_bytes is not None:
+            from .cache import estimate_size
+            size = estimate_size(item)
+        
+        self._items.append(item)
+        self._sizes.append(size)
+        self._bytes += size
+        self._total += 1
+        self._enforce_limits()
+    
+    def extend(self, items: Iterator[Any]):
+        """
+        Retain several entries.
+        
+        Args:
+            items: Entries to retain, oldest first
+        """
+        for item in items:
+            self.append(item)
+    
+    def pop(self) -> Any:
+        """
+        Remove and return the newest retained entry.
+        
+        Returns:
+            Newest entry
+        """
+        item = self._items.pop()
+        self._bytes -= self._sizes.pop()
+        self._total -= 1
+        return item
+    
+    def _enforce_limits(self):
+        """Evict oldest entries until both limits hold."""
+        evicted = []
+        while self._items and (
+            (self.max_entries is not None and len(self._items) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            evicted.append(self._items.popleft())
+            self._bytes -= self._sizes.popleft()
+        
+        if evicted:
+            self._evicted += len(evicted)
+            if self.spill_path is not None:
+                self._spill(evicted)
+    
+    def _spill(self, items: List[Any]):
+        """Append evicted entries to the spill file as JSON lines."""
+        from .cache import thaw
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            for item in items:
+                f.write(json.dumps(thaw(item), default=str, separators=(",", ":")))
+                f.write("\n")
+        self._spilled += len(items)
+    
+    def iter_spilled(self) -> Iterator[Any]:
+        """
+        Read spilled entries back, oldest first.
+        
+        Yields:
+            Spilled entries (as plain JSON values)
+        """
+        if self.spill_path is None:
+            return
+        try:
+            f = open(self.spill_path, encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retention statistics.
+        
+        Returns:
+            Dictionary with retained/total/evicted/spilled counts and bytes
+        """
+        return {
+            "retained": len(self._items),
+            "total": self._total,
+            "evicted": self._evicted,
+            "spilled": self._spilled,
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "spill_path": self.spill_path
+        }
+    
+    def clear(self):
+        """Drop retained entries and reset totals (spill file is kept)."""
+        self._items.clear()
+        self._sizes.clear()
+        self._bytes = 0
+        self._total = 0
+        self._evicted = 0
+        self._spilled = 0
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._items)[index]
+        return self._items[index]
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RetentionBuffer):
+            return list(self._items) == list(other._items)
+        if isinstance(other, list):
+            return list(self._items) == other
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return (
+            f"RetentionBuffer(retained={len(self._items)}, total={self._total}, "
+            f"max_entries={self.max_entries}, max_bytes={self.max_bytes})"
+        )
@@ -0,0 +1,130 @@
+"""
+Streaming Integration Cycles
+
+Runs full integration cycles over an iterable of pattern batches (or a
+JSONL dump) one batch at a time, yielding each batch's cycle result as
+soon as it is ready. Batches are read lazily and nothing is accumulated
+across batches, so memory stays flat regardless of the dump size.
+
+JSONL input: each line is either a JSON array (one batch of patterns) or
+a JSON object (one pattern; consecutive pattern lines are grouped into
+batches of ``batch_size``). Blank lines are skipped and ``.gz`` files are
+decompressed on the fly.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List
+import gzip
+import itertools
+import json
+
+if TYPE_CHECKING:
+    from .engine import IntegrationEngine
+
+
+def chunked(patterns: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Group a pattern stream into lists of ``size`` (the last may be shorter).
+    
+    Args:
+        patterns: Any iterable of patterns
+        size: Patterns per batch
+        
+    Yields:
+        Pattern batches
+    """
+    if size < 1:
+        raise ValueError("Batch size must be at least 1")
+    iterator = iter(patterns)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_jsonl_batches(path: str, batch_size: int = 3) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Lazily read pattern batches from a JSONL file.
+    
+    Args:
+        path: Path to a ``.jsonl`` (or ``.jsonl.gz``) file
+        batch_size: Patterns per batch for one-pattern-per-line input
+        
+    Yields:
+        Pattern batches
+        
+    Raises:
+        ValueError: On a malformed line (reported with its line number)
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+    
+    opener = gzip.open if path.endswith(".gz") else open
+    pending: List[Dict[str, Any]] = []
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({e.msg})") from None
+            
+            if isinstance(record, list):
+                if pending:
+                    yield pending
+                    pending = []
+                yield record
+            elif isinstance(record, dict):
+                pending.append(record)
+                if len(pending) == batch_size:
+                    yield pending
+                    pending = []
+            else:
+                raise ValueError(
+                    f"{path}:{line_number}: expected a pattern object or batch array"
+                )
+    if pending:
+        yield pending
+
+
+def stream_integration_cycle(
+    engine: IntegrationEngine,
+    batches: Iterable[List[Any]],
+    batch: bool = False,
+    fail_fast: bool = True,
+    include_validations: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run ``full_integration_cycle`` over a stream of pattern batches.
+    
+    Each yielded result is that batch's cycle result plus ``batch_index``
+    and ``batch_size``. Batches are pulled from ``batches`` only when the
+    previous result has been consumed.
+    
+    Args:
+        engine: Engine to run the cycles on
+        batches: Iterable of pattern lists (see ``iter_jsonl_batches`` and
+                 ``chunked``)
+        batch: Integrate every pattern of a batch in one waltz pass
+        fail_fast: Stop after the first batch with an INVALID pattern
+                   (that batch's VALIDATION_FAILED result is still yielded)
+        include_validations: Keep the per-pattern law results in each
+                             result; disable to shrink results to statuses
+        
+    Yields:
+        Per-batch cycle results
+    """
+    for batch_index, patterns in enumerate(batches):
+        result = engine.full_integration_cycle(patterns, batch=batch)
+        result["batch_index"] = batch_index
+        result["batch_size"] = len(patterns)
+        if not include_validations:
+            result.pop("validations", None)
+        
+        yield result
+        
+        if fail_fast and result["status"] == "VALIDATION_FAILED":
+            return
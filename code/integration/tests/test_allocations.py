@@ -0,0 +1,102 @@
+"""
+Unit Tests for Allocation Budget Tracking
+"""
+
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.engine import IntegrationEngine
+from code.integration.hooks import Hook
+from code.integration.allocations import (
+    AllocationBudget,
+    AllocationBudgetExceeded,
+    AllocationTracker,
+)
+from code.integration.openmetrics import EngineCollector, MetricsRegistry
+from code.integration.benchmarks import synthetic_patterns
+
+
+def engine_with(tracker):
+    engine = IntegrationEngine(enable_telemetry=False)
+    engine.hooks.add(tracker)
+    return engine
+
+
+class TestAllocationTracker:
+    """Test per-stage allocation statistics and budgets."""
+    
+    def test_stage_stats(self):
+        """Test a full cycle and its nested stages are measured."""
+        tracker = AllocationTracker()
+        engine = engine_with(tracker)
+        for seed in range(2):
+            engine.full_integration_cycle(synthetic_patterns(3, seed=seed))
+        tracker.close()
+        
+        stats = engine.get_allocation_stats()
+        assert set(stats) == {"full_integration_cycle", "validate", "integrate"}
+        assert stats["validate"]["calls"] == 6
+        cycle = stats["full_integration_cycle"]
+        assert cycle["calls"] == 2
+        assert cycle["net_bytes_per_call"] == cycle["net_bytes"] / 2
+        assert cycle["peak_bytes"]["count"] == 2
+        # Nested stages are included in the enclosing cycle's peak
+        assert cycle["peak_bytes"]["max"] >= stats["integrate"]["peak_bytes"]["max"] > 0
+        assert cycle["violations"] == 0 and cycle["budget"] is None
+    
+    def test_violations_are_counted(self):
+        """Test budgets count violations without failing calls by default."""
+        tracker = AllocationTracker(budgets={"integrate": AllocationBudget(peak_bytes=1)})
+        engine = engine_with(tracker)
+        result = engine.integrate(synthetic_patterns(3))
+        tracker.close()
+        
+        assert result["status"] == "WALTZ_COMPLETE"
+        stats = tracker.summary()["integrate"]
+        assert stats["violations"] == 1
+        assert stats["budget"] == {"peak_bytes": 1, "net_blocks": None}
+    
+    def test_enforced_budget_raises(self):
+        """Test enforce mode fails the stage call and later hooks still run."""
+        calls = []
+        
+        class Recording(Hook):
+            def post(self, stage, state, error):
+                calls.append(stage)
+        
+        tracker = AllocationTracker(
+            budgets={"validate": AllocationBudget(net_blocks=-10 ** 9)}, enforce=True
+        )
+        engine = IntegrationEngine(enable_telemetry=False)
+        engine.hooks.add(Recording())
+        engine.hooks.add(tracker)
+        with pytest.raises(AllocationBudgetExceeded) as info:
+            engine.validate(synthetic_patterns(1)[0])
+        tracker.close()
+        
+        assert info.value.stage == "validate"
+        assert info.value.measure == "net_blocks"
+        assert calls == ["validate"]
+        assert engine.hooks.errors == 0
+    
+    def test_unknown_budget_stage(self):
+        """Test budgets for unknown stages are rejected."""
+        with pytest.raises(ValueError):
+            AllocationTracker(budgets={"dance": AllocationBudget(peak_bytes=1)})
+    
+    def test_openmetrics_export(self):
+        """Test allocation families appear in the exposition."""
+        tracker = AllocationTracker(budgets={"validate": AllocationBudget(peak_bytes=1)})
+        engine = engine_with(tracker)
+        engine.full_integration_cycle(synthetic_patterns(3))
+        tracker.close()
+        
+        registry = MetricsRegistry()
+        registry.register(EngineCollector(engine))
+        text = registry.exposition()
+        assert "# TYPE integration_stage_peak_bytes histogram" in text
+        assert 'integration_stage_peak_bytes_count{stage="validate"} 3' in text
+        assert 'integration_allocation_budget_violations_total{stage="validate"} 3' in text
+        assert 'integration_stage_net_blocks{stage="integrate"}' in text
@@ -0,0 +1,174 @@
+"""
+Unit Tests for Async Integration Engine
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.async_engine import AsyncIntegrationEngine
+from code.integration.engine import IntegrationEngine
+
+
+class _SlowEngine(IntegrationEngine):
+    """Engine whose integrate() and transition() are slow and count concurrent calls."""
+    
+    def __init__(self, **kwargs):
+        super().__init__(enable_telemetry=False, **kwargs)
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self._count_lock = threading.Lock()
+    
+    def _slow(self, call, *args, **kwargs):
+        with self._count_lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        try:
+            return call(*args, **kwargs)
+        finally:
+            with self._count_lock:
+                self.active -= 1
+    
+    def integrate(self, patterns, batch=False):
+        return self._slow(super().integrate, patterns, batch=batch)
+    
+    def transition(self, pattern, from_pillar, to_pillar):
+        return self._slow(super().transition, pattern, from_pillar, to_pillar)
+
+
+class TestAsyncIntegrationEngine:
+    """Test AsyncIntegrationEngine functionality."""
+    
+    def test_mirrors_engine_api(self):
+        """Test coroutine results match the synchronous engine."""
+        async def run():
+            async with AsyncIntegrationEngine(enable_telemetry=False, workers=2) as engine:
+                validation = await engine.validate({"name": "a"})
+                integration = await engine.integrate([{"name": "a"}])
+                transition = await engine.transition({"name": "a"}, "Phoenix", "Hydrogenesi")
+                sovereignty = await engine.verify_sovereignty()
+                return validation, integration, transition, sovereignty
+        
+        validation, integration, transition, sovereignty = asyncio.run(run())
+        assert validation["pattern_name"] == "a"
+        assert integration["status"] == "WALTZ_COMPLETE"
+        assert transition["to_pillar"] == "Hydrogenesi"
+        assert sovereignty["sovereign"]
+    
+    def test_coalesces_identical_requests(self):
+        """Test concurrent identical requests share one computation."""
+        sync_engine = _SlowEngine(workers=4)
+        
+        async def run():
+            engine = AsyncIntegrationEngine(sync_engine)
+            results = await asyncio.gather(*[
+                engine.integrate([{"name": "same"}]) for _ in range(10)
+            ])
+            status = engine.get_status()["async"]
+            await engine.close()
+            return results, status
+        
+        results, status = asyncio.run(run())
+        assert sync_engine.calls == 1
+        assert status["coalesced"] == 9
+        assert all(r is results[0] for r in results)
+    
+    def test_distinct_requests_not_coalesced(self):
+        """Test batch flag and patterns are part of the coalescing key."""
+        sync_engine = _SlowEngine(workers=4)
+        
+        async def run():
+            async with AsyncIntegrationEngine(sync_engine) as engine:
+                await asyncio.gather(
+                    engine.integrate([{"name": "a"}]),
+                    engine.integrate([{"name": "a"}], batch=True),
+                    engine.integrate([{"name": "b"}]),
+                )
+        
+        asyncio.run(run())
+        assert sync_engine.calls == 3
+    
+    def test_bounded_in_flight(self):
+        """Test no more than max_in_flight computations run at once."""
+        sync_engine = _SlowEngine(workers=8)
+        
+        async def run():
+            async with AsyncIntegrationEngine(sync_engine, max_in_flight=2) as engine:
+                await asyncio.gather(*[
+                    engine.integrate([{"name": str(i)}]) for i in range(8)
+                ])
+        
+        asyncio.run(run())
+        assert sync_engine.calls == 8
+        assert sync_engine.peak <= 2
+    
+    def test_transitions_bounded_in_flight(self):
+        """Test transitions run on the engine's pool under the in-flight limit."""
+        sync_engine = _SlowEngine(workers=8)
+        
+        async def run():
+            async with AsyncIntegrationEngine(sync_engine, max_in_flight=2) as engine:
+                await asyncio.gather(*[
+                    engine.transition({"name": str(i)}, "Phoenix", "The Third") for i in range(6)
+                ])
+                return engine.get_status()["async"]
+        
+        status = asyncio.run(run())
+        assert sync_engine.calls == 6
+        assert sync_engine.peak <= 2
+        assert status["computed"] == 6
+    
+    def test_large_requests_coalesced(self):
+        """Test requests fingerprinted off the loop are still coalesced."""
+        sync_engine = _SlowEngine(workers=4)
+        patterns = [{"name": str(i)} for i in range(20)]
+        
+        async def run():
+            async with AsyncIntegrationEngine(sync_engine) as engine:
+                await asyncio.gather(*[engine.integrate(patterns) for _ in range(5)])
+        
+        asyncio.run(run())
+        assert sync_engine.calls == 1
+    
+    def test_process_executor(self):
+        """Test integrate and transition on a process pool."""
+        async def run():
+            async with AsyncIntegrationEngine(
+                enable_telemetry=False, workers=2, executor="process"
+            ) as engine:
+                integration = await engine.integrate([{"name": "a"}])
+                transition = await engine.transition({"name": "a"}, "Phoenix", "Hydrogenesi")
+                return integration, transition, engine.get_status()
+        
+        integration, transition, status = asyncio.run(run())
+        assert integration["status"] == "WALTZ_COMPLETE"
+        assert transition["status"] == "SUCCESS"
+        assert status["integrated_patterns"] == 1
+    
+    def test_cancelled_caller_does_not_cancel_others(self):
+        """Test cancelling one waiter leaves the shared computation running."""
+        sync_engine = _SlowEngine(workers=2)
+        
+        async def run():
+            async with AsyncIntegrationEngine(sync_engine) as engine:
+                first = asyncio.ensure_future(engine.integrate([{"name": "x"}]))
+                second = asyncio.ensure_future(engine.integrate([{"name": "x"}]))
+                await asyncio.sleep(0.01)
+                first.cancel()
+                return await second
+        
+        assert asyncio.run(run())["status"] == "WALTZ_COMPLETE"
+    
+    def test_rejects_engine_and_kwargs(self):
+        """Test an engine and engine arguments are mutually exclusive."""
+        try:
+            AsyncIntegrationEngine(IntegrationEngine(), workers=2)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
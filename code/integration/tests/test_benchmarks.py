@@ -0,0 +1,204 @@
+"""
+Unit Tests for the Benchmark Suite
+"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+import pytest
+
+from code.integration.engine import IntegrationEngine
+from code.integration.benchmarks import (
+    synthetic_patterns,
+    default_cases,
+    measure_overhead,
+    run_suite,
+    save_results,
+    load_results,
+    compare,
+    format_comparison,
+    PatternWorkload,
+)
+from code.integration.benchmarks.loadtest import run_load_test, percentile
+from code.integration.universal_laws import UniversalLaws
+from code.integration.streaming import iter_jsonl_batches
+from code.integration.benchmarks.suite import main
+
+
+def _document(**medians):
+    return {
+        "schema": 1, 
+        "results": {name: {"median_ns": value} for name, value in medians.items()}
+    }
+
+
+class TestSyntheticPatterns:
+    """Test the deterministic pattern generator."""
+    
+    def test_deterministic(self):
+        """Test equal seeds give equal patterns and seeds differ."""
+        assert synthetic_patterns(6, size=5, depth=3) == synthetic_patterns(6, size=5, depth=3)
+        assert synthetic_patterns(6, seed=1) != synthetic_patterns(6, seed=2)
+    
+    def test_patterns_are_sovereign(self):
+        """Test generated patterns pass every law at any size and depth."""
+        engine = IntegrationEngine(enable_telemetry=False)
+        for size, depth in [(3, 1), (30, 6)]:
+            for pattern in synthetic_patterns(9, size, depth, as_dicts=False):
+                assert engine.validate(pattern)["status"] == "SOVEREIGN"
+    
+    def test_nesting_depth(self):
+        """Test the structure payload nests ``depth`` levels."""
+        payload = synthetic_patterns(1, depth=4)[0]["structure"]["payload"]
+        levels = 1
+        while "child" in payload:
+            payload = payload["child"]
+            levels += 1
+        assert levels == 4
+
+
+class TestRunSuite:
+    """Test running and recording benchmarks."""
+    
+    def test_every_case_runs(self):
+        """Test each default case's callable executes."""
+        for case in default_cases(quick=True):
+            case.setup()()
+    
+    def test_results_document(self, tmp_path):
+        """Test results carry timings and round-trip through JSON."""
+        document = run_suite(repeat=2, min_time=0.0, select="telemetry", quick=True)
+        assert set(document["results"]) == {
+            "waltz[telemetry=off]", "waltz[telemetry=on]", "waltz[telemetry=fast]"
+        }
+        result = document["results"]["waltz[telemetry=on]"]
+        assert result["min_ns"] <= result["median_ns"] and result["ops_per_sec"] > 0
+        assert {
+            "telemetry_overhead", "fast_telemetry_overhead", "fast_telemetry_overhead_noise"
+        } <= set(document["derived"])
+        
+        path = str(tmp_path / "results.json")
+        save_results(document, path)
+        assert load_results(path) == json.loads(json.dumps(document))
+    
+    def test_measure_overhead(self):
+        """Test interleaved timing reports the extra cost and its noise."""
+        import time
+        
+        measured = measure_overhead(
+            lambda: time.sleep(0.001), lambda: time.sleep(0.002), rounds=5, min_time=0.0
+        )
+        assert measured["timed_ns"] > measured["baseline_ns"]
+        assert 0.3 < measured["overhead"] < 2.0
+        assert measured["noise"] >= 0.0 and measured["rounds"] == 5
+    
+    def test_rejects_unknown_schema(self, tmp_path):
+        """Test loading a document of another schema fails."""
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps({"schema": 99, "results": {}}))
+        with pytest.raises(ValueError):
+            load_results(str(path))
+
+
+class TestCompare:
+    """Test baseline comparison and the regression gate."""
+    
+    def test_threshold(self):
+        """Test only slowdowns beyond the threshold regress."""
+        baseline = _document(a=100.0, b=100.0, gone=1.0)
+        current = _document(a=109.0, b=125.0, added=1.0)
+        comparison = compare(current, baseline, threshold=0.10)
+        assert comparison["status"] == "REGRESSED"
+        assert comparison["regressions"] == ["b"]
+        assert comparison["new"] == ["added"] and comparison["missing"] == ["gone"]
+        assert compare(current, baseline, threshold=0.30)["status"] == "PASSED"
+        assert "REGRESSED" in format_comparison(comparison)
+    
+    def test_cli_exit_code(self, tmp_path, capsys):
+        """Test the command fails only when a benchmark regressed."""
+        output = str(tmp_path / "run.json")
+        args = ["--quick", "-k", "pattern_cache[hit]", "-r", "2", "--min-time", "0"]
+        assert main(args + ["-o", output]) == 0
+        
+        document = load_results(output)
+        for result in document["results"].values():
+            result["median_ns"] /= 1000
+        fast = str(tmp_path / "fast.json")
+        save_results(document, fast)
+        assert main(args + ["-b", fast, "-t", "0.5"]) == 1
+        assert "REGRESSED" in capsys.readouterr().out
+
+
+class TestPatternWorkload:
+    """Test the tunable workload generator."""
+    
+    @pytest.mark.parametrize("status", ["SOVEREIGN", "STABLE", "UNSTABLE", "INVALID"])
+    def test_status_mix(self, status):
+        """Test every generated pattern validates to its intended status."""
+        laws = UniversalLaws()
+        workload = PatternWorkload(mix={status: 1.0}, seed=3)
+        assert {laws.validate_all(p)["status"] for p in workload.stream(300)} == {status}
+        assert workload.stats[status] == 300
+    
+    def test_deterministic_and_lazy(self):
+        """Test equal seeds give equal streams drawn on demand."""
+        first = PatternWorkload(seed=9, duplicate_rate=0.2).stream()
+        second = PatternWorkload(seed=9, duplicate_rate=0.2).stream()
+        for _ in range(200):
+            assert next(first).to_dict() == next(second).to_dict()
+    
+    def test_duplicate_rate(self):
+        """Test the duplicate rate repeats whole batches."""
+        workload = PatternWorkload(duplicate_rate=0.5, seed=1)
+        batches = list(workload.batches(3, count=1000))
+        distinct = {tuple(id(p) for p in batch) for batch in batches}
+        assert len(distinct) == 1000 - workload.stats["duplicates"]
+        assert 400 < workload.stats["duplicates"] < 600
+    
+    def test_pillar_weights(self):
+        """Test zero-weight pillars never appear."""
+        workload = PatternWorkload(pillar_weights={"Phoenix": 1, "The Third": 3})
+        pillars = [(p.pillar, p.mode) for p in workload.stream(200)]
+        assert set(pillars) == {("Phoenix", "BEGIN"), ("The Third", "HOLD")}
+        with pytest.raises(ValueError):
+            PatternWorkload(pillar_weights={"Atlantis": 1})
+    
+    def test_write_jsonl(self, tmp_path):
+        """Test JSONL output reads back through the streaming reader."""
+        path = str(tmp_path / "workload.jsonl.gz")
+        assert PatternWorkload(seed=2).write_jsonl(path, 10) == 10
+        expected = [p.to_dict() for p in PatternWorkload(seed=2).stream(10)]
+        patterns = [p for batch in iter_jsonl_batches(path, batch_size=4) for p in batch]
+        assert patterns == json.loads(json.dumps(expected))
+
+
+class TestLoadTest:
+    """Test the closed-loop load test."""
+    
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        samples = list(range(1, 101))
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 99) == 99
+        assert percentile(samples, 100) == 100
+    
+    def test_report(self):
+        """Test every request is timed and counted."""
+        engine = IntegrationEngine(enable_telemetry=False, retain_patterns=0)
+        workload = PatternWorkload(mix={"SOVEREIGN": 1, "INVALID": 1}, duplicate_rate=0.3)
+        report = run_load_test(engine, workload, concurrency=3, requests=60, warmup=5)
+        assert report["requests"] == 60 and report["errors"] == {}
+        assert sum(report["statuses"].values()) == 60
+        assert set(report["statuses"]) <= {"COMPLETE", "VALIDATION_FAILED"}
+        latency = report["latency_ms"]
+        assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    
+    def test_duration_limit(self):
+        """Test a duration-bounded run stops on time."""
+        engine = IntegrationEngine(enable_telemetry=False, retain_patterns=0)
+        report = run_load_test(
+            engine, PatternWorkload(), operation="validate", requests=None, duration=0.2
+        )
+        assert report["requests"] > 0 and report["duration_seconds"] < 1.0
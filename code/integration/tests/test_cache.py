@@ -6,7 +6,9 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 
-from code.integration.cache import PatternCache, CachedThreeFingerWaltz
+from code.integration.cache import (
+    PatternCache, CachedThreeFingerWaltz, estimate_size, freeze, thaw
+)
 
 
 class TestPatternCache:
@@ -91,6 +93,89 @@ class TestPatternCache:
         assert cache.get([{"name": "1"}]) is not None
         assert cache.get([{"name": "3"}]) is not None
     
+    def test_cache_true_lru_order(self):
+        """Test a once-popular key is evicted once it is least recent."""
+        cache = PatternCache(max_size=2)
+        
+        cache.put([{"name": "hot"}], {"id": "hot"})
+        for _ in range(50):
+            cache.get([{"name": "hot"}])
+        cache.put([{"name": "warm"}], {"id": "warm"})
+        cache.get([{"name": "warm"}])
+        
+        # "hot" has more hits but is least recently used
+        cache.put([{"name": "new"}], {"id": "new"})
+        
+        assert cache.get([{"name": "hot"}]) is None
+        assert cache.get([{"name": "warm"}]) is not None
+        assert cache.stats()["size_evictions"] == 1
+    
+    def test_cache_byte_budget(self):
+        """Test byte-bounded eviction."""
+        result = {"payload": "x" * 1000}
+        entry_bytes = estimate_size(result)
+        cache = PatternCache(max_size=100, max_bytes=entry_bytes * 2)
+        
+        for i in range(5):
+            cache.put([{"name": str(i)}], result)
+        
+        stats = cache.stats()
+        assert stats["size"] == 2
+        assert stats["bytes"] <= stats["max_bytes"]
+        assert stats["byte_evictions"] == 3
+        assert stats["evictions"] == 3
+        assert cache.get([{"name": "4"}]) is not None
+    
+    def test_cache_rejects_oversized_entry(self):
+        """Test an entry larger than the whole budget is not cached."""
+        cache = PatternCache(max_bytes=10)
+        cache.put([{"name": "big"}], {"payload": "x" * 1000})
+        
+        assert cache.stats()["size"] == 0
+        assert cache.stats()["rejected"] == 1
+    
+    def test_cache_zero_size_disabled(self):
+        """Test max_size=0 disables storage."""
+        cache = PatternCache(max_size=0)
+        cache.put([{"name": "test"}], {"status": "SUCCESS"})
+        
+        assert cache.get([{"name": "test"}]) is None
+        assert cache.stats()["size"] == 0
+    
+    def test_cache_entries_read_only(self):
+        """Test cached entries cannot be corrupted through nested dicts."""
+        cache = PatternCache()
+        result = {"pattern": {"triad": {"phoenix": {"core": "a"}}}, "steps": [{"n": 1}]}
+        cache.put([{"name": "test"}], result)
+        
+        # Mutating the original after put does not leak into the cache
+        result["pattern"]["triad"]["phoenix"]["core"] = "mutated"
+        
+        cached = cache.get([{"name": "test"}])
+        assert cached["pattern"]["triad"]["phoenix"]["core"] == "a"
+        try:
+            cached["pattern"]["triad"]["phoenix"]["core"] = "b"
+            assert False, "expected TypeError"
+        except TypeError:
+            pass
+        assert isinstance(cached["steps"], tuple)
+    
+    def test_cache_hit_returns_shared_entry(self):
+        """Test hits return the same frozen entry without copying."""
+        cache = PatternCache()
+        cache.put([{"name": "test"}], {"status": "SUCCESS"})
+        
+        assert cache.get([{"name": "test"}]) is cache.get([{"name": "test"}])
+    
+    def test_freeze_preserves_sharing_and_thaw_roundtrip(self):
+        """Test freeze keeps shared sub-structures shared; thaw inverts it."""
+        inner = {"core": "a"}
+        result = {"left": inner, "right": inner, "items": [1, 2]}
+        
+        frozen = freeze(result)
+        assert frozen["left"] is frozen["right"]
+        assert thaw(frozen) == result
+    
     def test_cache_clear(self):
         """Test cache clearing."""
         cache = PatternCache()
@@ -162,6 +247,35 @@ class TestCachedThreeFingerWaltz:
         assert "waltz_cache_hits" in stats
         assert "waltz_cache_misses" in stats
         assert "waltz_hit_rate" in stats
+    
+    def test_cache_hit_metadata_not_written_into_entry(self):
+        """Test hit metadata lives alongside the frozen entry."""
+        waltz = CachedThreeFingerWaltz(reentrant=True)
+        patterns = [{"name": "test"}]
+        
+        waltz(patterns)
+        hit = waltz(patterns)
+        assert hit["from_cache"] == True
+        assert hit["cache_hit"] == True
+        
+        hit["telemetry"] = {"cached": True}
+        entry = waltz.cache.get(patterns)
+        assert "from_cache" not in entry
+        assert "telemetry" not in entry
+        assert hit["pattern"] is entry["pattern"]
+    
+    def test_batch_results_cached_separately(self):
+        """Test batch and single-pattern results use distinct cache keys."""
+        waltz = CachedThreeFingerWaltz(reentrant=True)
+        
+        patterns = [{"name": "a"}, {"name": "b"}]
+        single = waltz(patterns)
+        batch = waltz(patterns, batch=True)
+        
+        assert "results" not in single
+        assert batch["from_cache"] == False
+        assert len(batch["results"]) == 2
+        assert waltz(patterns, batch=True)["from_cache"] == True
 
 
 if __name__ == "__main__":
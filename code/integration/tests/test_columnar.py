@@ -0,0 +1,130 @@
+"""
+Unit Tests for Columnar Pattern Ingestion
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from code.integration.engine import IntegrationEngine, IntegrationPattern
+from code.integration.columnar import load_patterns, save_npy, save_arrow
+from code.integration.universal_laws import UniversalLaws
+from code.integration.tests.test_pattern_batch import typed_patterns
+
+
+def _json_safe(patterns):
+    """Patterns whose object fields survive a JSON round trip unchanged."""
+    for pattern in patterns:
+        pattern.structure = {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in pattern.structure.items()
+        }
+    return patterns
+
+
+def _save(patterns, path):
+    if path.endswith(".npy"):
+        save_npy(patterns, path)
+    else:
+        pytest.importorskip("pyarrow")
+        save_arrow(patterns, path)
+
+
+@pytest.fixture(params=[".npy", ".arrow", ".parquet"])
+def suffix(request):
+    return request.param
+
+
+class TestColumnarFiles:
+    """Test loading pattern files into PatternBatch columns."""
+    
+    def test_round_trip(self, tmp_path, suffix):
+        """Test rows read back equal the written patterns."""
+        patterns = _json_safe(typed_patterns(120))
+        path = str(tmp_path / f"patterns{suffix}")
+        _save(patterns, path)
+        
+        batch = load_patterns(path)
+        assert len(batch) == 120
+        assert batch.to_patterns() == patterns
+    
+    def test_bulk_validation_matches(self, tmp_path, suffix):
+        """Test file validation matches per-pattern validate_all."""
+        laws = UniversalLaws()
+        patterns = _json_safe(typed_patterns(300))
+        path = str(tmp_path / f"patterns{suffix}")
+        _save(patterns, path)
+        
+        result = IntegrationEngine(enable_telemetry=False).validate_file(path)
+        assert result.statuses() == [laws.validate_all(p)["status"] for p in patterns]
+    
+    def test_npy_is_memory_mapped(self, tmp_path):
+        """Test numeric columns of a .npy file stay on disk and read-only."""
+        path = str(tmp_path / "patterns.npy")
+        save_npy(typed_patterns(10), path)
+        
+        column = load_patterns(path).column("coherence")
+        assert isinstance(column.base, np.memmap) or not column.flags.owndata
+        assert not column.flags.writeable
+    
+    def test_object_columns_decoded_lazily(self, tmp_path):
+        """Test names are not decoded by bulk validation."""
+        path = str(tmp_path / "patterns.npy")
+        save_npy(typed_patterns(10), path)
+        
+        batch = load_patterns(path)
+        UniversalLaws().validate_many(batch)
+        assert "name" in batch._pending
+        assert batch[0].name == "pattern_0"
+    
+    def test_append_after_load(self, tmp_path):
+        """Test a loaded batch becomes appendable."""
+        path = str(tmp_path / "patterns.npy")
+        save_npy(typed_patterns(5), path)
+        
+        batch = load_patterns(path)
+        batch.append(IntegrationPattern(name="extra", pillar="Phoenix", mode="BEGIN"))
+        assert len(batch) == 6
+        assert batch[-1].name == "extra"
+        assert batch[0].name == "pattern_0"
+    
+    def test_missing_columns_take_defaults(self, tmp_path):
+        """Test absent optional columns use IntegrationPattern defaults."""
+        records = np.array(
+            [(b'"p"', b'"Phoenix"', b'"BEGIN"', 0.5)],
+            dtype=[("name", "S8"), ("pillar", "S16"), ("mode", "S8"), ("coherence", "f8")]
+        )
+        path = str(tmp_path / "partial.npy")
+        np.save(path, records)
+        
+        pattern = load_patterns(path)[0]
+        assert pattern == IntegrationPattern(name="p", pillar="Phoenix", mode="BEGIN", coherence=0.5)
+    
+    def test_missing_required_column(self, tmp_path):
+        """Test files without name/pillar/mode are rejected."""
+        path = str(tmp_path / "bad.npy")
+        np.save(path, np.zeros(3, dtype=[("coherence", "f8")]))
+        with pytest.raises(ValueError, match="missing required"):
+            load_patterns(path)
+    
+    def test_stream_integration_file(self, tmp_path):
+        """Test streaming integration cycles over a columnar file."""
+        pattern = IntegrationPattern(
+            name="p",
+            pillar="Phoenix",
+            mode="BEGIN",
+            structure={"triad": ["fear", "service", "courage"]},
+            apex="apex::warrior",
+            operators=["FirstBinding", "IM_ME", "PhoenixIgnition"],
+            convergence_point="apex::warrior"
+        )
+        path = str(tmp_path / "cycle.npy")
+        save_npy([pattern] * 6, path)
+        
+        engine = IntegrationEngine(enable_telemetry=False)
+        results = list(engine.stream_integration_file(path, batch_size=3))
+        assert [r["status"] for r in results] == ["COMPLETE", "COMPLETE"]
@@ -0,0 +1,245 @@
+"""
+Unit Tests for Integration Engine Concurrency
+"""
+
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.engine import IntegrationEngine, IntegrationPattern
+from code.integration.cache import PatternCache, thaw
+from collections.abc import Mapping
+import json
+import logging
+
+
+def _patterns(i):
+    return [IntegrationPattern(
+        name=f"p{i}",
+        pillar="Phoenix",
+        mode="BEGIN",
+        structure={"triad": ("fear", "service", "courage")},
+        apex="apex::warrior",
+        operators=["FirstBinding", "IM_ME", "PhoenixIgnition"],
+        convergence_point="apex::warrior"
+    ).to_dict()]
+
+
+class TestThreadSafety:
+    """Test shared engine state under concurrent callers."""
+    
+    def test_concurrent_integrate(self):
+        """Test many threads integrating through one engine."""
+        engine = IntegrationEngine(log_level=logging.ERROR, cache_size=16)
+        errors = []
+        
+        def worker(offset):
+            try:
+                for i in range(50):
+                    result = engine.integrate(_patterns((offset + i) % 40))
+                    assert result["status"] == "WALTZ_COMPLETE"
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert engine.get_status()["integrated_patterns"] == 400
+        stats = engine.get_cache_stats()
+        assert stats["waltz_cache_hits"] + stats["waltz_cache_misses"] == 400
+        assert engine.get_metrics()["total_executions"] == 400
+    
+    def test_cache_counters_consistent(self):
+        """Test PatternCache bookkeeping stays consistent across threads."""
+        cache = PatternCache(max_size=8)
+        
+        def worker():
+            for i in range(200):
+                key = cache.key_for(_patterns(i % 20))
+                if cache.get([], key=key) is None:
+                    cache.put([], {"status": "WALTZ_COMPLETE"}, key=key)
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        stats = cache.stats()
+        assert stats["size"] <= 8
+        assert stats["total_hits"] + stats["total_misses"] == 1600
+
+
+class TestIntegrateResult:
+    """Test the result type of IntegrationEngine.integrate."""
+    
+    def test_hits_are_read_only_mappings(self):
+        """Test hits and misses are Mappings that thaw to equal plain dicts."""
+        engine = IntegrationEngine(log_level=logging.ERROR)
+        miss = engine.integrate(_patterns(0))
+        hit = engine.integrate(_patterns(0))
+        
+        assert isinstance(miss, Mapping) and isinstance(hit, Mapping)
+        assert hit["from_cache"] and not miss["from_cache"]
+        try:
+            hit["pattern"]["name"] = "changed"
+            assert False, "expected TypeError"
+        except TypeError:
+            pass
+        plain = thaw(hit)
+        assert json.loads(json.dumps(plain))["pattern"] == json.loads(json.dumps(miss))["pattern"]
+
+
+class TestWorkerPool:
+    """Test submit()/map() on thread and process pools."""
+    
+    def test_thread_submit_and_map(self):
+        """Test thread pool results and bookkeeping."""
+        with IntegrationEngine(enable_telemetry=False, workers=4) as engine:
+            future = engine.submit("validate", _patterns(0)[0])
+            assert future.result()["pattern_name"] == "p0"
+            
+            results = list(engine.map("integrate", [_patterns(i) for i in range(10)]))
+            assert [r["pattern"]["triad"]["phoenix"]["core"] for r in results] == [
+                f"p{i}" for i in range(10)
+            ]
+            assert engine.get_status()["integrated_patterns"] == 10
+            assert engine.get_status()["pool"]["running"]
+        assert not engine.get_status()["pool"]["running"]
+    
+    def test_process_map(self):
+        """Test process workers return plain results and record integrations."""
+        with IntegrationEngine(enable_telemetry=False, workers=2, executor="process") as engine:
+            results = list(engine.map(
+                "full_integration_cycle", [_patterns(i) for i in range(4)], batch=True
+            ))
+            assert all(r["waltz"]["status"] == "WALTZ_COMPLETE" for r in results)
+            assert isinstance(results[0]["waltz"]["pattern"], dict)
+            assert engine.get_status()["integrated_patterns"] == 4
+            assert engine.get_status()["sovereign"]
+    
+    def test_process_submit_integrate(self):
+        """Test integrate on a process pool records the pattern."""
+        with IntegrationEngine(enable_telemetry=False, workers=2, executor="process") as engine:
+            result = engine.submit("integrate", _patterns(0)).result()
+            assert result["status"] == "WALTZ_COMPLETE"
+            assert result["sovereignty"] is True
+            assert engine.get_status()["integrated_patterns"] == 1
+            assert not engine.get_status()["sovereign"]
+    
+    def test_rejects_unknown_method(self):
+        """Test only engine entry points can be submitted."""
+        engine = IntegrationEngine(enable_telemetry=False)
+        try:
+            engine.submit("verify_sovereignty")
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    
+    def test_single_shot_has_no_pool(self):
+        """Test the single-shot waltz cannot be pooled."""
+        engine = IntegrationEngine(enable_telemetry=False, single_shot=True)
+        try:
+            engine.submit("integrate", _patterns(0))
+            assert False, "expected RuntimeError"
+        except RuntimeError:
+            pass
+    
+    def test_unknown_executor(self):
+        """Test invalid pool kinds are rejected up front."""
+        try:
+            IntegrationEngine(executor="fiber")
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+
+class TestIncrementalValidation:
+    """Test change-tracked revalidation of IntegrationPattern objects."""
+    
+    def _pattern(self):
+        return IntegrationPattern(
+            name="tuned",
+            pillar="Phoenix",
+            mode="BEGIN",
+            structure={"triad": ("fear", "service", "courage")},
+            apex="apex::warrior",
+            operators=["FirstBinding", "IM_ME", "PhoenixIgnition"],
+            convergence_point="apex::warrior",
+            invariant="identity::warrior",
+            closed=True,
+            sovereignty=True
+        )
+    
+    def test_matches_full_validation(self):
+        """Test incremental results equal a full validation at every step."""
+        engine = IntegrationEngine(log_level=logging.ERROR, incremental_validation=True)
+        pattern = self._pattern()
+        
+        for step in range(40):
+            pattern.coherence = step / 40
+            pattern.stability_score = 1 - step / 40
+            if step % 9 == 0:
+                pattern.recursion_depth = step // 4
+            result = engine.validate(pattern)
+            assert result["validation"] == engine.universal_laws.validate_all(pattern.to_dict())
+            assert result["pattern_name"] == "tuned"
+    
+    def test_only_affected_laws_rerun(self):
+        """Test a field assignment re-runs only the laws reading it."""
+        engine = IntegrationEngine(log_level=logging.ERROR, incremental_validation=True)
+        pattern = self._pattern()
+        engine.validate(pattern)
+        
+        pattern.coherence = 0.5
+        result = engine.validate(pattern)
+        assert pattern._validation.recomputed == 1
+        assert result["validation"]["summary"]["violated"] == 1
+        assert result["status"] == "UNSTABLE"
+        
+        pattern.pillar = "Hydrogenesi"
+        engine.validate(pattern)
+        assert pattern._validation.recomputed == 0
+    
+    def test_in_place_mutation_detected(self):
+        """Test container fields mutated in place are revalidated."""
+        engine = IntegrationEngine(log_level=logging.ERROR, incremental_validation=True)
+        pattern = self._pattern()
+        assert engine.validate(pattern)["status"] == "SOVEREIGN"
+        
+        pattern.operators.pop()
+        result = engine.validate(pattern)
+        assert result["validation"] == engine.universal_laws.validate_all(pattern.to_dict())
+        assert result["status"] != "SOVEREIGN"
+    
+    def test_assignment_clears_fingerprint(self):
+        """Test field assignments invalidate a precomputed fingerprint."""
+        pattern = self._pattern()
+        pattern.compute_fingerprint()
+        pattern.coherence = 0.85
+        assert pattern.fingerprint is None
+    
+    def test_off_by_default(self):
+        """Test patterns keep no validation state unless enabled."""
+        engine = IntegrationEngine(log_level=logging.ERROR)
+        pattern = self._pattern()
+        assert engine.validate(pattern)["status"] == "SOVEREIGN"
+        assert pattern._validation is None
+    
+    def test_copies_start_fresh(self):
+        """Test copies do not share validation state with the original."""
+        import copy
+        
+        engine = IntegrationEngine(log_level=logging.ERROR, incremental_validation=True)
+        pattern = self._pattern()
+        engine.validate(pattern)
+        clone = copy.copy(pattern)
+        clone.coherence = 0.1
+        
+        assert engine.validate(pattern)["status"] == "SOVEREIGN"
+        assert engine.validate(clone)["status"] == "UNSTABLE"
@@ -0,0 +1,98 @@
+"""
+Unit Tests for Pattern Fingerprinting
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.fingerprint import PatternFingerprinter, fingerprint_pattern, HASH_MODES
+from code.integration.cache import CachedThreeFingerWaltz
+from code.integration.engine import IntegrationPattern
+
+
+class TestPatternFingerprinter:
+    """Test PatternFingerprinter functionality."""
+    
+    def test_key_order_independent(self):
+        """Test dict key order does not change the fingerprint."""
+        fp = PatternFingerprinter()
+        a = [{"name": "x", "structure": {"a": 1, "b": [1, 2]}}]
+        b = [{"structure": {"b": [1, 2], "a": 1}, "name": "x"}]
+        
+        assert fp.key(a) == fp.key(b)
+    
+    def test_distinct_patterns_distinct_keys(self):
+        """Test different patterns and namespaces give different keys."""
+        fp = PatternFingerprinter()
+        
+        assert fp.key([{"name": "x"}]) != fp.key([{"name": "y"}])
+        assert fp.key([{"name": "x"}]) != fp.key([{"name": "x"}], namespace="batch:")
+        # Pattern boundaries matter
+        assert fp.key([{"name": "x"}, {"name": "y"}]) != fp.key([{"name": "x"}])
+    
+    def test_all_modes(self):
+        """Test every hash mode produces stable keys."""
+        patterns = [{"name": "x", "structure": {"triad": True}}]
+        for mode in HASH_MODES:
+            fp = PatternFingerprinter(mode)
+            assert fp.key(patterns) == PatternFingerprinter(mode).key(patterns)
+    
+    def test_unknown_mode(self):
+        """Test unknown hash mode is rejected."""
+        try:
+            PatternFingerprinter("md5")
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    
+    def test_precomputed_fingerprint_used(self):
+        """Test objects carrying a fingerprint are not re-serialized."""
+        class Fingerprinted:
+            fingerprint = "abc123"
+            
+            def to_dict(self):
+                raise AssertionError("should not serialize")
+        
+        fp = PatternFingerprinter()
+        assert fp.key([Fingerprinted()]) == fp.key([Fingerprinted()])
+    
+    def test_integration_pattern_fingerprint(self):
+        """Test IntegrationPattern precomputed fingerprint."""
+        pattern = IntegrationPattern(name="p", pillar="Phoenix", mode="BEGIN")
+        
+        assert pattern.fingerprint is None
+        value = pattern.compute_fingerprint()
+        assert value == fingerprint_pattern(pattern.to_dict())
+        assert "fingerprint" not in pattern.to_dict()
+
+
+class TestCacheKeySharing:
+    """Test cache keys are computed once per waltz call."""
+    
+    def test_miss_fingerprints_once(self):
+        """Test a cache miss fingerprints the patterns only once."""
+        waltz = CachedThreeFingerWaltz(reentrant=True)
+        calls = []
+        original = waltz.cache.fingerprinter.key
+        
+        def counting_key(patterns, namespace=""):
+            calls.append(namespace)
+            return original(patterns, namespace)
+        
+        waltz.cache.fingerprinter.key = counting_key
+        waltz([{"name": "test"}])
+        
+        assert len(calls) == 1
+    
+    def test_integration_pattern_objects_cached(self):
+        """Test waltz accepts fingerprinted IntegrationPattern objects."""
+        waltz = CachedThreeFingerWaltz(reentrant=True, hash_mode="fast")
+        pattern = IntegrationPattern(name="p", pillar="Phoenix", mode="BEGIN")
+        pattern.compute_fingerprint("fast")
+        
+        first = waltz([pattern])
+        second = waltz([pattern])
+        
+        assert first["pattern"]["triad"]["phoenix"]["core"] == "p"
+        assert second["from_cache"] == True
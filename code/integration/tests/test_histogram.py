@@ -0,0 +1,121 @@
+"""
+Unit Tests for Streaming Histograms
+"""
+
+import sys
+import os
+import math
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.histogram import LogHistogram, RollingHistogram, SUB_BUCKETS
+
+
+def exact_percentile(ordered, q):
+    return ordered[max(1, math.ceil(q / 100.0 * len(ordered))) - 1]
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestLogHistogram:
+    """Test the log-bucketed histogram."""
+    
+    def test_percentile_accuracy(self):
+        """Test percentiles stay within the bucket relative error."""
+        rnd = random.Random(5)
+        values = [rnd.lognormvariate(-7, 1.5) for _ in range(20000)]
+        histogram = LogHistogram()
+        for value in values:
+            histogram.record(value)
+        
+        ordered = sorted(values)
+        for q in (1, 50, 90, 99, 99.9):
+            exact = exact_percentile(ordered, q)
+            assert abs(histogram.percentile(q) / exact - 1) <= 1.0 / SUB_BUCKETS
+        assert histogram.max == ordered[-1] and histogram.min == ordered[0]
+        assert math.isclose(histogram.mean, sum(values) / len(values))
+    
+    def test_bounded_memory(self):
+        """Test bucket count does not grow with the sample count."""
+        histogram = LogHistogram()
+        for _ in range(5):
+            for i in range(1, 10001):
+                histogram.record(i * 1e-6)
+        buckets = len(histogram.counts)
+        for i in range(1, 10001):
+            histogram.record(i * 1e-6)
+        assert len(histogram.counts) == buckets
+        assert histogram.count == 60000
+    
+    def test_record_many_and_merge(self):
+        """Test batch recording and merging match recording one by one."""
+        rnd = random.Random(1)
+        values = [rnd.random() for _ in range(500)] + [0.0, 1e9]
+        single, batched, merged = LogHistogram(), LogHistogram(), LogHistogram()
+        for value in values:
+            single.record(value)
+        batched.record_many(values)
+        half = LogHistogram()
+        half.record_many(values[:250])
+        merged.record_many(values[250:])
+        merged.merge(half)
+        for histogram in (batched, merged):
+            assert histogram.counts == single.counts
+            assert histogram.percentiles() == single.percentiles()
+            assert (histogram.min, histogram.max) == (single.min, single.max)
+            assert math.isclose(histogram.mean, single.mean)
+    
+    def test_empty_summary(self):
+        """Test an empty histogram summarizes to zeros."""
+        assert LogHistogram().summary() == {
+            "count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0
+        }
+
+
+class TestRollingHistogram:
+    """Test rolling-window histograms."""
+    
+    def test_windows(self):
+        """Test windows cover the most recent samples to slot resolution."""
+        clock = FakeClock()
+        rolling = RollingHistogram(clock=clock)
+        for second in range(1800):
+            clock.now = second
+            rolling.record(1.0 if second < 1500 else 2.0)
+        
+        summary = rolling.summary()
+        assert [summary[key]["count"] for key in ("all", "1m", "5m", "15m")] == [1800, 60, 300, 900]
+        assert summary["1m"]["p50"] == 2.0
+        assert math.isclose(summary["15m"]["p50"], 1.0, rel_tol=1.0 / SUB_BUCKETS)
+        assert rolling.window(300).count == 300
+    
+    def test_idle_windows_empty(self):
+        """Test windows drain when no samples arrive."""
+        clock = FakeClock()
+        rolling = RollingHistogram(clock=clock)
+        rolling.record(0.5)
+        clock.now = 120
+        summary = rolling.summary()
+        assert summary["1m"]["count"] == 0
+        assert summary["5m"]["count"] == 1 and summary["all"]["count"] == 1
+    
+    def test_bounded_slots(self):
+        """Test old slots are retired into the all-time histogram."""
+        clock = FakeClock()
+        rolling = RollingHistogram(clock=clock)
+        for second in range(0, 36000, 5):
+            clock.now = second
+            rolling.record(0.01)
+        assert len(rolling._slots) == 90
+        assert rolling.all_time.count == 7200
+        
+        rolling.reset()
+        assert rolling.summary()["all"]["count"] == 0
@@ -0,0 +1,176 @@
+"""
+Unit Tests for Engine Profiling Hooks
+"""
+
+import sys
+import os
+import pstats
+import pytest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.engine import IntegrationEngine
+from code.integration.hooks import (
+    HOOK_STAGES,
+    CProfileHook,
+    Hook,
+    HookRegistry,
+    TracemallocHook,
+    WallClockHook,
+)
+from code.integration.benchmarks import synthetic_patterns
+
+
+class RecordingHook(Hook):
+    """Hook recording its callbacks."""
+    
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+    
+    def pre(self, stage):
+        self.calls.append((self.name, "pre", stage))
+        return stage.upper()
+    
+    def post(self, stage, state, error):
+        self.calls.append((self.name, "post", stage, state, type(error).__name__ if error else None))
+
+
+class FailingHook(Hook):
+    """Hook raising in every callback."""
+    
+    def pre(self, stage):
+        raise RuntimeError("pre")
+
+
+def engine_with(registry=None):
+    return IntegrationEngine(enable_telemetry=False, hooks=registry)
+
+
+class TestHookRegistry:
+    """Test hook registration and dispatch."""
+    
+    def test_order_and_state(self):
+        """Test pre runs in order, post in reverse with pre's state."""
+        calls = []
+        engine = engine_with()
+        engine.hooks.add(RecordingHook("a", calls), stages=["validate"])
+        engine.hooks.add(RecordingHook("b", calls), stages=["validate"])
+        engine.validate(synthetic_patterns(1)[0])
+        
+        assert calls == [
+            ("a", "pre", "validate"),
+            ("b", "pre", "validate"),
+            ("b", "post", "validate", "VALIDATE", None),
+            ("a", "post", "validate", "VALIDATE", None),
+        ]
+    
+    def test_nested_stages(self):
+        """Test a full cycle runs the hooks of its inner stages."""
+        calls = []
+        engine = engine_with()
+        engine.hooks.add(RecordingHook("r", calls))
+        engine.full_integration_cycle(synthetic_patterns(3))
+        
+        pres = [stage for _, kind, stage, *_ in calls if kind == "pre"]
+        assert pres == ["full_integration_cycle", "validate", "validate", "validate", "integrate"]
+    
+    def test_runtime_switching(self):
+        """Test hooks can be disabled, re-enabled and removed between calls."""
+        calls = []
+        hook = RecordingHook("r", calls)
+        engine = engine_with()
+        engine.hooks.add(hook, stages=["transition"])
+        pattern = synthetic_patterns(1)[0]
+        
+        engine.hooks.disable()
+        engine.transition(pattern, "Phoenix", "The Third")
+        assert calls == []
+        engine.hooks.enable()
+        engine.transition(pattern, "Phoenix", "The Third")
+        assert len(calls) == 2
+        engine.hooks.remove(hook)
+        engine.transition(pattern, "Phoenix", "The Third")
+        assert len(calls) == 2
+        assert engine.hooks.hooks("transition") == ()
+    
+    def test_errors_are_isolated(self):
+        """Test failing hooks are counted and stage errors reach post."""
+        calls = []
+        registry = HookRegistry()
+        registry.add(FailingHook(), stages=["integrate"])
+        registry.add(RecordingHook("r", calls), stages=["integrate"])
+        engine = engine_with(registry)
+        
+        assert engine.integrate(synthetic_patterns(3))["status"] == "WALTZ_COMPLETE"
+        assert registry.errors == 1
+        with pytest.raises(AttributeError):
+            engine.integrate([1, 2, 3])
+        assert calls[-1][-1] == "AttributeError"
+    
+    def test_unknown_stage(self):
+        """Test unknown stages are rejected."""
+        with pytest.raises(ValueError):
+            HookRegistry().add(Hook(), stages=["dance"])
+
+
+class TestBuiltinHooks:
+    """Test the built-in profiling hooks."""
+    
+    def test_cprofile_sampling(self, tmp_path):
+        """Test one in N calls is profiled per stage."""
+        engine = engine_with()
+        hook = engine.hooks.add(CProfileHook(every=3, stages=["validate"]))
+        for pattern in synthetic_patterns(7):
+            engine.validate(pattern)
+        
+        assert hook.samples == {"validate": 3}
+        assert "validate" in hook.report("validate")
+        assert hook.report("integrate") == ""
+        path = str(tmp_path / "validate.prof")
+        hook.dump("validate", path)
+        assert pstats.Stats(path).total_calls > 0
+    
+    def test_tracemalloc(self):
+        """Test allocations are attributed per stage and site."""
+        engine = engine_with()
+        hook = engine.hooks.add(TracemallocHook(stages=["generate_report"]))
+        retained = [engine.generate_report(pattern) for pattern in synthetic_patterns(3)]
+        hook.close()
+        
+        summary = hook.summary(top=3)["generate_report"]
+        assert summary["calls"] == 3
+        assert summary["bytes"] > 0
+        assert summary["bytes_per_call"] == summary["bytes"] / 3
+        assert 0 < len(summary["top"]) <= 3
+        assert len(retained) == 3
+    
+    def test_wall_clock_breakdown(self):
+        """Test inclusive and self times per stage."""
+        engine = engine_with()
+        hook = engine.hooks.add(WallClockHook())
+        engine.full_integration_cycle(synthetic_patterns(3))
+        
+        breakdown = hook.breakdown()
+        cycle = breakdown["full_integration_cycle"]
+        assert breakdown["validate"]["calls"] == 3
+        assert cycle["self_seconds"] < cycle["total_seconds"]
+        assert sum(row["self_share"] for row in breakdown.values()) == pytest.approx(1.0)
+        table = hook.table()
+        assert table.splitlines()[0].startswith("stage")
+        assert len(table.splitlines()) == 4
+    
+    def test_cycle_skips_generate_report_stage(self):
+        """Test full cycles validate with quick_check, not generate_report."""
+        calls = []
+        engine = engine_with()
+        engine.hooks.add(RecordingHook("r", calls), stages=["full_integration_cycle", "generate_report"])
+        engine.full_integration_cycle(synthetic_patterns(2))
+        
+        assert [call[2] for call in calls] == ["full_integration_cycle"] * 2
+        engine.generate_report(synthetic_patterns(1)[0])
+        assert calls[-1][2] == "generate_report"
+    
+    def test_stage_names(self):
+        """Test every hook stage is an engine method."""
+        for stage in HOOK_STAGES:
+            assert callable(getattr(IntegrationEngine, stage))
@@ -17,7 +17,10 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 
 from datetime import datetime
-from code.integration.meta_operators import ThreeFingerWaltz, WaltzPhase, WaltzStep, execute_waltz
+from code.integration.meta_operators import (
+    ThreeFingerWaltz, WaltzPhase, WaltzStep, WaltzPass, WaltzBatch,
+    execute_waltz, perform_waltz, perform_waltz_batch
+)
 
 try:
     import pytest
@@ -523,6 +526,90 @@ class TestWaltzRepr:
         assert "recursion=0/7" in repr_str
 
 
+class TestReentrantWaltz:
+    """Test the stateless (reentrant) waltz path."""
+    
+    def test_perform_waltz_matches_dance(self):
+        """Test pure pass produces the same pattern as a classic dance."""
+        patterns = [{"name": "alpha"}]
+        
+        classic = ThreeFingerWaltz().dance(patterns)
+        waltz_pass = perform_waltz(patterns[0])
+        
+        assert isinstance(waltz_pass, WaltzPass)
+        assert waltz_pass.completed == classic["pattern"]
+        assert waltz_pass.to_result()["steps"] == classic["steps"]
+        assert waltz_pass.energy_conservation == classic["energy_conservation"]
+    
+    def test_reentrant_waltz_repeats(self):
+        """Test reentrant waltz never reports ALREADY_COMPLETE."""
+        waltz = ThreeFingerWaltz(reentrant=True)
+        
+        for i in range(10):
+            result = waltz([{"name": f"pattern_{i}"}])
+            assert result["status"] == "WALTZ_COMPLETE"
+            assert result["pattern"]["triad"]["phoenix"]["core"] == f"pattern_{i}"
+        
+        assert waltz.is_ready()
+        assert waltz.get_status()["passes_completed"] == 10
+    
+    def test_reentrant_waltz_retains_no_state(self):
+        """Test reentrant waltz keeps no steps or history."""
+        waltz = ThreeFingerWaltz(reentrant=True)
+        waltz([{"name": "test"}])
+        
+        assert waltz._steps == []
+        assert waltz.waltz_history == []
+        assert waltz.recursion_depth == 0
+        assert not waltz.is_complete()
+    
+    def test_reentrant_waltz_empty_patterns(self):
+        """Test reentrant waltz with no patterns."""
+        waltz = ThreeFingerWaltz(reentrant=True)
+        
+        assert waltz([])["status"] == "NO_PATTERNS"
+
+
+class TestBatchWaltz:
+    """Test multi-pattern (batch) waltz integration."""
+    
+    def test_batch_integrates_every_pattern(self):
+        """Test batch mode returns one record per pattern plus aggregate."""
+        patterns = [{"name": f"p{i}"} for i in range(5)]
+        result = ThreeFingerWaltz(reentrant=True).dance(patterns, batch=True)
+        
+        assert result["status"] == "WALTZ_COMPLETE"
+        assert result["batch_size"] == 5
+        assert [r["core"] for r in result["results"]] == [p["name"] for p in patterns]
+        assert result["aggregate"]["patterns_integrated"] == 5
+        assert result["aggregate"]["sovereign_count"] == 5
+    
+    def test_batch_columns_match_single_pass(self):
+        """Test batch columns agree with the per-pattern waltz."""
+        patterns = [{"name": "alpha"}, {"name": "beta"}, {}]
+        batch = perform_waltz_batch(patterns)
+        
+        assert isinstance(batch, WaltzBatch)
+        assert len(batch) == 3
+        for i, pattern in enumerate(patterns):
+            completed = perform_waltz(pattern).completed
+            ignited = completed["triad"]["phoenix"]
+            assert batch.record(i)["apex"] == ignited["apex"]
+            assert batch.record(i)["lineage"] == completed["triad"]["hydrogenesi"]["lineage"]
+            assert batch.pattern(i) == completed
+    
+    def test_batch_single_shot_completes(self):
+        """Test batch mode honours single-shot completion."""
+        waltz = ThreeFingerWaltz()
+        patterns = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+        
+        result = waltz.dance(patterns, batch=True)
+        assert result["status"] == "WALTZ_COMPLETE"
+        assert result["pattern"]["triad"]["phoenix"]["core"] == "a"
+        assert waltz.is_complete()
+        assert waltz.dance(patterns, batch=True)["status"] == "ALREADY_COMPLETE"
+
+
 if __name__ == "__main__":
     # Run tests if pytest is available
     try:
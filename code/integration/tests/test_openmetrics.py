@@ -0,0 +1,189 @@
+"""
+Unit Tests for OpenMetrics Exposition
+"""
+
+import sys
+import os
+import urllib.error
+import urllib.request
+import pytest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.engine import IntegrationEngine
+from code.integration.histogram import LogHistogram
+from code.integration.openmetrics import (
+    CONTENT_TYPE,
+    EngineCollector,
+    MetricFamily,
+    MetricsRegistry,
+    start_http_server,
+)
+from code.integration.benchmarks import synthetic_patterns
+
+
+def samples(text):
+    """Parse exposition sample lines into {name{labels}: value}."""
+    parsed = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            parsed[name] = float(value)
+    return parsed
+
+
+def exposition(engine):
+    """Render an engine's metrics through a registry."""
+    registry = MetricsRegistry()
+    registry.register(EngineCollector(engine))
+    return registry.exposition()
+
+
+class TestMetricFamily:
+    """Test metric family rendering."""
+    
+    def test_counter_and_gauge(self):
+        """Test counters get the _total suffix and labels are escaped."""
+        counter = MetricFamily("requests", "counter", "Requests served")
+        counter.add(3, {"path": 'a"b\\c\nd'})
+        gauge = MetricFamily("queue_depth", "gauge", "Queued items").add(2.5)
+        
+        text = counter.render() + gauge.render()
+        assert "# TYPE requests counter\n# HELP requests Requests served\n" in text
+        assert 'requests_total{path="a\\"b\\\\c\\nd"} 3\n' in text
+        assert "queue_depth 2.5\n" in text
+    
+    def test_histogram(self):
+        """Test bucket counts are cumulative and end with +Inf/count/sum."""
+        histogram = LogHistogram()
+        for value in (0.002, 0.004, 0.02, 0.3, 20.0):
+            histogram.record(value)
+        family = MetricFamily("latency_seconds", "histogram", "Latency", "seconds")
+        family.add_histogram(histogram, (0.001, 0.005, 0.1, 1.0), {"op": "x"})
+        
+        text = family.render()
+        assert "# UNIT latency_seconds seconds\n" in text
+        parsed = samples(text)
+        assert parsed['latency_seconds_bucket{op="x",le="0.001"}'] == 0
+        assert parsed['latency_seconds_bucket{op="x",le="0.005"}'] == 2
+        assert parsed['latency_seconds_bucket{op="x",le="0.1"}'] == 3
+        assert parsed['latency_seconds_bucket{op="x",le="1"}'] == 4
+        assert parsed['latency_seconds_bucket{op="x",le="+Inf"}'] == 5
+        assert parsed['latency_seconds_count{op="x"}'] == 5
+        assert parsed['latency_seconds_sum{op="x"}'] == pytest.approx(20.326)
+    
+    def test_invalid_family(self):
+        """Test unknown types and unit/name mismatches are rejected."""
+        with pytest.raises(ValueError):
+            MetricFamily("x", "summary", "")
+        with pytest.raises(ValueError):
+            MetricFamily("latency", "gauge", "", "seconds")
+        with pytest.raises(ValueError):
+            MetricFamily("x", "histogram", "").add(1)
+
+
+class TestMetricsRegistry:
+    """Test registry collection."""
+    
+    def test_exposition_ends_with_eof(self):
+        """Test callables and collectors are rendered, then # EOF."""
+        registry = MetricsRegistry()
+        registry.register(lambda: [MetricFamily("up", "gauge", "").add(1)])
+        
+        assert registry.exposition() == "# TYPE up gauge\nup 1\n# EOF\n"
+    
+    def test_duplicate_family_rejected(self):
+        """Test two collectors cannot expose the same family."""
+        registry = MetricsRegistry()
+        collector = lambda: [MetricFamily("up", "gauge", "").add(1)]
+        registry.register(collector)
+        registry.register(lambda: [MetricFamily("up", "gauge", "").add(0)])
+        with pytest.raises(ValueError):
+            registry.collect()
+        
+        registry.unregister(collector)
+        assert "up 0\n" in registry.exposition()
+
+
+class TestEngineCollector:
+    """Test engine metric export."""
+    
+    def test_engine_metrics(self):
+        """Test waltz, cache, validation and transition families."""
+        engine = IntegrationEngine(enable_telemetry=True, log_level=40)
+        patterns = synthetic_patterns(3)
+        engine.full_integration_cycle(patterns)
+        engine.integrate(patterns)
+        engine.validate({"name": "empty"})
+        engine.transition(patterns[0], "Phoenix", "Hydrogenesi")
+        
+        parsed = samples(exposition(engine))
+        assert parsed["integration_waltz_executions_total"] == 2
+        assert parsed["integration_waltz_patterns_total"] == 6
+        assert parsed['integration_waltz_duration_seconds_bucket{le="+Inf"}'] == 2
+        assert 'integration_waltz_phase_duration_seconds_count{phase="integration"}' in parsed
+        assert 'integration_waltz_duration_window_seconds{window="1m",quantile="0.99"}' in parsed
+        assert parsed["integration_cache_hits_total"] == 1
+        assert parsed["integration_waltz_cache_misses_total"] == 1
+        assert parsed['integration_validations_total{status="SOVEREIGN"}'] == 3
+        assert parsed['integration_validations_total{status="INVALID"}'] == 1
+        key = 'integration_transitions_total{from_pillar="Phoenix",to_pillar="Hydrogenesi",status="SUCCESS"}'
+        assert parsed[key] == 1
+        assert parsed["integration_integrated_patterns_total"] == 2
+        assert parsed["integration_sovereign"] == 1
+        engine.shutdown()
+    
+    def test_bulk_validation_counted(self):
+        """Test validate_many counts every pattern's status."""
+        engine = IntegrationEngine(enable_cache=False, enable_telemetry=False)
+        engine.validate_many(synthetic_patterns(5))
+        
+        counts = engine.get_validation_counts()
+        assert counts["SOVEREIGN"] == 5
+        assert sum(counts.values()) == 5
+        parsed = samples(exposition(engine))
+        assert not any(name.startswith("integration_waltz_duration") for name in parsed)
+        assert not any(name.startswith("integration_cache") for name in parsed)
+
+    
+    def test_counts_summed_across_threads(self):
+        """Test per-thread counters are summed, including exited threads."""
+        import threading
+        engine = IntegrationEngine(enable_cache=False, enable_telemetry=False)
+        
+        def work():
+            for _ in range(50):
+                engine.validate({"name": "bad"})
+                engine.transition({"name": "t"}, "Phoenix", "The Third")
+        
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        work()
+        
+        assert engine.get_validation_counts()["INVALID"] == 250
+        assert engine.get_transition_counts() == {("Phoenix", "The Third", "SUCCESS"): 250}
+        # Exited threads' shards are folded into the totals
+        assert len(engine._count_shards) == 1
+        assert engine.get_validation_counts()["INVALID"] == 250
+
+
+class TestHttpExporter:
+    """Test the HTTP exporter."""
+    
+    def test_serves_metrics(self):
+        """Test /metrics returns the exposition and other paths 404."""
+        registry = MetricsRegistry()
+        registry.register(lambda: [MetricFamily("up", "gauge", "").add(1)])
+        server = start_http_server(registry, port=0)
+        try:
+            url = "http://127.0.0.1:%d" % server.server_address[1]
+            with urllib.request.urlopen(url + "/metrics", timeout=5) as response:
+                assert response.headers["Content-Type"] == CONTENT_TYPE
+                assert response.read().decode() == registry.exposition()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(url + "/other", timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,151 @@
+"""
+Unit Tests for Slotted Patterns and PatternBatch
+"""
+
+import sys
+import os
+import copy
+import pickle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+import pytest
+
+from code.integration.engine import IntegrationEngine, IntegrationPattern
+from code.integration.pattern_batch import PatternBatch
+from code.integration.universal_laws import UniversalLaws
+from code.integration.tests.test_universal_laws import random_patterns
+
+
+def typed_patterns(count, seed=7):
+    """IntegrationPatterns with well-typed fields covering every law branch."""
+    patterns = []
+    for index, row in enumerate(random_patterns(count, seed)):
+        row.pop("identity", None)
+        row["name"] = f"pattern_{index}"
+        row["pillar"] = ("Phoenix", "Hydrogenesi", "The Third")[index % 3]
+        row["mode"] = "BEGIN"
+        if row.get("threshold") is not None:
+            row["threshold"] = 0.5
+        patterns.append(IntegrationPattern(**row))
+    return patterns
+
+
+class TestSlottedPattern:
+    """Test the slotted IntegrationPattern representation."""
+    
+    def test_no_instance_dict(self):
+        """Test patterns carry no per-instance __dict__."""
+        pattern = IntegrationPattern(name="p", pillar="Phoenix", mode="BEGIN")
+        assert not hasattr(pattern, "__dict__")
+    
+    def test_mapping_access(self):
+        """Test mapping-style reads match to_dict()."""
+        pattern = typed_patterns(1)[0]
+        assert dict(pattern) == pattern.to_dict()
+        assert pattern["coherence"] == pattern.coherence
+        assert pattern.get("identity", "fallback") == "fallback"
+        assert "threshold" in pattern and "fingerprint" not in pattern
+        with pytest.raises(KeyError):
+            pattern["fingerprint"]
+    
+    def test_validate_without_to_dict(self):
+        """Test laws accept pattern objects directly."""
+        laws = UniversalLaws()
+        for pattern in typed_patterns(50):
+            assert laws.validate_all(pattern) == laws.validate_all(pattern.to_dict())
+    
+    def test_copy_and_pickle(self):
+        """Test copies and pickles round-trip the fields."""
+        pattern = IntegrationPattern(name="p", pillar="Phoenix", mode="BEGIN", fingerprint="abc")
+        for clone in (copy.copy(pattern), copy.deepcopy(pattern), pickle.loads(pickle.dumps(pattern))):
+            assert clone == pattern
+            assert clone.fingerprint == "abc"
+
+
+class TestPatternBatch:
+    """Test the struct-of-arrays PatternBatch."""
+    
+    def test_round_trip(self):
+        """Test rows materialize back to the original patterns."""
+        patterns = typed_patterns(200)
+        batch = PatternBatch(patterns)
+        assert len(batch) == 200
+        assert batch.to_patterns() == patterns
+        assert batch[-1] == patterns[-1]
+        assert list(batch[10:20]) == patterns[10:20]
+    
+    def test_dict_rows(self):
+        """Test dict rows take IntegrationPattern defaults."""
+        batch = PatternBatch([{"name": "p", "pillar": "Phoenix", "mode": "BEGIN"}])
+        assert batch[0] == IntegrationPattern(name="p", pillar="Phoenix", mode="BEGIN")
+    
+    def test_interned_vocabulary(self):
+        """Test string fields are stored once per distinct value."""
+        batch = PatternBatch(typed_patterns(90))
+        assert batch.vocabulary("pillar") == ["Phoenix", "Hydrogenesi", "The Third"]
+        assert list(batch.codes("pillar"))[:4] == [0, 1, 2, 0]
+        assert list(batch.is_none("apex")) == [p.apex is None for p in batch]
+    
+    def test_bad_value_leaves_batch_unchanged(self):
+        """Test a row that cannot be stored is rejected atomically."""
+        batch = PatternBatch(typed_patterns(3))
+        with pytest.raises(ValueError):
+            batch.append(IntegrationPattern(name="p", pillar="Phoenix", mode="BEGIN", coherence="high"))
+        assert len(batch) == 3
+        assert len(batch.column("coherence")) == 3
+    
+    def test_fractional_depth_rejected(self):
+        """Test a non-integral depth is rejected rather than truncated."""
+        laws = UniversalLaws()
+        pattern = IntegrationPattern(
+            name="p",
+            pillar="Phoenix",
+            mode="BEGIN",
+            structure={"triad": ("fear", "service", "courage")},
+            apex="apex::warrior",
+            operators=["FirstBinding", "IM_ME", "PhoenixIgnition"],
+            convergence_point="apex::warrior",
+            invariant="identity::warrior",
+            closed=True,
+            sovereignty=True,
+            recursion_depth=UniversalLaws.MAX_RECURSION_DEPTH
+        )
+        assert laws.validate_many(PatternBatch([pattern])).statuses() == ["SOVEREIGN"]
+        pattern.recursion_depth = UniversalLaws.MAX_RECURSION_DEPTH + 0.5
+        row = pattern.to_dict()
+        assert laws.validate_all(pattern)["status"] == "UNSTABLE"
+        assert laws.validate_many([row]).statuses() == ["UNSTABLE"]
+        with pytest.raises(ValueError):
+            PatternBatch([pattern])
+        with pytest.raises(ValueError):
+            PatternBatch([row])
+        
+        pattern.recursion_depth = 3.0
+        assert PatternBatch([pattern])[0].recursion_depth == 3
+    
+    @pytest.mark.parametrize("backend", ["numpy", "python"])
+    def test_validate_many(self, backend):
+        """Test bulk validation of a batch matches validate_all per row."""
+        if backend == "numpy":
+            pytest.importorskip("numpy")
+        laws = UniversalLaws()
+        patterns = typed_patterns(500)
+        result = laws.validate_many(PatternBatch(patterns), backend=backend)
+        assert result.statuses() == [laws.validate_all(p)["status"] for p in patterns]
+        assert result.details(7) == laws.validate_all(patterns[7])
+    
+    def test_engine_accepts_batch(self):
+        """Test the engine validates and integrates batches directly."""
+        engine = IntegrationEngine(enable_telemetry=False)
+        pattern = IntegrationPattern(
+            name="p",
+            pillar="Phoenix",
+            mode="BEGIN",
+            structure={"triad": ("fear", "service", "courage")},
+            apex="apex::warrior",
+            operators=["FirstBinding", "IM_ME", "PhoenixIgnition"],
+            convergence_point="apex::warrior"
+        )
+        batch = PatternBatch([pattern] * 3)
+        assert engine.validate_many(batch).statuses() == [engine.validate(pattern)["status"]] * 3
+        assert engine.full_integration_cycle(batch)["status"] == "COMPLETE"
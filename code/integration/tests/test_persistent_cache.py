@@ -0,0 +1,199 @@
+"""
+Unit Tests for Persistent Waltz Result Cache
+"""
+
+import sys
+import os
+import multiprocessing
+import pickle
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.persistent_cache import PersistentPatternCache
+from code.integration.cache import CachedThreeFingerWaltz
+
+
+def _write_entries(path, worker, count):
+    """Process-pool helper: write ``count`` entries from one worker."""
+    store = PersistentPatternCache(path)
+    for i in range(count):
+        store.put([{"name": f"w{worker}-{i}"}], {"worker": worker, "i": i})
+    store.close()
+
+
+class TestPersistentPatternCache:
+    """Test PersistentPatternCache functionality."""
+    
+    def test_put_get_roundtrip(self, tmp_path):
+        """Test stored results read back frozen."""
+        store = PersistentPatternCache(str(tmp_path))
+        store.put([{"name": "a"}], {"status": "WALTZ_COMPLETE", "steps": [1, 2]})
+        
+        result = store.get([{"name": "a"}])
+        assert result["status"] == "WALTZ_COMPLETE"
+        assert result["steps"] == (1, 2)
+        assert store.get([{"name": "b"}]) is None
+        
+        stats = store.stats()
+        assert stats["entries"] == 1
+        assert stats["total_hits"] == 1
+        assert stats["total_misses"] == 1
+    
+    def test_warm_start_after_reopen(self, tmp_path):
+        """Test a new instance sees entries written by a previous one."""
+        store = PersistentPatternCache(str(tmp_path))
+        store.put([{"name": "a"}], {"value": 1})
+        store.close()
+        
+        reopened = PersistentPatternCache(str(tmp_path))
+        assert reopened.stats()["entries"] == 1
+        assert reopened.get([{"name": "a"}])["value"] == 1
+    
+    def test_sees_other_instance_writes(self, tmp_path):
+        """Test readers pick up records appended by another writer."""
+        reader = PersistentPatternCache(str(tmp_path))
+        writer = PersistentPatternCache(str(tmp_path))
+        
+        writer.put([{"name": "late"}], {"value": 2})
+        assert reader.get([{"name": "late"}])["value"] == 2
+    
+    def test_torn_tail_is_dropped(self, tmp_path):
+        """Test a crash mid-append loses only the torn record."""
+        store = PersistentPatternCache(str(tmp_path))
+        store.put([{"name": "a"}], {"value": 1})
+        store.close()
+        data_path = os.path.join(str(tmp_path), store.DATA_FILE)
+        good_size = os.path.getsize(data_path)
+        record = store._pack_record(b"k" * 64, b'{"value":2}', time.time())
+        with open(data_path, "ab") as f:
+            f.write(record[:-3])
+        
+        reopened = PersistentPatternCache(str(tmp_path))
+        assert reopened.stats()["entries"] == 1
+        assert reopened.stats()["bytes"] == good_size
+        reopened.put([{"name": "b"}], {"value": 3})
+        
+        fresh = PersistentPatternCache(str(tmp_path))
+        assert fresh.get([{"name": "a"}])["value"] == 1
+        assert fresh.get([{"name": "b"}])["value"] == 3
+        assert fresh.stats()["entries"] == 2
+    
+    def test_corrupt_record_fails_checksum(self, tmp_path):
+        """Test a complete record with damaged bytes is not indexed."""
+        store = PersistentPatternCache(str(tmp_path))
+        store.put([{"name": "a"}], {"value": 1})
+        store.close()
+        data_path = os.path.join(str(tmp_path), store.DATA_FILE)
+        with open(data_path, "r+b") as f:
+            f.seek(-2, os.SEEK_END)
+            f.write(b"\xff\xff")
+        
+        reopened = PersistentPatternCache(str(tmp_path))
+        assert reopened.get([{"name": "a"}]) is None
+        assert reopened.stats()["entries"] == 0
+    
+    def test_ttl_expiry(self, tmp_path):
+        """Test entries past their TTL are misses."""
+        store = PersistentPatternCache(str(tmp_path), ttl_seconds=0.05)
+        store.put([{"name": "a"}], {"value": 1})
+        assert store.get([{"name": "a"}]) is not None
+        
+        time.sleep(0.1)
+        assert store.get([{"name": "a"}]) is None
+        assert store.stats()["expired"] == 1
+    
+    def test_entry_limit_compacts(self, tmp_path):
+        """Test exceeding max_entries compacts to the newest entries."""
+        store = PersistentPatternCache(str(tmp_path), max_entries=8)
+        for i in range(20):
+            store.put([{"name": str(i)}], {"i": i})
+        
+        stats = store.stats()
+        assert stats["compactions"] >= 1
+        assert stats["entries"] <= 8
+        assert store.get([{"name": "19"}])["i"] == 19
+        assert store.get([{"name": "0"}]) is None
+    
+    def test_byte_limit_compacts(self, tmp_path):
+        """Test exceeding max_bytes keeps the data file bounded."""
+        store = PersistentPatternCache(str(tmp_path), max_bytes=4096)
+        for i in range(100):
+            store.put([{"name": str(i)}], {"payload": "x" * 100})
+        
+        assert os.path.getsize(os.path.join(str(tmp_path), store.DATA_FILE)) <= 4096
+        assert store.get([{"name": "99"}]) is not None
+    
+    def test_hash_mode_mismatch(self, tmp_path):
+        """Test reopening with a different hash mode is rejected."""
+        PersistentPatternCache(str(tmp_path), hash_mode="sha256").close()
+        try:
+            PersistentPatternCache(str(tmp_path), hash_mode="fast")
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    
+    def test_pickle_reopens(self, tmp_path):
+        """Test the store can be shipped to worker processes."""
+        store = PersistentPatternCache(str(tmp_path), ttl_seconds=60)
+        store.put([{"name": "a"}], {"value": 1})
+        
+        clone = pickle.loads(pickle.dumps(store))
+        assert clone.ttl_seconds == 60
+        assert clone.get([{"name": "a"}])["value"] == 1
+    
+    def test_concurrent_process_writers(self, tmp_path):
+        """Test several processes can append to one store safely."""
+        ctx = multiprocessing.get_context("spawn")
+        workers = [
+            ctx.Process(target=_write_entries, args=(str(tmp_path), w, 25))
+            for w in range(3)
+        ]
+        for proc in workers:
+            proc.start()
+        for proc in workers:
+            proc.join(timeout=60)
+            assert proc.exitcode == 0
+        
+        store = PersistentPatternCache(str(tmp_path))
+        assert store.stats()["entries"] == 75
+        assert store.get([{"name": "w2-24"}])["i"] == 24
+
+
+class TestPersistentWaltzCache:
+    """Test CachedThreeFingerWaltz with a persistent second level."""
+    
+    def test_results_survive_restart(self, tmp_path):
+        """Test a new waltz (new worker) hits results from a previous one."""
+        patterns = [{"name": "test"}]
+        
+        first = CachedThreeFingerWaltz(
+            reentrant=True, persistent_cache=PersistentPatternCache(str(tmp_path))
+        )
+        assert first(patterns)["from_cache"] == False
+        
+        second = CachedThreeFingerWaltz(
+            reentrant=True, persistent_cache=PersistentPatternCache(str(tmp_path))
+        )
+        hit = second(patterns)
+        assert hit["from_cache"] == True
+        assert hit["cache_level"] == "persistent"
+        assert hit["pattern"]["triad"]["phoenix"]["core"] == "test"
+        assert second.cache_stats()["persistent_hits"] == 1
+        
+        # Promoted into the in-process cache
+        assert second(patterns).get("cache_level") is None
+    
+    def test_warm_start_preloads(self, tmp_path):
+        """Test warm start fills the in-process cache on boot."""
+        store = PersistentPatternCache(str(tmp_path))
+        seed = CachedThreeFingerWaltz(reentrant=True, persistent_cache=store)
+        for i in range(5):
+            seed([{"name": str(i)}])
+        
+        warm = CachedThreeFingerWaltz(
+            reentrant=True, 
+            persistent_cache=PersistentPatternCache(str(tmp_path)), 
+            warm_start=3
+        )
+        assert warm.cache.stats()["size"] == 3
+        assert warm([{"name": "4"}]).get("cache_level") is None
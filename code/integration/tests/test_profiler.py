@@ -0,0 +1,219 @@
+"""
+Unit Tests for the Span Profiler
+"""
+
+import sys
+import os
+import io
+import json
+import threading
+import pytest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.profiler import NULL_SPAN, SpanProfiler, traced
+from code.integration.meta_operators import ThreeFingerWaltz, WaltzPhase
+from code.integration.telemetry import InstrumentedThreeFingerWaltz
+from code.integration.engine import IntegrationEngine
+from code.integration.benchmarks import synthetic_patterns
+
+
+class StepClock:
+    """Clock advancing 10ns per reading."""
+    
+    def __init__(self):
+        self.now = 0
+    
+    def __call__(self):
+        self.now += 10
+        return self.now
+
+
+def names(trace):
+    """Span names of a trace, depth first."""
+    return [span.name for _, span in trace.walk()]
+
+
+class TestSpanProfiler:
+    """Test span recording and export."""
+    
+    def test_nested_spans(self):
+        """Test spans nest per thread and close into one trace."""
+        profiler = SpanProfiler(clock=StepClock())
+        with profiler.span("outer", size=3):
+            with profiler.span("inner"):
+                pass
+            profiler.add("timed", 12, 15)
+        
+        (trace,) = profiler.traces()
+        assert names(trace) == ["outer", "inner", "timed"]
+        assert trace.args == {"size": 3}
+        assert trace.duration_ns == 30
+        assert trace.self_ns == 30 - 10 - 3
+    
+    def test_disabled_is_noop(self):
+        """Test a stopped profiler hands out the shared null span."""
+        profiler = SpanProfiler(enabled=False)
+        assert profiler.span("x") is NULL_SPAN
+        assert profiler.add("x", 0, 1) is None
+        
+        profiler.start()
+        with profiler.span("x"):
+            pass
+        profiler.stop()
+        assert len(profiler.traces()) == 1
+    
+    def test_capacity_and_errors(self):
+        """Test the trace ring is bounded and errors are annotated."""
+        profiler = SpanProfiler(capacity=2)
+        for name in ("a", "b", "c"):
+            with profiler.span(name):
+                pass
+        with pytest.raises(KeyError):
+            with profiler.span("failing"):
+                raise KeyError("x")
+        
+        traces = profiler.traces()
+        assert [trace.name for trace in traces] == ["c", "failing"]
+        assert traces[-1].args == {"error": "KeyError"}
+    
+    def test_threads_have_separate_stacks(self):
+        """Test spans of another thread start their own traces."""
+        profiler = SpanProfiler()
+        
+        def work():
+            with profiler.span("worker"):
+                pass
+        
+        with profiler.span("main"):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+        
+        traces = {trace.name: trace for trace in profiler.traces()}
+        assert set(traces) == {"main", "worker"}
+        assert traces["main"].children == []
+        assert traces["main"].thread_id != traces["worker"].thread_id
+    
+    def test_chrome_trace(self, tmp_path):
+        """Test every span becomes a complete event in microseconds."""
+        profiler = SpanProfiler(clock=StepClock())
+        with profiler.span("cache.lookup"):
+            with profiler.span("phase.initiation"):
+                pass
+        
+        path = str(tmp_path / "trace.json")
+        assert profiler.write_chrome_trace(path) == 2
+        with open(path) as f:
+            events = json.load(f)["traceEvents"]
+        assert [(e["name"], e["cat"], e["ph"]) for e in events] == [
+            ("cache.lookup", "cache", "X"),
+            ("phase.initiation", "phase", "X"),
+        ]
+        assert events[0]["ts"] == 0.01
+        assert events[0]["dur"] == 0.03
+    
+    def test_folded_stacks(self, tmp_path):
+        """Test self time is aggregated per stack."""
+        profiler = SpanProfiler(clock=StepClock())
+        for _ in range(2):
+            with profiler.span("waltz"):
+                with profiler.span("cache.hash"):
+                    pass
+        
+        assert profiler.folded_stacks() == {"waltz": 40, "waltz;cache.hash": 20}
+        path = str(tmp_path / "stacks.folded")
+        assert profiler.write_folded(path) == 2
+        with open(path) as f:
+            assert f.read() == "waltz 40\nwaltz;cache.hash 20\n"
+    
+    def test_traced_decorator(self):
+        """Test traced methods open a span only with an enabled profiler."""
+        class Owner:
+            profiler = None
+            
+            @traced("owner.work")
+            def work(self, value):
+                return value * 2
+        
+        owner = Owner()
+        assert owner.work(2) == 4
+        owner.profiler = SpanProfiler()
+        assert owner.work(3) == 6
+        assert [trace.name for trace in owner.profiler.traces()] == ["owner.work"]
+
+
+class TestWaltzSpans:
+    """Test waltz phase timing and spans."""
+    
+    def test_reentrant_phase_durations(self):
+        """Test reentrant passes report per-phase durations when timed."""
+        waltz = ThreeFingerWaltz(reentrant=True)
+        waltz(synthetic_patterns(3))
+        assert waltz.last_phase_durations() == {}
+        
+        waltz.time_phases = True
+        waltz(synthetic_patterns(3))
+        durations = waltz.last_phase_durations()
+        assert list(durations) == list(WaltzPhase)
+        assert all(duration >= 0 for duration in durations.values())
+    
+    def test_classic_phase_durations(self):
+        """Test classic phases are timed per call, not since construction."""
+        waltz = ThreeFingerWaltz()
+        waltz(synthetic_patterns(3))
+        durations = waltz.last_phase_durations()
+        assert list(durations) == list(WaltzPhase)
+        
+        # Later calls (ALREADY_COMPLETE) report no phases
+        waltz(synthetic_patterns(3))
+        assert waltz.last_phase_durations() == {}
+    
+    def test_instrumented_spans(self):
+        """Test cache and phase spans nest under the waltz span."""
+        profiler = SpanProfiler()
+        waltz = InstrumentedThreeFingerWaltz(
+            reentrant=True, log_stream=io.StringIO(), profiler=profiler
+        )
+        patterns = synthetic_patterns(3)
+        waltz(patterns)
+        waltz(patterns)
+        
+        miss, hit = profiler.traces()
+        assert names(miss) == [
+            "waltz", "cache.hash", "cache.lookup",
+            "waltz.dance", "phase.initiation", "phase.transformation",
+            "phase.integration", "phase.completion", "cache.store",
+        ]
+        assert "waltz.dance" not in names(hit)
+        
+        # The cache hit recorded no phase samples
+        summary = waltz.metrics.get_summary()
+        assert summary["total_executions"] == 2
+        assert summary["phase_percentiles"]["initiation"]["all"]["count"] == 1
+    
+    def test_fast_mode_samples_phases(self):
+        """Test fast mode times one in N calls per phase."""
+        waltz = InstrumentedThreeFingerWaltz(
+            cache_size=0, reentrant=True, telemetry_mode="fast",
+            log_stream=io.StringIO(), phase_sample_rate=0.25
+        )
+        for _ in range(8):
+            waltz(synthetic_patterns(3))
+        waltz.close()
+        
+        summary = waltz.metrics.get_summary()
+        assert summary["total_executions"] == 8
+        assert summary["phase_percentiles"]["completion"]["all"]["count"] == 2
+    
+    def test_engine_spans(self):
+        """Test engine calls wrap validation, waltz and quick check spans."""
+        profiler = SpanProfiler()
+        engine = IntegrationEngine(enable_telemetry=False, profiler=profiler)
+        engine.full_integration_cycle(synthetic_patterns(3))
+        
+        (trace,) = profiler.traces()
+        spans = names(trace)
+        assert spans[0] == "engine.full_integration_cycle"
+        assert spans.count("engine.validate") == 3
+        assert "phase.completion" in spans
+        assert spans[-1] == "validator.quick_check"
@@ -0,0 +1,84 @@
+"""
+Unit Tests for Retention Buffers
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.retention import RetentionBuffer
+from code.integration.meta_operators import ThreeFingerWaltz
+from code.integration.engine import IntegrationEngine
+
+
+class TestRetentionBuffer:
+    """Test RetentionBuffer functionality."""
+    
+    def test_unbounded_behaves_like_list(self):
+        """Test list operations without limits."""
+        buffer = RetentionBuffer()
+        buffer.extend([1, 2, 3])
+        assert buffer == [1, 2, 3]
+        assert buffer[-1] == 3
+        assert buffer[:2] == [1, 2]
+        assert buffer.pop() == 3
+        assert len(buffer) == 2
+        assert buffer.total == 2
+    
+    def test_ring_buffer(self):
+        """Test the oldest entries are evicted beyond max_entries."""
+        buffer = RetentionBuffer(max_entries=3)
+        buffer.extend(range(10))
+        assert list(buffer) == [7, 8, 9]
+        assert buffer.total == 10
+        assert buffer.stats()["evicted"] == 7
+    
+    def test_byte_cap(self):
+        """Test the estimated size of retained entries stays under max_bytes."""
+        buffer = RetentionBuffer(max_bytes=2000)
+        for i in range(50):
+            buffer.append({"name": f"pattern_{i}", "payload": "x" * 100})
+        
+        stats = buffer.stats()
+        assert stats["bytes"] <= 2000
+        assert 0 < stats["retained"] < 50
+        assert buffer[-1]["name"] == "pattern_49"
+    
+    def test_spill_to_disk(self, tmp_path):
+        """Test evicted entries are appended to the spill file in order."""
+        spill = str(tmp_path / "spill.jsonl")
+        buffer = RetentionBuffer(max_entries=2, spill_path=spill)
+        buffer.extend({"i": i} for i in range(5))
+        
+        assert [entry["i"] for entry in buffer.iter_spilled()] == [0, 1, 2]
+        assert [entry["i"] for entry in buffer] == [3, 4]
+        assert buffer.stats()["spilled"] == 3
+
+
+class TestBoundedHistories:
+    """Test retention limits on the waltz and engine."""
+    
+    def test_waltz_history_limit(self):
+        """Test history_limit caps waltz_history while history_total counts all."""
+        waltz = ThreeFingerWaltz(history_limit=2, max_recursion=10)
+        for i in range(5):
+            waltz.dance([{"name": str(i)}])
+            waltz.reverse_waltz()
+            waltz.waltz_history.append({"name": str(i)})
+        
+        assert len(waltz.waltz_history) == 2
+        assert waltz.get_status()["history_total"] == 5
+    
+    def test_engine_retention(self):
+        """Test status and sovereignty report totals beyond the retained window."""
+        engine = IntegrationEngine(enable_telemetry=False, retain_patterns=4)
+        for i in range(10):
+            engine.integrate([{"name": str(i)}])
+        
+        status = engine.get_status()
+        assert status["integrated_patterns"] == 10
+        assert status["retention"]["retained"] == 4
+        
+        sovereignty = engine.verify_sovereignty()
+        assert "with integrated patterns" in sovereignty["message"]
+        assert sovereignty["subsystems"]["integrated_patterns"] == 10
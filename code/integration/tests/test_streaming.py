@@ -0,0 +1,120 @@
+"""
+Unit Tests for Streaming Integration Cycles
+"""
+
+import sys
+import os
+import gzip
+import json
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.engine import IntegrationEngine, IntegrationPattern
+from code.integration.streaming import chunked, iter_jsonl_batches
+
+
+def _valid(name):
+    return IntegrationPattern(
+        name=name,
+        pillar="Phoenix",
+        mode="BEGIN",
+        structure={"triad": ("fear", "service", "courage")},
+        apex="apex::warrior",
+        operators=["FirstBinding", "IM_ME", "PhoenixIgnition"],
+        convergence_point="apex::warrior"
+    ).to_dict()
+
+
+def _invalid(name):
+    return {"name": name}
+
+
+class TestBatchReaders:
+    """Test lazy batch sources."""
+    
+    def test_chunked(self):
+        """Test grouping a pattern stream into batches."""
+        assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(chunked([], 3)) == []
+    
+    def test_jsonl_patterns_and_batches(self, tmp_path):
+        """Test pattern lines are grouped and array lines are whole batches."""
+        path = tmp_path / "dump.jsonl"
+        lines = [{"name": "a"}, {"name": "b"}, [{"name": "c"}], {"name": "d"}]
+        path.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n")
+        
+        batches = list(iter_jsonl_batches(str(path), batch_size=2))
+        names = [[p["name"] for p in batch] for batch in batches]
+        assert names == [["a", "b"], ["c"], ["d"]]
+    
+    def test_jsonl_gzip(self, tmp_path):
+        """Test compressed dumps are read transparently."""
+        path = tmp_path / "dump.jsonl.gz"
+        with gzip.open(path, "wt") as f:
+            f.write(json.dumps({"name": "a"}) + "\n")
+        assert list(iter_jsonl_batches(str(path))) == [[{"name": "a"}]]
+    
+    def test_jsonl_reports_bad_line(self, tmp_path):
+        """Test malformed lines raise with their line number."""
+        path = tmp_path / "dump.jsonl"
+        path.write_text('{"name": "a"}\n{oops\n')
+        try:
+            list(iter_jsonl_batches(str(path)))
+            assert False, "expected ValueError"
+        except ValueError as e:
+            assert ":2:" in str(e)
+
+
+class TestStreamIntegrationCycle:
+    """Test IntegrationEngine.stream_integration_cycle."""
+    
+    def test_yields_per_batch(self):
+        """Test one tagged result per batch."""
+        engine = IntegrationEngine(enable_telemetry=False)
+        batches = ([_valid(f"p{i}"), _valid(f"q{i}")] for i in range(3))
+        
+        results = list(engine.stream_integration_cycle(batches, batch=True))
+        assert [r["batch_index"] for r in results] == [0, 1, 2]
+        assert all(r["status"] == "COMPLETE" for r in results)
+        assert all(r["batch_size"] == 2 for r in results)
+    
+    def test_consumes_input_lazily(self):
+        """Test batches are pulled only as results are consumed."""
+        engine = IntegrationEngine(enable_telemetry=False)
+        pulled = []
+        
+        def source():
+            for i in range(100):
+                pulled.append(i)
+                yield [_valid(f"p{i}")]
+        
+        stream = engine.stream_integration_cycle(source())
+        next(stream)
+        next(stream)
+        assert pulled == [0, 1]
+    
+    def test_fail_fast(self):
+        """Test streaming stops at the first INVALID batch."""
+        engine = IntegrationEngine(enable_telemetry=False)
+        batches = [[_valid("a")], [_invalid("b")], [_valid("c")]]
+        
+        results = list(engine.stream_integration_cycle(batches))
+        assert [r["status"] for r in results] == ["COMPLETE", "VALIDATION_FAILED"]
+        
+        results = list(engine.stream_integration_cycle(batches, fail_fast=False))
+        assert len(results) == 3
+    
+    def test_compact_results(self):
+        """Test per-pattern law results can be dropped."""
+        engine = IntegrationEngine(enable_telemetry=False)
+        result = next(engine.stream_integration_cycle([[_valid("a")]], include_validations=False))
+        assert "validations" not in result
+        assert result["steps"][0]["result"] in ("SOVEREIGN", "STABLE", "UNSTABLE")
+    
+    def test_stream_file(self, tmp_path):
+        """Test streaming straight from a JSONL dump."""
+        path = tmp_path / "dump.jsonl"
+        path.write_text("\n".join(json.dumps(_valid(f"p{i}")) for i in range(5)))
+        
+        engine = IntegrationEngine(enable_telemetry=False)
+        results = list(engine.stream_integration_file(str(path), batch_size=2, batch=True))
+        assert [r["batch_size"] for r in results] == [2, 2, 1]
@@ -6,8 +6,18 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 
-from code.integration.telemetry import WaltzLogger, WaltzMetrics, InstrumentedThreeFingerWaltz
+from code.integration.telemetry import (
+    WaltzLogger, 
+    WaltzMetrics, 
+    InstrumentedThreeFingerWaltz, 
+    FAST_SAMPLE_RATES,
+)
+from code.integration.meta_operators import WaltzPhase
+from code.integration.engine import IntegrationEngine
+import io
+import json
 import logging
+import pytest
 
 
 class TestWaltzLogger:
@@ -102,6 +112,42 @@ class TestWaltzMetrics:
         assert "uptime_seconds" in summary
         assert "executions_per_minute" in summary
     
+    def test_summary_percentiles(self):
+        """Test durations are summarized as percentiles per window and phase."""
+        metrics = WaltzMetrics()
+        for i in range(1, 101):
+            metrics.record_execution(i / 1000, 3, {WaltzPhase.INITIATION: i / 10000})
+        
+        summary = metrics.get_summary()
+        durations = summary["duration_percentiles"]
+        assert set(durations) == {"all", "1m", "5m", "15m"}
+        assert durations["1m"]["count"] == 100 and durations["all"]["max"] == 0.1
+        assert abs(durations["all"]["p90"] - 0.09) < 0.09 / 32
+        initiation = summary["phase_percentiles"]["initiation"]["all"]
+        assert initiation["count"] == 100 and abs(initiation["p50"] - 0.005) < 0.005 / 32
+        assert abs(summary["phase_avg_durations"]["initiation"] - 0.00505) < 1e-12
+    
+    def test_buffered_samples_from_threads(self):
+        """Test buffered samples from many threads are all counted."""
+        import threading
+        
+        metrics = WaltzMetrics()
+        
+        def record():
+            for _ in range(WaltzMetrics.FLUSH_SIZE + 7):
+                metrics.record_execution(0.001, 2)
+        
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        expected = 4 * (WaltzMetrics.FLUSH_SIZE + 7)
+        assert metrics.total_executions == expected
+        assert metrics.total_patterns == 2 * expected
+        assert metrics.snapshot()["duration"].count == expected
+    
     def test_metrics_reset(self):
         """Test metrics reset."""
         metrics = WaltzMetrics()
@@ -196,6 +242,106 @@ class TestInstrumentedThreeFingerWaltz:
         assert result2["status"] == "ALREADY_COMPLETE"
 
 
+
+def _events(stream):
+    return [json.loads(line)["message"] for line in stream.getvalue().splitlines()]
+
+
+class TestFastTelemetry:
+    """Test lazy, sampled and asynchronous telemetry."""
+    
+    def test_disabled_level_skips_event(self, monkeypatch):
+        """Test events below the logger level are never built."""
+        stream = io.StringIO()
+        logger = WaltzLogger(name="test_lazy", level=logging.WARNING, stream=stream)
+        monkeypatch.setattr(logger, "_emit", lambda *args: pytest.fail("event built"))
+        logger.log_waltz_start(3)
+        logger.log_waltz_complete({"status": "WALTZ_COMPLETE"}, 0.1)
+        logger.log_cache_miss(3)
+        assert stream.getvalue() == ""
+    
+    def test_sampling(self):
+        """Test sampled events log one in round(1/rate) and errors always log."""
+        stream = io.StringIO()
+        logger = WaltzLogger(
+            name="test_sampling", 
+            stream=stream, 
+            sample_rates={"waltz_start": 0.25, "waltz_complete": 0.0}
+        )
+        for _ in range(100):
+            logger.log_waltz_start(3)
+            logger.log_waltz_complete({"status": "WALTZ_COMPLETE"}, 0.1)
+        logger.log_waltz_error(ValueError("boom"))
+        
+        events = _events(stream)
+        starts = [event for event in events if event["event"] == "waltz_start"]
+        assert len(starts) == 25 and starts[0]["sample_rate"] == 0.25
+        assert [event["event"] for event in events].count("waltz_complete") == 0
+        assert events[-1]["event"] == "waltz_error"
+        with pytest.raises(ValueError):
+            logger.set_sample_rate("waltz_error", 0.5)
+    
+    def test_async_emit(self):
+        """Test queued records are written by flush() and close()."""
+        stream = io.StringIO()
+        logger = WaltzLogger(name="test_async", stream=stream, async_emit=True)
+        for count in range(50):
+            logger.log_waltz_start(count)
+        assert logger.flush(timeout=5)
+        assert [event["patterns_count"] for event in _events(stream)] == list(range(50))
+        
+        logger.close()
+        logger.log_waltz_start(99)
+        assert _events(stream)[-1]["patterns_count"] == 99
+    
+    def test_async_pumps_do_not_leak(self):
+        """Test replaced or collected async loggers stop their pump threads."""
+        import gc
+        import threading
+        
+        def pumps():
+            return sum(thread.name == "waltz-log-pump" for thread in threading.enumerate())
+        
+        before = pumps()
+        stream = io.StringIO()
+        loggers = [WaltzLogger(name="test_pumps", stream=stream, async_emit=True) for _ in range(20)]
+        assert pumps() == before + 1
+        loggers[-1].log_waltz_start(7)
+        
+        del loggers
+        gc.collect()
+        assert pumps() == before
+        assert _events(stream)[-1]["patterns_count"] == 7
+    
+    def test_fast_mode_waltz(self):
+        """Test fast mode samples events and still records every call."""
+        stream = io.StringIO()
+        waltz = InstrumentedThreeFingerWaltz(
+            cache_size=0, 
+            telemetry_mode="fast", 
+            log_stream=stream, 
+            reentrant=True
+        )
+        for _ in range(200):
+            result = waltz([{"name": "test"}])
+        waltz.close()
+        
+        assert isinstance(result["telemetry"]["timestamp"], float)
+        assert result["telemetry"]["duration_seconds"] > 0
+        assert waltz.metrics.get_summary()["total_executions"] == 200
+        starts = [event for event in _events(stream) if event["event"] == "waltz_start"]
+        assert len(starts) == 200 * FAST_SAMPLE_RATES["waltz_start"]
+    
+    def test_engine_telemetry_mode(self):
+        """Test the engine passes and reports its telemetry mode."""
+        engine = IntegrationEngine(telemetry_mode="fast")
+        assert engine.meta_operator.telemetry_mode == "fast"
+        assert engine.get_status()["features"]["telemetry_mode"] == "fast"
+        engine.shutdown()
+        with pytest.raises(ValueError):
+            IntegrationEngine(telemetry_mode="verbose")
+
+
 if __name__ == "__main__":
     print("Running telemetry tests...")
     
@@ -0,0 +1,219 @@
+"""
+Unit Tests for Universal Laws Bulk Validation
+"""
+
+import sys
+import os
+import random
+import pytest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration.universal_laws import UniversalLaws, LAW_NAMES
+from code.integration.engine import IntegrationPattern
+
+
+def random_patterns(count, seed=7):
+    """Patterns covering every branch of every law (including missing keys)."""
+    rnd = random.Random(seed)
+    patterns = []
+    for _ in range(count):
+        pattern = {}
+        if rnd.random() < 0.9:
+            pattern["name"] = "pattern"
+        if rnd.random() < 0.7:
+            pattern["structure"] = rnd.choice([
+                {}, 
+                {"triad": ("a", "b", "c")}, 
+                {"elements": [1, 2, 3]}, 
+                {"elements": [1, 2, 3], "tension_pair": (1, 2), "stabilizer": 3}, 
+                {"elements": [1]},
+            ])
+        for key, low, high in [
+            ("similarity_ratio", 0.0, 2.0), 
+            ("stability_score", 0.0, 1.0), 
+            ("embedding_ratio", 1.3, 1.9), 
+            ("coherence", 0.4, 1.0),
+        ]:
+            if rnd.random() < 0.8:
+                pattern[key] = rnd.uniform(low, high)
+        if rnd.random() < 0.8:
+            pattern["recursion_depth"] = rnd.randint(0, 10)
+        for key in ["converges", "stable", "threshold_managed", "invariant_preserved", "closed", "sovereignty"]:
+            if rnd.random() < 0.8:
+                pattern[key] = rnd.random() < 0.6
+        for key in ["convergence_point", "apex", "threshold", "invariant", "identity"]:
+            if rnd.random() < 0.5:
+                pattern[key] = rnd.choice([None, "value"])
+        if rnd.random() < 0.7:
+            pattern["operators"] = ["op"] * rnd.randint(0, 5)
+        patterns.append(pattern)
+    return patterns
+
+
+class TestValidateMany:
+    """Test UniversalLaws.validate_many against validate_all."""
+    
+    @pytest.mark.parametrize("backend", ["python", "numpy"])
+    def test_matches_validate_all(self, backend):
+        """Test every law status and overall status agree with validate_all."""
+        if backend == "numpy":
+            pytest.importorskip("numpy")
+        laws = UniversalLaws()
+        patterns = random_patterns(2000)
+        bulk = laws.validate_many(patterns, backend=backend)
+        
+        assert len(bulk) == len(patterns)
+        for i, pattern in enumerate(patterns):
+            expected = laws.validate_all(pattern)
+            assert bulk.status(i) == expected["status"]
+            assert [s.value for s in bulk.law_statuses(i)] == [
+                r["status"] for r in expected["law_results"]
+            ]
+    
+    def test_none_values_fall_back(self):
+        """Test None in numeric fields is handled exactly like validate_all."""
+        laws = UniversalLaws()
+        patterns = [{"name": "a", "stable": False, "stability_score": None}]
+        bulk = laws.validate_many(patterns)
+        assert bulk.status(0) == laws.validate_all(patterns[0])["status"]
+    
+    def test_counts_and_details(self):
+        """Test aggregate counts and on-demand details."""
+        laws = UniversalLaws()
+        patterns = random_patterns(300)
+        bulk = laws.validate_many(patterns)
+        
+        counts = bulk.status_counts()
+        assert sum(counts.values()) == 300
+        assert counts["INVALID"] == bulk.statuses().count("INVALID")
+        
+        violations = bulk.violation_counts()
+        assert set(violations) == set(LAW_NAMES)
+        assert violations["Apex Fixed-Point Proof"] == sum(
+            1 for p in patterns if p.get("apex") is None
+        )
+        
+        assert bulk.details(5) == laws.validate_all(patterns[5])
+    
+    def test_accepts_integration_patterns(self):
+        """Test dataclass patterns are converted."""
+        laws = UniversalLaws()
+        pattern = IntegrationPattern(name="a", pillar="Phoenix", mode="BEGIN")
+        bulk = laws.validate_many([pattern], backend="python")
+        assert bulk.status(0) == laws.validate_all(pattern.to_dict())["status"]
+
+
+class TestLazyValidation:
+    """Test short-circuit evaluation via validate_lazy."""
+    
+    def test_status_matches_validate_all(self):
+        """Test lazy status agrees with full validation."""
+        laws = UniversalLaws()
+        for pattern in random_patterns(1000, seed=11):
+            assert laws.validate_lazy(pattern).status == laws.validate_all(pattern)["status"]
+    
+    def test_on_demand_results_identical(self):
+        """Test materialized verdicts equal validate_all output."""
+        laws = UniversalLaws()
+        for pattern in random_patterns(200, seed=3):
+            verdict = laws.validate_lazy(pattern)
+            assert verdict["message"] == laws.validate_all(pattern)["message"]
+            assert dict(verdict) == laws.validate_all(pattern)
+    
+    def test_stops_at_third_violation(self):
+        """Test INVALID is decided without evaluating every law."""
+        laws = UniversalLaws()
+        verdict = laws.validate_lazy({})
+        assert verdict.status == "INVALID"
+        assert verdict.evaluated < 12
+        assert verdict.summary["violated"] == laws.validate_all({})["summary"]["violated"]
+    
+    def test_reorders_by_violation_rate(self):
+        """Test frequently violated laws move to the front."""
+        laws = UniversalLaws()
+        pattern = {"name": "a", "closed": True, "sovereignty": True, "stable": True, 
+                   "stability_score": 0.9, "embedding_ratio": 1.618, "converges": True, 
+                   "convergence_point": "x", "structure": {"triad": 1}}
+        for _ in range(laws.LAZY_REORDER_INTERVAL):
+            laws.validate_lazy(pattern)
+        
+        # Only apex and operator composition are violated by this pattern
+        first_two = {LAW_NAMES[i] for i in laws._lazy_order[:2]}
+        assert first_two == {"Apex Fixed-Point Proof", "Operator Composition"}
+        assert laws.law_statistics()["Apex Fixed-Point Proof"]["violation_rate"] == 1.0
+    
+    def test_engine_lazy_gate(self):
+        """Test the engine's lazy mode drives the integration gate."""
+        from code.integration.engine import IntegrationEngine
+        engine = IntegrationEngine(enable_telemetry=False, lazy_validation=True)
+        result = engine.full_integration_cycle([{"name": "bad"}])
+        assert result["status"] == "VALIDATION_FAILED"
+        assert result["validations"][0]["validation"]["status"] == "INVALID"
+        assert engine.get_status()["features"]["lazy_validation"]
+    
+    def test_engine_validate_short_circuits(self, monkeypatch):
+        """Test engine.validate evaluates fewer than 12 laws when lazy."""
+        from code.integration.engine import IntegrationEngine
+        engine = IntegrationEngine(enable_telemetry=False, lazy_validation=True)
+        calls = []
+        
+        def counting(coder):
+            def wrapper(laws, pattern):
+                calls.append(coder)
+                return coder(laws, pattern)
+            return wrapper
+        
+        monkeypatch.setattr(
+            UniversalLaws, "_LAW_CODERS", tuple(counting(c) for c in UniversalLaws._LAW_CODERS)
+        )
+        result = engine.validate({"name": "bad"})
+        assert result["status"] == "INVALID"
+        assert len(calls) < 12
+        assert "message" not in result
+        assert result["validation"].message == engine.universal_laws.validate_all({"name": "bad"})["message"]
+
+
+class TestMemoizedLaws:
+    """Test per-law memoization keyed by LAW_FIELDS projections."""
+    
+    def test_results_identical(self):
+        """Test memoized validation equals plain validation."""
+        plain = UniversalLaws()
+        memo = UniversalLaws(memoize=True)
+        patterns = random_patterns(500, seed=5)
+        for pattern in patterns + patterns:
+            assert memo.validate_all(pattern) == plain.validate_all(pattern)
+        assert memo.memo_stats()["hits"] > 0
+    
+    def test_variants_hit_untouched_laws(self):
+        """Test changing one field only recomputes the laws reading it."""
+        laws = UniversalLaws(memoize=True)
+        base = {"name": "a", "coherence": 0.9, "stability_score": 0.7, "stable": True}
+        laws.validate_all(base)
+        misses = laws.memo_stats()["misses"]
+        
+        result = laws.validate_all({**base, "coherence": 0.5})
+        assert laws.memo_stats()["misses"] == misses + 1
+        assert result["law_results"][7]["message"] == "✗ Coherence 50.00% critically low"
+    
+    def test_type_sensitive_keys(self):
+        """Test equal values of different types are not conflated."""
+        laws = UniversalLaws(memoize=True)
+        laws.validate_all({"recursion_depth": 1})
+        result = laws.validate_all({"recursion_depth": 1.0})
+        assert result["law_results"][1]["message"] == "✓ Recursion depth 1.0 ≤ 7"
+    
+    def test_bounded(self):
+        """Test the memo evicts beyond memo_size."""
+        laws = UniversalLaws(memoize=True, memo_size=20)
+        for i in range(50):
+            laws.validate_all({"name": str(i), "coherence": i / 50})
+        assert laws.memo_stats()["size"] <= 20
+    
+    def test_cached_details_not_shared(self):
+        """Test mutating a returned result does not corrupt the memo."""
+        laws = UniversalLaws(memoize=True)
+        first = laws.validate_all({"operators": ["a"]})
+        first["law_results"][8]["details"]["operator_count"] = 99
+        second = laws.validate_all({"operators": ["a"]})
+        assert second["law_results"][8]["details"]["operator_count"] == 1
@@ -0,0 +1,105 @@
+"""
+Unit Tests for Integration Validator
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from code.integration import validator as validator_module
+from code.integration.validator import IntegrationValidator
+from code.integration.engine import IntegrationEngine, IntegrationPattern
+
+
+MARKER_KEYS = [
+    "triad", "pillar", "phoenix", "Phoenix", "hydrogenesi", "Hydrogenesi", 
+    "the third", "The Third", "closed", "triadic_closure", "waltz_complete", 
+    "sovereignty", "sovereignty_confirmed", "stable", "apex", "integrated",
+]
+MARKER_VALUES = [
+    True, False, 0, 1, None, "x", "Phoenix", "The Third", [], ["a", "b", "c"], ("a",), 
+    {}, {"Phoenix": 1}, {"Phoenix": 1, "Hydrogenesi": 2, "The Third": 3},
+]
+
+
+def random_markers(count, seed=3):
+    """Patterns with random subsets of every marker the validator reads."""
+    rnd = random.Random(seed)
+    patterns = []
+    for _ in range(count):
+        pattern = {
+            key: rnd.choice(MARKER_VALUES) for key in MARKER_KEYS 
+            if rnd.random() < 0.4
+        }
+        if isinstance(pattern.get("pillar"), (list, dict)):
+            del pattern["pillar"]
+        patterns.append(pattern)
+    return patterns
+
+
+def _waltz_pattern():
+    engine = IntegrationEngine(enable_telemetry=False)
+    pattern = IntegrationPattern(
+        name="p",
+        pillar="Phoenix",
+        mode="BEGIN",
+        structure={"triad": ("fear", "service", "courage")},
+        apex="apex::warrior",
+        operators=["FirstBinding", "IM_ME", "PhoenixIgnition"],
+        convergence_point="apex::warrior"
+    )
+    return engine.integrate([pattern, pattern, pattern])["pattern"]
+
+
+class TestGenerateReport:
+    """Test the single-scan report against the individual validations."""
+    
+    def test_report_matches_validations(self):
+        """Test report sections equal the standalone validation results."""
+        validator = IntegrationValidator()
+        for pattern in random_markers(500) + [_waltz_pattern()]:
+            report = validator.generate_report(pattern)
+            assert report.pillar_validation == validator.validate_pillar_structure(pattern)
+            assert report.triadic_validation == validator.validate_triadic_closure(pattern)
+            assert report.sovereignty_validation == validator.validate_sovereignty(pattern)
+    
+    def test_waltz_pattern_is_sovereign(self):
+        """Test a completed waltz pattern scores as sovereign."""
+        report = IntegrationValidator().generate_report(_waltz_pattern())
+        assert report.triadic_validation["valid"]
+        assert report.sovereignty_validation["valid"]
+    
+    def test_nested_pillar_aliases(self):
+        """Test lowercase nested pillar references count as present."""
+        result = IntegrationValidator().validate_pillar_structure({
+            "phoenix": {"mode": "BEGIN"}, 
+            "Hydrogenesi": {"mode": "EXTEND"}, 
+            "the third": {"mode": "HOLD"},
+        })
+        assert result["valid"]
+        assert result["pillar_details"]["Phoenix"] == {"mode": "BEGIN"}
+
+
+class TestQuickCheck:
+    """Test quick_check against generate_report."""
+    
+    def test_matches_report(self):
+        """Test status, message and score equal the full report's."""
+        validator = IntegrationValidator()
+        for pattern in random_markers(500) + [_waltz_pattern()]:
+            report = validator.generate_report(pattern)
+            assert validator.quick_check(pattern) == {
+                "status": report.status, 
+                "message": report.message, 
+                "score": report.overall_score
+            }
+    
+    def test_skips_report_construction(self, monkeypatch):
+        """Test quick_check never builds a ValidationReport."""
+        def fail(*args, **kwargs):
+            raise AssertionError("ValidationReport constructed")
+        monkeypatch.setattr(validator_module, "ValidationReport", fail)
+        
+        result = IntegrationValidator().quick_check(_waltz_pattern())
+        assert result["status"] in ("SOVEREIGN", "STABLE", "EMERGING", "UNSTABLE")
@@ -8,9 +8,19 @@ The Twelve Laws govern pattern formation across all three pillars:
 """
 
 from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Dict, Hashable, Iterator, List, Any, Optional, Sequence, Tuple
+import copy
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 
 class LawStatus(Enum):
@@ -29,6 +39,461 @@ class LawCheckResult:
     details: Dict[str, Any]
 
 
+# Compact per-law status codes used by the bulk validator
+SATISFIED_CODE = 0
+PARTIAL_CODE = 1
+VIOLATED_CODE = 2
+CODE_STATUSES = (LawStatus.SATISFIED, LawStatus.PARTIAL, LawStatus.VIOLATED)
+
+# Overall pattern statuses, indexed by overall status code
+OVERALL_STATUSES = ("SOVEREIGN", "STABLE", "UNSTABLE", "INVALID")
+
+# Law names in evaluation (column) order
+LAW_NAMES = (
+    "Universal Triad Law",
+    "Recursion Depth Law",
+    "Self-Similarity Threshold",
+    "Convergence Envelope",
+    "Apex Fixed-Point Proof",
+    "Recursive Stability Band",
+    "Sigil Embedding Ratio",
+    "Cross-Pillar Coherence",
+    "Operator Composition",
+    "Threshold Mechanics",
+    "Invariant Preservation",
+    "Triadic Closure",
+)
+
+
+# Pattern fields each law reads (LAW_NAMES order); memoized results are
+# keyed by a projection of just these fields
+LAW_FIELDS = (
+    ("structure",),
+    ("recursion_depth",),
+    ("similarity_ratio",),
+    ("converges", "convergence_point"),
+    ("apex",),
+    ("stable", "stability_score"),
+    ("embedding_ratio",),
+    ("coherence",),
+    ("operators",),
+    ("threshold", "threshold_managed"),
+    ("invariant", "invariant_preserved", "identity", "name"),
+    ("closed", "sovereignty"),
+)
+
+# Field name -> indices of the laws that read it
+_FIELD_LAWS: Dict[str, Tuple[int, ...]] = {}
+for _index, _fields in enumerate(LAW_FIELDS):
+    for _name in _fields:
+        _FIELD_LAWS[_name] = _FIELD_LAWS.get(_name, ()) + (_index,)
+del _index, _fields, _name
+
+
+def laws_reading(fields: Sequence[str]) -> List[int]:
+    """
+    Indices of the laws that read any of the given pattern fields.
+    
+    Args:
+        fields: Pattern field names
+        
+    Returns:
+        Sorted law indices (LAW_NAMES order)
+    """
+    indices = set()
+    for name in fields:
+        indices.update(_FIELD_LAWS.get(name, ()))
+    return sorted(indices)
+
+
+_MISSING = object()
+_SCALAR_TYPES = frozenset((str, int, bool, type(None)))
+_IMMUTABLE_TYPES = _SCALAR_TYPES | {float}
+
+
+def _memo_value(value: Any) -> Hashable:
+    """
+    Hashable, type-exact stand-in for a field value in a memo key.
+    
+    Types are part of the key (``1``, ``1.0`` and ``True`` compare equal
+    but format differently in law messages), floats key on their exact bit
+    pattern, and dicts/lists/sets are converted recursively.
+    
+    Raises:
+        TypeError: For values that cannot be keyed (law is not memoized)
+    """
+    cls = type(value)
+    if cls is float:
+        return (cls, value.hex())
+    if cls in _SCALAR_TYPES or value is _MISSING:
+        return (cls, value)
+    if isinstance(value, Mapping):
+        return (cls, frozenset((k, _memo_value(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (cls, tuple(_memo_value(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (cls, frozenset(_memo_value(v) for v in value))
+    hash(value)
+    return (cls, value)
+
+
+def overall_code(violated: int, partial: int) -> int:
+    """
+    Overall status code for the given violated/partial law counts.
+    
+    Args:
+        violated: Number of violated laws
+        partial: Number of partially satisfied laws
+        
+    Returns:
+        Index into OVERALL_STATUSES
+    """
+    if violated == 0:
+        return 0 if partial == 0 else 1
+    return 2 if violated <= 2 else 3
+
+
+def status_message(satisfied: int, partial: int, violated: int) -> Tuple[str, str]:
+    """
+    Overall status and message for the given law counts.
+    
+    Args:
+        satisfied: Number of satisfied laws
+        partial: Number of partially satisfied laws
+        violated: Number of violated laws
+        
+    Returns:
+        (status, message) as reported by ``validate_all``
+    """
+    status = OVERALL_STATUSES[overall_code(violated, partial)]
+    if status == "SOVEREIGN":
+        message = "✓ All 12 Universal Laws satisfied - Pattern is SOVEREIGN"
+    elif status == "STABLE":
+        message = f"⚠ {satisfied} laws satisfied, {partial} partial - Pattern is STABLE"
+    elif status == "UNSTABLE":
+        message = f"⚠ {violated} laws violated - Pattern is UNSTABLE"
+    else:
+        message = f"✗ {violated} laws violated - Pattern is INVALID"
+    return status, message
+
+
+@dataclass
+class BulkValidation:
+    """
+    Compact result of ``UniversalLaws.validate_many``.
+    
+    ``codes`` is an N x 12 matrix of law status codes (0 satisfied,
+    1 partial, 2 violated; columns follow LAW_NAMES) and ``overall`` holds
+    one OVERALL_STATUSES index per pattern. Both are NumPy int8 arrays when
+    NumPy is installed, otherwise flat ``array('b')`` buffers. Messages and
+    details are only built on request via ``details()``.
+    """
+    codes: Any
+    overall: Any
+    patterns: Sequence[Any]
+    laws: UniversalLaws
+    
+    def __len__(self) -> int:
+        return len(self.overall)
+    
+    def law_codes(self, index: int) -> Tuple[int, ...]:
+        """
+        Law status codes for one pattern.
+        
+        Args:
+            index: Pattern index
+            
+        Returns:
+            Tuple of 12 status codes
+        """
+        if np is not None and isinstance(self.codes, np.ndarray):
+            return tuple(int(code) for code in self.codes[index])
+        start = index * len(LAW_NAMES)
+        return tuple(self.codes[start:start + len(LAW_NAMES)])
+    
+    def law_statuses(self, index: int) -> List[LawStatus]:
+        """
+        Law statuses for one pattern.
+        
+        Args:
+            index: Pattern index
+            
+        Returns:
+            List of 12 LawStatus values
+        """
+        return [CODE_STATUSES[code] for code in self.law_codes(index)]
+    
+    def status(self, index: int) -> str:
+        """
+        Overall status of one pattern (as ``validate_all`` would report).
+        
+        Args:
+            index: Pattern index
+            
+        Returns:
+            "SOVEREIGN", "STABLE", "UNSTABLE" or "INVALID"
+        """
+        return OVERALL_STATUSES[self.overall[index]]
+    
+    def statuses(self) -> List[str]:
+        """Overall status of every pattern."""
+        return [OVERALL_STATUSES[code] for code in self.overall]
+    
+    def status_counts(self) -> Dict[str, int]:
+        """
+        Number of patterns per overall status.
+        
+        Returns:
+            Dict mapping each status in OVERALL_STATUSES to a count
+        """
+        if np is not None and isinstance(self.overall, np.ndarray):
+            counts = np.bincount(self.overall, minlength=len(OVERALL_STATUSES))
+        else:
+            counts = [0] * len(OVERALL_STATUSES)
+            for code in self.overall:
+                counts[code] += 1
+        return {status: int(count) for status, count in zip(OVERALL_STATUSES, counts)}
+    
+    def violation_counts(self) -> Dict[str, int]:
+        """
+        Number of patterns violating each law.
+        
+        Returns:
+            Dict mapping law name to violation count
+        """
+        if np is not None and isinstance(self.codes, np.ndarray):
+            counts = (self.codes == VIOLATED_CODE).sum(axis=0)
+        else:
+            width = len(LAW_NAMES)
+            counts = [0] * width
+            for offset, code in enumerate(self.codes):
+                if code == VIOLATED_CODE:
+                    counts[offset % width] += 1
+        return {name: int(count) for name, count in zip(LAW_NAMES, counts)}
+    
+    def details(self, index: int) -> Dict[str, Any]:
+        """
+        Full ``validate_all`` result (messages and details) for one pattern.
+        
+        Args:
+            index: Pattern index
+            
+        Returns:
+            Validation results with status and law check details
+        """
+        return self.laws.validate_all(self.patterns[index])
+
+
+class LawVerdict(Mapping):
+    """
+    Lazily evaluated ``validate_all`` result (see ``validate_lazy``).
+    
+    The overall ``status`` is decided with as few law evaluations as
+    possible. The other keys are computed on first access and give exactly
+    what ``validate_all`` returns: ``message`` and ``summary`` finish the
+    remaining laws as bare status codes, and ``law_results`` runs the full
+    checks (messages and details) once.
+    """
+    
+    _KEYS = ("status", "message", "summary", "law_results")
+    
+    def __init__(
+        self, 
+        laws: UniversalLaws, 
+        pattern: Dict[str, Any], 
+        codes: List[Optional[int]], 
+        status: str
+    ):
+        self.laws = laws
+        self.pattern = pattern
+        self._codes = codes
+        self.status = status
+        self.evaluated = sum(1 for code in codes if code is not None)
+        self._details: Optional[Dict[str, Any]] = None
+    
+    def law_codes(self) -> Tuple[int, ...]:
+        """
+        Status codes for all 12 laws (evaluating any that were skipped).
+        
+        Returns:
+            Tuple of 12 codes (0 satisfied, 1 partial, 2 violated)
+        """
+        coders = self.laws._LAW_CODERS
+        for index, code in enumerate(self._codes):
+            if code is None:
+                self._codes[index] = coders[index](self.laws, self.pattern)
+        return tuple(self._codes)
+    
+    @property
+    def summary(self) -> Dict[str, int]:
+        """Satisfied/partial/violated counts over all 12 laws."""
+        codes = self.law_codes()
+        return {
+            "satisfied": codes.count(SATISFIED_CODE),
+            "partial": codes.count(PARTIAL_CODE),
+            "violated": codes.count(VIOLATED_CODE),
+            "total": 12
+        }
+    
+    @property
+    def message(self) -> str:
+        """Overall message, identical to ``validate_all``."""
+        summary = self.summary
+        return status_message(summary["satisfied"], summary["partial"], summary["violated"])[1]
+    
+    def details(self) -> Dict[str, Any]:
+        """
+        Full ``validate_all`` result (computed once).
+        
+        Returns:
+            Validation results with status and law check details
+        """
+        if self._details is None:
+            self._details = self.laws.validate_all(self.pattern)
+        return self._details
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == "status":
+            return self.status
+        if key == "message":
+            return self.message
+        if key == "summary":
+            return self.summary
+        if key == "law_results":
+            return self.details()["law_results"]
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
+    
+    def __repr__(self) -> str:
+        return f"LawVerdict(status={self.status}, evaluated={self.evaluated}/12)"
+
+
+class IncrementalValidation:
+    """
+    Per-law results of one pattern, kept current field by field.
+    
+    Holds the pattern's field values, each law's result and the summary
+    counts. ``update`` applies changed field values and re-runs only the
+    laws that read them (see LAW_FIELDS), adjusting the counts in place;
+    ``report`` then assembles a fresh ``validate_all``-identical result.
+    
+    Container values (dicts, lists, ...) are snapshotted, so in-place
+    mutations are picked up by ``mutated_fields`` even though they never
+    go through attribute assignment.
+    """
+    
+    def __init__(self, laws: UniversalLaws, pattern: Mapping):
+        """
+        Initialize incremental validation with a full evaluation.
+        
+        Args:
+            laws: UniversalLaws instance that runs the checks
+            pattern: Pattern field values
+        """
+        self.laws = laws
+        self.lock = threading.Lock()
+        self.values: Dict[str, Any] = dict(pattern)
+        self._snapshots = {
+            name: copy.deepcopy(value) for name, value in self.values.items()
+            if type(value) not in _IMMUTABLE_TYPES
+        }
+        self.results: List[LawCheckResult] = [
+            getattr(laws, check)(self.values) for check in laws._LAW_CHECKS
+        ]
+        self.entries = [self._entry(result) for result in self.results]
+        self.counts = {"satisfied": 0, "partial": 0, "violated": 0}
+        for result in self.results:
+            self.counts[result.status.value] += 1
+        self.recomputed = len(self.results)
+    
+    @staticmethod
+    def _entry(result: LawCheckResult) -> Dict[str, Any]:
+        """``law_results`` entry for one check result."""
+        return {
+            "law": result.law_name,
+            "status": result.status.value,
+            "message": result.message,
+            "details": result.details
+        }
+    
+    def mutated_fields(self) -> List[str]:
+        """
+        Container fields whose value was changed in place since last seen.
+        
+        Returns:
+            Field names
+        """
+        values = self.values
+        return [
+            name for name, snapshot in self._snapshots.items()
+            if values[name] != snapshot
+        ]
+    
+    def update(self, changes: Mapping) -> int:
+        """
+        Apply changed field values and re-run the laws that read them.
+        
+        Args:
+            changes: Field name -> current value
+            
+        Returns:
+            Number of laws re-run
+        """
+        values = self.values
+        snapshots = self._snapshots
+        for name, value in changes.items():
+            values[name] = value
+            if type(value) in _IMMUTABLE_TYPES:
+                snapshots.pop(name, None)
+            else:
+                snapshots[name] = copy.deepcopy(value)
+        
+        indices = laws_reading(changes)
+        laws, counts, entries = self.laws, self.counts, self.entries
+        for index in indices:
+            result = getattr(laws, laws._LAW_CHECKS[index])(values)
+            entry = self._entry(result)
+            counts[entries[index]["status"]] -= 1
+            counts[entry["status"]] += 1
+            self.results[index] = result
+            entries[index] = entry
+        
+        self.recomputed = len(indices)
+        return self.recomputed
+    
+    def report(self) -> Dict[str, Any]:
+        """
+        Current ``validate_all`` result.
+        
+        The report, its summary and its ``law_results`` list are new on
+        every call; the per-law entries of laws that were not re-run are
+        shared with earlier reports, so treat them as read-only.
+        
+        Returns:
+            Validation results with status and law check details
+        """
+        counts = self.counts
+        status, message = status_message(
+            counts["satisfied"], counts["partial"], counts["violated"]
+        )
+        return {
+            "status": status,
+            "message": message,
+            "summary": {
+                "satisfied": counts["satisfied"],
+                "partial": counts["partial"],
+                "violated": counts["violated"],
+                "total": 12
+            },
+            "law_results": list(self.entries)
+        }
+
+
 class UniversalLaws:
     """
     The Twelve Universal Laws for Integration Validation.
@@ -60,6 +525,51 @@ class UniversalLaws:
     COHERENCE_THRESHOLD = 0.80
     MIN_OPERATORS = 3
     
+    # Relative evaluation cost of each law's predicate (LAW_NAMES order),
+    # used with observed violation rates to order lazy evaluation
+    LAW_COSTS = (3, 1, 1, 2, 1, 2, 1, 1, 1, 2, 2, 2)
+    
+    # Lazy evaluation re-sorts the law order every this many verdicts
+    LAZY_REORDER_INTERVAL = 256
+    
+    # check_* method per law (LAW_NAMES order)
+    _LAW_CHECKS = (
+        "check_universal_triad",
+        "check_recursion_depth",
+        "check_self_similarity",
+        "check_convergence_envelope",
+        "check_apex_fixed_point",
+        "check_recursive_stability",
+        "check_sigil_embedding",
+        "check_cross_pillar_coherence",
+        "check_operator_composition",
+        "check_threshold_mechanics",
+        "check_invariant_preservation",
+        "check_triadic_closure",
+    )
+    
+    def __init__(self, memoize: bool = False, memo_size: int = 4096):
+        """
+        Initialize the law set.
+        
+        Args:
+            memoize: Cache each law's result keyed by the pattern fields it
+                     reads (LAW_FIELDS), so variants that differ only in
+                     other fields reuse it
+            memo_size: Maximum memoized law results (LRU eviction)
+        """
+        self.memo_size = memo_size
+        self._memo: Optional[OrderedDict] = OrderedDict() if memoize else None
+        self._memo_lock = threading.Lock()
+        self._memo_hits = 0
+        self._memo_misses = 0
+        
+        # Law statistics used by lazy evaluation
+        self._law_evaluations = [0] * len(LAW_NAMES)
+        self._law_violations = [0] * len(LAW_NAMES)
+        self._lazy_order = list(range(len(LAW_NAMES)))
+        self._lazy_verdicts = 0
+    
     # ============================================================================
     # SUBSTRATE LAWS (4)
     # ============================================================================
@@ -526,6 +1036,9 @@ class UniversalLaws:
         Returns:
             Validation results with status and law check details
         """
+        if self._memo is not None:
+            return self._validate_memoized(pattern)
+        
         # Execute all law checks
         results = [
             # Substrate Laws
@@ -545,24 +1058,30 @@ class UniversalLaws:
             self.check_triadic_closure(pattern),
         ]
         
+        return self._build_report(results)
+    
+    def _build_report(
+        self, 
+        results: List[LawCheckResult], 
+        copy_details: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Summarize 12 law check results into the ``validate_all`` report.
+        
+        Args:
+            results: Check results in LAW_NAMES order
+            copy_details: Give each law result its own top-level details dict
+            
+        Returns:
+            Validation results with status and law check details
+        """
         # Count status types
         satisfied = sum(1 for r in results if r.status == LawStatus.SATISFIED)
         violated = sum(1 for r in results if r.status == LawStatus.VIOLATED)
         partial = sum(1 for r in results if r.status == LawStatus.PARTIAL)
         
         # Determine overall status
-        if violated == 0 and partial == 0:
-            status = "SOVEREIGN"
-            message = "✓ All 12 Universal Laws satisfied - Pattern is SOVEREIGN"
-        elif violated == 0:
-            status = "STABLE"
-            message = f"⚠ {satisfied} laws satisfied, {partial} partial - Pattern is STABLE"
-        elif violated <= 2:
-            status = "UNSTABLE"
-            message = f"⚠ {violated} laws violated - Pattern is UNSTABLE"
-        else:
-            status = "INVALID"
-            message = f"✗ {violated} laws violated - Pattern is INVALID"
+        status, message = status_message(satisfied, partial, violated)
         
         return {
             "status": status,
@@ -578,8 +1097,491 @@ class UniversalLaws:
                     "law": r.law_name,
                     "status": r.status.value,
                     "message": r.message,
-                    "details": r.details
+                    "details": dict(r.details) if copy_details else r.details
                 }
                 for r in results
             ]
         }
+    
+    # ============================================================================
+    # MEMOIZATION
+    # ============================================================================
+    
+    def _validate_memoized(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ``validate_all`` through the per-law memo.
+        
+        Each law is keyed by the projection of the pattern onto its
+        LAW_FIELDS; hits reuse the stored LawCheckResult and misses run the
+        check and store a snapshot (details deep-copied). Laws whose fields
+        cannot be keyed are simply recomputed.
+        
+        Args:
+            pattern: Pattern to validate
+            
+        Returns:
+            Validation results with status and law check details
+        """
+        keys = []
+        get = pattern.get
+        for index, fields in enumerate(LAW_FIELDS):
+            values = tuple([get(name, _MISSING) for name in fields])
+            try:
+                if 0.0 in values:
+                    # 0 / 0.0 / -0.0 / False compare equal; key them exactly
+                    raise TypeError
+                key = (index, values, tuple(map(type, values)))
+                hash(key)
+            except TypeError:
+                try:
+                    key = (index, tuple([_memo_value(value) for value in values]))
+                except TypeError:
+                    key = None
+            keys.append(key)
+        
+        memo = self._memo
+        with self._memo_lock:
+            results = []
+            for key in keys:
+                cached = memo.get(key) if key is not None else None
+                if cached is not None:
+                    memo.move_to_end(key)
+                results.append(cached)
+        
+        hits = len(keys) - results.count(None)
+        fresh = []
+        for index, cached in enumerate(results):
+            if cached is None:
+                result = getattr(self, self._LAW_CHECKS[index])(pattern)
+                results[index] = result
+                if keys[index] is not None:
+                    fresh.append((keys[index], LawCheckResult(
+                        result.law_name, result.status, result.message, 
+                        copy.deepcopy(result.details)
+                    )))
+        
+        with self._memo_lock:
+            self._memo_misses += len(keys) - hits
+            self._memo_hits += hits
+            for key, snapshot in fresh:
+                memo[key] = snapshot
+            while len(memo) > self.memo_size:
+                memo.popitem(last=False)
+        
+        # Details of memoized results are shared: hand out top-level copies
+        return self._build_report(results, copy_details=True)
+    
+    def memo_stats(self) -> Dict[str, Any]:
+        """
+        Law memo statistics.
+        
+        Returns:
+            Dictionary with size, hits, misses and hit rate (empty when
+            memoization is disabled)
+        """
+        if self._memo is None:
+            return {}
+        with self._memo_lock:
+            total = self._memo_hits + self._memo_misses
+            return {
+                "size": len(self._memo),
+                "max_size": self.memo_size,
+                "hits": self._memo_hits,
+                "misses": self._memo_misses,
+                "hit_rate": self._memo_hits / total if total else 0.0
+            }
+    
+    def clear_memo(self):
+        """Drop all memoized law results."""
+        if self._memo is None:
+            return
+        with self._memo_lock:
+            self._memo.clear()
+            self._memo_hits = 0
+            self._memo_misses = 0
+    
+    # ============================================================================
+    # COMPILED / BULK VALIDATION
+    # ============================================================================
+    #
+    # The _code_* predicates mirror the check_* methods above but return a
+    # bare status code (no LawCheckResult, message or details). Keep the
+    # two in sync; validate_many is tested against validate_all.
+    
+    def _code_universal_triad(self, pattern: Dict[str, Any]) -> int:
+        structure = pattern.get("structure", {})
+        if "triad" in structure:
+            return SATISFIED_CODE
+        if len(structure.get("elements", [])) >= 3:
+            if "tension_pair" in structure and "stabilizer" in structure:
+                return SATISFIED_CODE
+            return PARTIAL_CODE
+        return VIOLATED_CODE
+    
+    def _code_recursion_depth(self, pattern: Dict[str, Any]) -> int:
+        if pattern.get("recursion_depth", 0) <= self.MAX_RECURSION_DEPTH:
+            return SATISFIED_CODE
+        return VIOLATED_CODE
+    
+    def _code_self_similarity(self, pattern: Dict[str, Any]) -> int:
+        ratio = pattern.get("similarity_ratio", 1.0)
+        if self.GOLDEN_RATIO_LOWER <= ratio <= self.GOLDEN_RATIO_UPPER:
+            return SATISFIED_CODE
+        return VIOLATED_CODE
+    
+    def _code_convergence_envelope(self, pattern: Dict[str, Any]) -> int:
+        if not pattern.get("converges", False):
+            return VIOLATED_CODE
+        if pattern.get("convergence_point") is not None:
+            return SATISFIED_CODE
+        return PARTIAL_CODE
+    
+    def _code_apex_fixed_point(self, pattern: Dict[str, Any]) -> int:
+        if pattern.get("apex") is not None:
+            return SATISFIED_CODE
+        return VIOLATED_CODE
+    
+    def _code_recursive_stability(self, pattern: Dict[str, Any]) -> int:
+        if not pattern.get("stable", False):
+            return VIOLATED_CODE
+        if pattern.get("stability_score", 0.0) >= 0.5:
+            return SATISFIED_CODE
+        return PARTIAL_CODE
+    
+    def _code_sigil_embedding(self, pattern: Dict[str, Any]) -> int:
+        if abs(pattern.get("embedding_ratio", 1.0) - self.GOLDEN_RATIO) <= 0.1:
+            return SATISFIED_CODE
+        return VIOLATED_CODE
+    
+    def _code_cross_pillar_coherence(self, pattern: Dict[str, Any]) -> int:
+        coherence = pattern.get("coherence", 1.0)
+        if coherence >= self.COHERENCE_THRESHOLD:
+            return SATISFIED_CODE
+        if coherence >= self.COHERENCE_THRESHOLD * 0.7:
+            return PARTIAL_CODE
+        return VIOLATED_CODE
+    
+    def _code_operator_composition(self, pattern: Dict[str, Any]) -> int:
+        if len(pattern.get("operators", [])) >= self.MIN_OPERATORS:
+            return SATISFIED_CODE
+        return VIOLATED_CODE
+    
+    def _code_threshold_mechanics(self, pattern: Dict[str, Any]) -> int:
+        if "threshold" in pattern and not pattern.get("threshold_managed", False):
+            return PARTIAL_CODE
+        return SATISFIED_CODE
+    
+    def _code_invariant_preservation(self, pattern: Dict[str, Any]) -> int:
+        if "invariant" in pattern:
+            if pattern.get("invariant_preserved", False):
+                return SATISFIED_CODE
+            return VIOLATED_CODE
+        if "identity" in pattern or "name" in pattern:
+            return SATISFIED_CODE
+        return PARTIAL_CODE
+    
+    def _code_triadic_closure(self, pattern: Dict[str, Any]) -> int:
+        if not pattern.get("closed", False):
+            return VIOLATED_CODE
+        if pattern.get("sovereignty", False):
+            return SATISFIED_CODE
+        return PARTIAL_CODE
+    
+    _LAW_CODERS = (
+        _code_universal_triad,
+        _code_recursion_depth,
+        _code_self_similarity,
+        _code_convergence_envelope,
+        _code_apex_fixed_point,
+        _code_recursive_stability,
+        _code_sigil_embedding,
+        _code_cross_pillar_coherence,
+        _code_operator_composition,
+        _code_threshold_mechanics,
+        _code_invariant_preservation,
+        _code_triadic_closure,
+    )
+    
+    def law_codes(self, pattern: Dict[str, Any]) -> Tuple[int, ...]:
+        """
+        Evaluate all 12 laws as bare status codes.
+        
+        Args:
+            pattern: Pattern to validate
+            
+        Returns:
+            Tuple of 12 codes (0 satisfied, 1 partial, 2 violated)
+        """
+        return tuple(coder(self, pattern) for coder in self._LAW_CODERS)
+    
+    def validate_many(
+        self, 
+        patterns: Sequence[Any], 
+        backend: Optional[str] = None
+    ) -> BulkValidation:
+        """
+        Validate many patterns at once, returning a compact status matrix.
+        
+        Fields are pulled into columns and all 12 laws are evaluated as
+        vectorized predicates (NumPy) or compiled per-pattern predicates
+        (pure Python). No messages or details are built; use
+        ``BulkValidation.details(i)`` for the full result of one pattern.
+        
+        Args:
+            patterns: Pattern dicts, pattern objects, or a PatternBatch
+                      (validated from its columns without building rows)
+            backend: "numpy" or "python" (default: NumPy when installed)
+            
+        Returns:
+            BulkValidation with per-law codes and overall statuses
+        """
+        if backend is None:
+            backend = "numpy" if np is not None else "python"
+        if backend not in ("numpy", "python"):
+            raise ValueError(f"Unknown backend {backend!r} (expected 'numpy' or 'python')")
+        if backend == "numpy" and np is None:
+            raise ImportError("NumPy is required for the 'numpy' backend")
+        
+        if backend == "numpy" and hasattr(patterns, "column"):
+            result = self._codes_from_columns(self._batch_columns(patterns))
+            if result is not None:
+                return BulkValidation(result[0], result[1], patterns, self)
+        
+        # Pattern objects with mapping access (IntegrationPattern) are read as-is
+        rows = [
+            p if isinstance(p, Mapping) or hasattr(p, "get") else p.to_dict() 
+            for p in patterns
+        ]
+        
+        if backend == "numpy":
+            result = self._validate_many_numpy(rows)
+            if result is not None:
+                return BulkValidation(result[0], result[1], rows, self)
+        
+        return self._validate_many_python(rows)
+    
+    def _validate_many_python(self, rows: List[Dict[str, Any]]) -> BulkValidation:
+        """Bulk validation with compiled per-pattern predicates."""
+        coders = self._LAW_CODERS
+        codes = array("b")
+        overall = array("b")
+        for row in rows:
+            row_codes = [coder(self, row) for coder in coders]
+            codes.extend(row_codes)
+            overall.append(overall_code(
+                row_codes.count(VIOLATED_CODE), row_codes.count(PARTIAL_CODE)
+            ))
+        return BulkValidation(codes, overall, rows, self)
+    
+    def _validate_many_numpy(self, rows: List[Dict[str, Any]]) -> Optional[Tuple[Any, Any]]:
+        """
+        Bulk validation with vectorized predicates.
+        
+        Returns:
+            (codes, overall) arrays, or None when a numeric column holds
+            values NumPy cannot represent faithfully (the caller then uses
+            the pure-Python path, which behaves exactly like validate_all)
+        """
+        n = len(rows)
+        
+        def flags(values):
+            return np.fromiter(values, dtype=bool, count=n)
+        
+        try:
+            columns = {
+                "depth": np.array([r.get("recursion_depth", 0) for r in rows], dtype=float),
+                "ratio": np.array([r.get("similarity_ratio", 1.0) for r in rows], dtype=float),
+                "score": np.array([r.get("stability_score", 0.0) for r in rows], dtype=float),
+                "embedding": np.array([r.get("embedding_ratio", 1.0) for r in rows], dtype=float),
+                "coherence": np.array([r.get("coherence", 1.0) for r in rows], dtype=float),
+            }
+        except (TypeError, ValueError):
+            return None
+        
+        columns.update(
+            structures=[r.get("structure", {}) for r in rows],
+            converges=flags(bool(r.get("converges", False)) for r in rows),
+            has_point=flags(r.get("convergence_point") is not None for r in rows),
+            has_apex=flags(r.get("apex") is not None for r in rows),
+            stable=flags(bool(r.get("stable", False)) for r in rows),
+            operators=np.fromiter(
+                (len(r.get("operators", [])) for r in rows), dtype=np.int64, count=n
+            ),
+            has_threshold=flags("threshold" in r for r in rows),
+            managed=flags(bool(r.get("threshold_managed", False)) for r in rows),
+            has_invariant=flags("invariant" in r for r in rows),
+            preserved=flags(bool(r.get("invariant_preserved", False)) for r in rows),
+            has_identity=flags("identity" in r or "name" in r for r in rows),
+            closed=flags(bool(r.get("closed", False)) for r in rows),
+            sovereign=flags(bool(r.get("sovereignty", False)) for r in rows),
+        )
+        return self._codes_from_columns(columns)
+    
+    def _batch_columns(self, batch: Any) -> Dict[str, Any]:
+        """
+        Law input columns read straight from a PatternBatch.
+        
+        Every batch row carries all pattern fields, so the key-presence
+        inputs (threshold, invariant, identity) are constant.
+        """
+        n = len(batch)
+        present = np.ones(n, dtype=bool)
+        return {
+            "depth": batch.column("recursion_depth").astype(float),
+            "ratio": batch.column("similarity_ratio"),
+            "score": batch.column("stability_score"),
+            "embedding": batch.column("embedding_ratio"),
+            "coherence": batch.column("coherence"),
+            "structures": batch.column("structure"),
+            "converges": batch.column("converges"),
+            "has_point": ~batch.is_none("convergence_point"),
+            "has_apex": ~batch.is_none("apex"),
+            "stable": batch.column("stable"),
+            "operators": np.fromiter(
+                (len(ops) for ops in batch.column("operators")), dtype=np.int64, count=n
+            ),
+            "has_threshold": present,
+            "managed": batch.column("threshold_managed"),
+            "has_invariant": present,
+            "preserved": batch.column("invariant_preserved"),
+            "has_identity": present,
+            "closed": batch.column("closed"),
+            "sovereign": batch.column("sovereignty"),
+        }
+    
+    def _codes_from_columns(self, columns: Dict[str, Any]) -> Optional[Tuple[Any, Any]]:
+        """
+        Evaluate all 12 laws over column arrays.
+        
+        Args:
+            columns: Float arrays (depth, ratio, score, embedding,
+                     coherence), bool arrays, operator counts and the
+                     structure dicts, as built by ``_validate_many_numpy``
+                     
+        Returns:
+            (codes, overall) arrays, or None when a numeric column holds NaN
+        """
+        depth, ratio, score = columns["depth"], columns["ratio"], columns["score"]
+        embedding, coherence = columns["embedding"], columns["coherence"]
+        # None becomes NaN silently; let the exact path decide those rows
+        if any(np.isnan(column).any() for column in (depth, ratio, score, embedding, coherence)):
+            return None
+        
+        n = len(depth)
+        structures = columns["structures"]
+        triad = np.fromiter(("triad" in s for s in structures), dtype=bool, count=n)
+        three = np.fromiter(
+            (len(s.get("elements", [])) >= 3 for s in structures), dtype=bool, count=n
+        )
+        tension = np.fromiter(
+            ("tension_pair" in s and "stabilizer" in s for s in structures), dtype=bool, count=n
+        )
+        converges, stable, closed = columns["converges"], columns["stable"], columns["closed"]
+        
+        def tri(satisfied, partial):
+            # satisfied -> 0, else partial -> 1, else violated -> 2
+            return np.where(satisfied, SATISFIED_CODE, np.where(partial, PARTIAL_CODE, VIOLATED_CODE))
+        
+        codes = np.empty((n, len(LAW_NAMES)), dtype=np.int8)
+        codes[:, 0] = tri(triad | (three & tension), three)
+        codes[:, 1] = tri(depth <= self.MAX_RECURSION_DEPTH, False)
+        codes[:, 2] = tri(
+            (ratio >= self.GOLDEN_RATIO_LOWER) & (ratio <= self.GOLDEN_RATIO_UPPER), False
+        )
+        codes[:, 3] = tri(converges & columns["has_point"], converges)
+        codes[:, 4] = tri(columns["has_apex"], False)
+        codes[:, 5] = tri(stable & (score >= 0.5), stable)
+        codes[:, 6] = tri(np.abs(embedding - self.GOLDEN_RATIO) <= 0.1, False)
+        codes[:, 7] = tri(
+            coherence >= self.COHERENCE_THRESHOLD, 
+            coherence >= self.COHERENCE_THRESHOLD * 0.7
+        )
+        codes[:, 8] = tri(columns["operators"] >= self.MIN_OPERATORS, False)
+        codes[:, 9] = tri(~columns["has_threshold"] | columns["managed"], True)
+        codes[:, 10] = np.where(
+            columns["has_invariant"], 
+            np.where(columns["preserved"], SATISFIED_CODE, VIOLATED_CODE), 
+            np.where(columns["has_identity"], SATISFIED_CODE, PARTIAL_CODE)
+        )
+        codes[:, 11] = tri(closed & columns["sovereign"], closed)
+        
+        violated = (codes == VIOLATED_CODE).sum(axis=1)
+        partial = (codes == PARTIAL_CODE).sum(axis=1)
+        overall = np.select(
+            [(violated == 0) & (partial == 0), violated == 0, violated <= 2], 
+            [0, 1, 2], 
+            default=3
+        ).astype(np.int8)
+        return codes, overall
+    
+    # ============================================================================
+    # LAZY VALIDATION
+    # ============================================================================
+    
+    def validate_lazy(self, pattern: Dict[str, Any]) -> LawVerdict:
+        """
+        Decide a pattern's overall status with as few law checks as possible.
+        
+        Laws are evaluated as bare status codes, most likely violator per
+        unit cost first (from the violation rates observed so far), and
+        evaluation stops once 3 laws are violated, since the pattern is then
+        INVALID whatever the rest say. Any other status needs every law.
+        
+        Args:
+            pattern: Pattern to validate
+            
+        Returns:
+            LawVerdict; ``status`` is final, everything else is on demand
+        """
+        coders = self._LAW_CODERS
+        codes: List[Optional[int]] = [None] * len(coders)
+        violated = 0
+        evaluations = self._law_evaluations
+        violations = self._law_violations
+        
+        for index in self._lazy_order:
+            code = coders[index](self, pattern)
+            codes[index] = code
+            evaluations[index] += 1
+            if code == VIOLATED_CODE:
+                violations[index] += 1
+                violated += 1
+                if violated > 2:
+                    break
+        
+        if violated > 2:
+            status = "INVALID"
+        else:
+            status = OVERALL_STATUSES[overall_code(violated, codes.count(PARTIAL_CODE))]
+        
+        self._lazy_verdicts += 1
+        if self._lazy_verdicts % self.LAZY_REORDER_INTERVAL == 0:
+            self._reorder_lazy()
+        
+        return LawVerdict(self, pattern, codes, status)
+    
+    def _reorder_lazy(self):
+        """Sort laws by smoothed violation rate per unit cost, descending."""
+        def priority(index: int) -> float:
+            rate = (self._law_violations[index] + 1) / (self._law_evaluations[index] + 2)
+            return rate / self.LAW_COSTS[index]
+        
+        self._lazy_order = sorted(range(len(LAW_NAMES)), key=priority, reverse=True)
+    
+    def law_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-law evaluation statistics gathered by lazy validation.
+        
+        Returns:
+            Dict mapping law name to evaluations, violations and violation rate
+        """
+        return {
+            name: {
+                "evaluations": evaluations,
+                "violations": violations,
+                "violation_rate": violations / evaluations if evaluations else 0.0
+            }
+            for name, evaluations, violations in zip(
+                LAW_NAMES, self._law_evaluations, self._law_violations
+            )
+        }
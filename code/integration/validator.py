@@ -5,8 +5,11 @@ Validates three-pillar structure, triadic closure, and sovereignty status.
 """
 
 from __future__ import annotations
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional
+
+_MISSING = object()
 
 
 @dataclass
@@ -31,6 +34,22 @@ class ValidationReport:
         return f"ValidationReport(status={self.status}, score={self.overall_score:.2f})"
 
 
+class _Markers(NamedTuple):
+    """Pattern markers read by the validations (see ``_scan``)."""
+    pillars_present: List[str]
+    pillar_details: Optional[Dict[str, Any]]
+    missing_pillars: List[str]
+    closed: Any
+    triadic_closure: Any
+    waltz_complete: Any
+    triad_complete: bool
+    sovereignty: Any
+    sovereignty_confirmed: Any
+    stable: Any
+    has_apex: bool
+    integrated: Any
+
+
 class IntegrationValidator:
     """
     Integration Validator for Three-Pillar Architecture.
@@ -50,53 +69,139 @@ class IntegrationValidator:
         "The Third": "HOLD"
     }
     
-    def validate_pillar_structure(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
+    # (pillar, lowercase alias) pairs checked as nested pillar references
+    _PILLAR_KEYS = tuple((pillar, pillar.lower()) for pillar in REQUIRED_PILLARS)
+    
+    def _scan(self, pattern: Dict[str, Any], details: bool = True) -> _Markers:
         """
-        Validate three-pillar structure.
+        Gather every marker the three validations read, in one pass.
         
-        Checks that pattern engages all three pillars with correct modes.
+        Each key is looked up once (``get`` with a sentinel instead of an
+        ``in`` test followed by a read).
         
         Args:
-            pattern: Pattern to validate
+            pattern: Pattern to scan
+            details: Collect per-pillar details (only reports need them)
             
         Returns:
-            Validation result with pillar structure analysis
+            _Markers for the pattern
         """
-        # Check for pillar engagement
-        pillars_present = []
-        pillar_details = {}
+        get = pattern.get
+        pillars_present: List[str] = []
+        pillar_details: Optional[Dict[str, Any]] = {} if details else None
         
         # Analyze pattern structure for pillar markers
-        if "triad" in pattern:
-            triad = pattern["triad"]
-            if isinstance(triad, dict):
-                pillars_present = list(triad.keys())
-                pillar_details = triad
+        triad = get("triad", _MISSING)
+        triad_complete = False
+        # Exact-type check first: ABC isinstance checks are comparatively slow
+        if type(triad) is dict or isinstance(triad, Mapping):
+            pillars_present = list(triad.keys())
+            if details:
+                pillar_details = dict(triad)
+            triad_complete = len(triad) >= 3
+        elif isinstance(triad, (list, tuple)):
+            triad_complete = len(triad) >= 3
         
         # Check for pillar field
-        if "pillar" in pattern:
-            single_pillar = pattern["pillar"]
-            if single_pillar not in pillars_present:
-                pillars_present.append(single_pillar)
+        single_pillar = get("pillar", _MISSING)
+        if single_pillar is not _MISSING and single_pillar not in pillars_present:
+            pillars_present.append(single_pillar)
+            if details:
                 pillar_details[single_pillar] = pattern
         
         # Check for nested pillar references
-        for pillar in self.REQUIRED_PILLARS:
-            pillar_lower = pillar.lower()
-            if pillar_lower in pattern or pillar in pattern:
-                if pillar not in pillars_present:
-                    pillars_present.append(pillar)
-                    pillar_details[pillar] = pattern.get(pillar_lower) or pattern.get(pillar)
+        for pillar, pillar_lower in self._PILLAR_KEYS:
+            if pillar in pillars_present:
+                continue
+            lower_value = get(pillar_lower, _MISSING)
+            value = get(pillar, _MISSING)
+            if lower_value is not _MISSING or value is not _MISSING:
+                pillars_present.append(pillar)
+                if details:
+                    pillar_details[pillar] = (
+                        (None if lower_value is _MISSING else lower_value)
+                        or (None if value is _MISSING else value)
+                    )
         
-        # Validate pillar presence
-        missing_pillars = [p for p in self.REQUIRED_PILLARS if p not in pillars_present]
+        # _make skips the keyword-handling __new__ (field order of _Markers)
+        return _Markers._make((
+            pillars_present,
+            pillar_details,
+            [p for p in self.REQUIRED_PILLARS if p not in pillars_present],
+            get("closed", False),
+            get("triadic_closure", False),
+            get("waltz_complete", False),
+            triad_complete,
+            get("sovereignty", False),
+            get("sovereignty_confirmed", False),
+            get("stable", False),
+            get("apex", _MISSING) is not _MISSING,
+            get("integrated", False)
+        ))
+    
+    @staticmethod
+    def _closure_confirmed(markers: _Markers) -> bool:
+        return bool(
+            markers.closed or 
+            markers.triadic_closure or 
+            markers.waltz_complete or 
+            markers.triad_complete
+        )
+    
+    @staticmethod
+    def _sovereignty_achieved(markers: _Markers) -> bool:
+        return bool(
+            markers.sovereignty or 
+            markers.sovereignty_confirmed or 
+            (markers.stable and markers.has_apex and markers.waltz_complete)
+        )
+    
+    @staticmethod
+    def _score(markers: _Markers, closure: bool, sovereign: bool) -> float:
+        """Overall score: mean of pillar, closure and sovereignty scores."""
+        if not markers.missing_pillars:
+            pillar_score = 1.0
+        else:
+            pillar_score = len(markers.pillars_present) / 3.0
+        return (pillar_score + (1.0 if closure else 0.0) + (1.0 if sovereign else 0.0)) / 3
+    
+    @staticmethod
+    def _status(overall_score: float) -> tuple:
+        """(status, message) for an overall score."""
+        if overall_score >= 1.0:
+            return "SOVEREIGN", "✓ Pattern is fully sovereign"
+        elif overall_score >= 0.75:
+            return "STABLE", "⚠ Pattern is stable but not fully sovereign"
+        elif overall_score >= 0.5:
+            return "EMERGING", "⚠ Pattern is emerging but incomplete"
+        else:
+            return "UNSTABLE", "✗ Pattern is unstable"
+    
+    def validate_pillar_structure(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate three-pillar structure.
+        
+        Checks that pattern engages all three pillars with correct modes.
+        
+        Args:
+            pattern: Pattern to validate
+            
+        Returns:
+            Validation result with pillar structure analysis
+        """
+        return self._pillar_result(self._scan(pattern))
+    
+    def _pillar_result(self, markers: _Markers) -> Dict[str, Any]:
+        """Pillar structure result from scanned markers."""
+        pillars_present = markers.pillars_present
+        missing_pillars = markers.missing_pillars
         
         if not missing_pillars:
             return {
                 "valid": True,
                 "message": "✓ All three pillars engaged",
                 "pillars_present": pillars_present,
-                "pillar_details": pillar_details,
+                "pillar_details": markers.pillar_details,
                 "missing_pillars": []
             }
         elif len(pillars_present) >= 2:
@@ -104,7 +209,7 @@ class IntegrationValidator:
                 "valid": False,
                 "message": f"⚠ {len(pillars_present)}/3 pillars present",
                 "pillars_present": pillars_present,
-                "pillar_details": pillar_details,
+                "pillar_details": markers.pillar_details,
                 "missing_pillars": missing_pillars
             }
         else:
@@ -112,7 +217,7 @@ class IntegrationValidator:
                 "valid": False,
                 "message": f"✗ Insufficient pillars ({len(pillars_present)}/3)",
                 "pillars_present": pillars_present,
-                "pillar_details": pillar_details,
+                "pillar_details": markers.pillar_details,
                 "missing_pillars": missing_pillars
             }
     
@@ -128,52 +233,30 @@ class IntegrationValidator:
         Returns:
             Validation result with closure analysis
         """
-        # Check closure markers
-        closed = pattern.get("closed", False)
-        triadic_closure = pattern.get("triadic_closure", False)
-        waltz_complete = pattern.get("waltz_complete", False)
-        
-        # Check for triad structure
-        has_triad = "triad" in pattern
-        triad_complete = False
-        if has_triad:
-            triad = pattern["triad"]
-            if isinstance(triad, dict):
-                triad_complete = len(triad) >= 3
-            elif isinstance(triad, (list, tuple)):
-                triad_complete = len(triad) >= 3
-        
-        # Determine closure status
-        closure_confirmed = (
-            closed or 
-            triadic_closure or 
-            waltz_complete or 
-            triad_complete
-        )
+        return self._triadic_result(self._scan(pattern, details=False))
+    
+    def _triadic_result(self, markers: _Markers) -> Dict[str, Any]:
+        """Triadic closure result from scanned markers."""
+        indicators = {
+            "closed_flag": markers.closed,
+            "triadic_closure_flag": markers.triadic_closure,
+            "waltz_complete": markers.waltz_complete,
+            "triad_structure": markers.triad_complete
+        }
         
-        if closure_confirmed:
+        if self._closure_confirmed(markers):
             return {
                 "valid": True,
                 "message": "✓ Triadic closure achieved",
                 "closed": True,
-                "indicators": {
-                    "closed_flag": closed,
-                    "triadic_closure_flag": triadic_closure,
-                    "waltz_complete": waltz_complete,
-                    "triad_structure": triad_complete
-                }
+                "indicators": indicators
             }
         else:
             return {
                 "valid": False,
                 "message": "✗ Triadic closure incomplete",
                 "closed": False,
-                "indicators": {
-                    "closed_flag": closed,
-                    "triadic_closure_flag": triadic_closure,
-                    "waltz_complete": waltz_complete,
-                    "triad_structure": triad_complete
-                }
+                "indicators": indicators
             }
     
     def validate_sovereignty(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
@@ -189,73 +272,47 @@ class IntegrationValidator:
         Returns:
             Validation result with sovereignty analysis
         """
-        # Check sovereignty markers
-        sovereignty = pattern.get("sovereignty", False)
-        sovereignty_confirmed = pattern.get("sovereignty_confirmed", False)
-        stable = pattern.get("stable", False)
-        
-        # Check for apex (sovereignty indicator)
-        has_apex = "apex" in pattern
-        
-        # Check integration completeness
-        integrated = pattern.get("integrated", False)
-        waltz_complete = pattern.get("waltz_complete", False)
-        
-        # Determine sovereignty status
-        sovereignty_achieved = (
-            sovereignty or 
-            sovereignty_confirmed or 
-            (stable and has_apex and waltz_complete)
-        )
+        return self._sovereignty_result(self._scan(pattern, details=False))
+    
+    def _sovereignty_result(self, markers: _Markers) -> Dict[str, Any]:
+        """Sovereignty result from scanned markers."""
+        indicators = {
+            "sovereignty_flag": markers.sovereignty,
+            "sovereignty_confirmed": markers.sovereignty_confirmed,
+            "stable": markers.stable,
+            "has_apex": markers.has_apex,
+            "integrated": markers.integrated,
+            "waltz_complete": markers.waltz_complete
+        }
         
-        if sovereignty_achieved:
+        if self._sovereignty_achieved(markers):
             return {
                 "valid": True,
                 "message": "✓ Sovereignty confirmed",
                 "sovereign": True,
-                "indicators": {
-                    "sovereignty_flag": sovereignty,
-                    "sovereignty_confirmed": sovereignty_confirmed,
-                    "stable": stable,
-                    "has_apex": has_apex,
-                    "integrated": integrated,
-                    "waltz_complete": waltz_complete
-                }
+                "indicators": indicators
             }
-        elif integrated or stable:
+        elif markers.integrated or markers.stable:
             return {
                 "valid": False,
                 "message": "⚠ Sovereignty emerging but not confirmed",
                 "sovereign": False,
-                "indicators": {
-                    "sovereignty_flag": sovereignty,
-                    "sovereignty_confirmed": sovereignty_confirmed,
-                    "stable": stable,
-                    "has_apex": has_apex,
-                    "integrated": integrated,
-                    "waltz_complete": waltz_complete
-                }
+                "indicators": indicators
             }
         else:
             return {
                 "valid": False,
                 "message": "✗ Sovereignty not achieved",
                 "sovereign": False,
-                "indicators": {
-                    "sovereignty_flag": sovereignty,
-                    "sovereignty_confirmed": sovereignty_confirmed,
-                    "stable": stable,
-                    "has_apex": has_apex,
-                    "integrated": integrated,
-                    "waltz_complete": waltz_complete
-                }
+                "indicators": indicators
             }
     
     def generate_report(self, pattern: Dict[str, Any]) -> ValidationReport:
         """
         Generate complete validation report.
         
-        Performs all validations and produces comprehensive report.
+        Performs all validations from a single scan of the pattern and
+        produces comprehensive report.
         
         Args:
             pattern: Pattern to validate
@@ -263,37 +320,15 @@ class IntegrationValidator:
         Returns:
             ValidationReport with complete analysis
         """
-        # Run all validations
-        pillar_result = self.validate_pillar_structure(pattern)
-        triadic_result = self.validate_triadic_closure(pattern)
-        sovereignty_result = self.validate_sovereignty(pattern)
-        
-        # Calculate overall score
-        scores = []
-        if pillar_result["valid"]:
-            scores.append(1.0)
-        else:
-            pillar_count = len(pillar_result.get("pillars_present", []))
-            scores.append(pillar_count / 3.0)
-        
-        scores.append(1.0 if triadic_result["valid"] else 0.0)
-        scores.append(1.0 if sovereignty_result["valid"] else 0.0)
+        markers = self._scan(pattern)
+        pillar_result = self._pillar_result(markers)
+        triadic_result = self._triadic_result(markers)
+        sovereignty_result = self._sovereignty_result(markers)
         
-        overall_score = sum(scores) / len(scores)
-        
-        # Determine status
-        if overall_score >= 1.0:
-            status = "SOVEREIGN"
-            message = "✓ Pattern is fully sovereign"
-        elif overall_score >= 0.75:
-            status = "STABLE"
-            message = "⚠ Pattern is stable but not fully sovereign"
-        elif overall_score >= 0.5:
-            status = "EMERGING"
-            message = "⚠ Pattern is emerging but incomplete"
-        else:
-            status = "UNSTABLE"
-            message = "✗ Pattern is unstable"
+        overall_score = self._score(
+            markers, triadic_result["valid"], sovereignty_result["valid"]
+        )
+        status, message = self._status(overall_score)
         
         # Generate recommendations
         recommendations = []
@@ -322,7 +357,10 @@ class IntegrationValidator:
         """
         Quick validation check.
         
-        Returns simplified validation result without full report.
+        Returns simplified validation result without full report: the
+        status, message and score of ``generate_report``, computed from
+        one scan without building sub-results, details, recommendations
+        or a ValidationReport.
         
         Args:
             pattern: Pattern to validate
@@ -330,9 +368,13 @@ class IntegrationValidator:
         Returns:
             Dict with status and message
         """
-        report = self.generate_report(pattern)
+        markers = self._scan(pattern, details=False)
+        overall_score = self._score(
+            markers, self._closure_confirmed(markers), self._sovereignty_achieved(markers)
+        )
+        status, message = self._status(overall_score)
         return {
-            "status": report.status,
-            "message": report.message,
-            "score": report.overall_score
+            "status": status,
+            "message": message,
+            "score": overall_score
         }